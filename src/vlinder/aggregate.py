@@ -0,0 +1,125 @@
+"""
+This file contains the Aggregate class that deals with decision criteria across scenarios. All criteria are calculated
+on a matrix of appreciations with scenarios as rows and decision makers options as columns, such that also thousands
+of (generated) scenarios can be aggregated at once.
+"""
+
+import numpy as np
+import pandas as pd
+
+
+class AggregationError(Exception):
+    """
+    This class deals with the error handling of the aggregation across scenarios.
+    """
+
+    def __init__(self, message):  # ignore warning about super-init | pylint: disable=W0231
+        self.message = message
+
+    def __str__(self):
+        return f"Aggregation Error: {self.message}"
+
+
+def expected_appreciation(matrix: np.ndarray, scenario_weights: np.ndarray) -> np.ndarray:
+    """
+    This function calculates the expected appreciation of each decision makers option, using the (normalized) scenario
+    weights as probabilities.
+    :param matrix: array of shape (scenarios, options) with appreciations
+    :param scenario_weights: array with the weight of each scenario
+    :return: array with the expected appreciation per option
+    """
+    scenario_weights = np.asarray(scenario_weights, dtype=float)
+    total_weight = scenario_weights.sum()
+    if not total_weight:
+        raise AggregationError("the sum of the scenario weights cannot be 0")
+    return scenario_weights @ np.asarray(matrix, dtype=float) / total_weight
+
+
+def worst_case(matrix: np.ndarray) -> np.ndarray:
+    """
+    This function determines the lowest appreciation of each decision makers option over all scenarios. The option with
+    the highest worst case is the maximin choice.
+    :param matrix: array of shape (scenarios, options) with appreciations
+    :return: array with the worst case appreciation per option
+    """
+    return np.asarray(matrix, dtype=float).min(axis=0)
+
+
+def maximum_regret(matrix: np.ndarray) -> np.ndarray:
+    """
+    This function determines the maximum regret of each decision makers option. The regret of an option in a scenario
+    is the difference with the best option in that scenario. The option with the lowest maximum regret is the minimax
+    regret choice.
+    :param matrix: array of shape (scenarios, options) with appreciations
+    :return: array with the maximum regret per option
+    """
+    matrix = np.asarray(matrix, dtype=float)
+    return (matrix.max(axis=1, keepdims=True) - matrix).max(axis=0)
+
+
+def hurwicz(matrix: np.ndarray, optimism: float = 0.5) -> np.ndarray:
+    """
+    This function calculates the Hurwicz criterion: a weighted average of the best and worst case appreciation.
+    :param matrix: array of shape (scenarios, options) with appreciations
+    :param optimism: weight of the best case, between 0 (maximin) and 1 (maximax)
+    :return: array with the Hurwicz value per option
+    """
+    if not 0 <= optimism <= 1:
+        raise AggregationError(f"optimism should be between 0 and 1, not {optimism}")
+    matrix = np.asarray(matrix, dtype=float)
+    return optimism * matrix.max(axis=0) + (1 - optimism) * matrix.min(axis=0)
+
+
+def rankings(matrix: np.ndarray) -> np.ndarray:
+    """
+    This function ranks the decision makers options within each scenario (1 = highest appreciation). Options with equal
+    appreciations share the best rank.
+    :param matrix: array of shape (scenarios, options) with appreciations
+    :return: array of shape (scenarios, options) with ranks
+    """
+    matrix = np.asarray(matrix, dtype=float)
+    # the rank equals 1 + the number of options with a strictly higher appreciation in the same scenario
+    return 1 + (matrix[:, np.newaxis, :] > matrix[:, :, np.newaxis]).sum(axis=2)
+
+
+class Aggregate:
+    """This class deals with the aggregation of appreciations across scenarios"""
+
+    def __init__(self, input_dict, output_dict):
+        self.input_dict = input_dict
+        self.output_dict = output_dict
+        self.available_criteria = {
+            "expected_appreciation": lambda matrix, _: expected_appreciation(
+                matrix, self.input_dict["scenario_weight"]
+            ),
+            "worst_case": lambda matrix, _: worst_case(matrix),
+            "maximum_regret": lambda matrix, _: maximum_regret(matrix),
+            "hurwicz": hurwicz,
+            "mean_rank": lambda matrix, _: rankings(matrix).mean(axis=0),
+        }
+
+    def get_appreciation_matrix(self, key: str = "decision_makers_option_appreciation") -> np.ndarray:
+        """
+        This function collects the appreciations of all decision makers options in all scenarios.
+        :param key: the key of the output_dict that contains the appreciation of a decision makers option
+        :return: array of shape (scenarios, options)
+        """
+        return np.array(
+            [
+                [self.output_dict[scenario][dmo][key] for dmo in self.input_dict["decision_makers_options"]]
+                for scenario in self.input_dict["scenarios"]
+            ],
+            dtype=float,
+        )
+
+    def aggregate(self, optimism: float = 0.5) -> pd.DataFrame:
+        """
+        This function calculates all decision criteria across scenarios for all decision makers options.
+        :param optimism: weight of the best case in the Hurwicz criterion
+        :return: a dataframe with decision makers options as rows and decision criteria as columns
+        """
+        matrix = self.get_appreciation_matrix()
+        return pd.DataFrame(
+            {criterion: function(matrix, optimism) for criterion, function in self.available_criteria.items()},
+            index=self.input_dict["decision_makers_options"],
+        )
@@ -2,10 +2,11 @@
 This file contains the Appreciate class that deals with the calculation of appreciations.
 """
 
-import math
 import pandas as pd
 import numpy as np
 from vlinder.utils import get_values_from_target
+from vlinder.appreciation_curves import get_curve, appreciate_values
+from vlinder.aggregate import Aggregate
 
 
 class Appreciate:
@@ -14,10 +15,11 @@ class Appreciate:
     def __init__(self, input_dict, output_dict):
         self.input_dict = input_dict
         self.output_dict = output_dict
-        self.start_and_end_points = self._get_start_and_end_points()
+        self.start_and_end_points = self.get_start_and_end_points()
+        self.curves = [self._get_curve(index) for index, _ in enumerate(self.input_dict["key_outputs"])]
 
     # pylint: disable=too-many-locals
-    def _get_start_and_end_points(self) -> dict:
+    def get_start_and_end_points(self) -> dict:
         """
         This function obtains the minimum and maximum values of the calculated key_output values, over ALL scenarios
         and decision makers options.
@@ -55,61 +57,81 @@ class Appreciate:
 
         return boundaries
 
+    def _get_curve(self, index: int) -> tuple:
+        """
+        This function selects the appreciation curve of a key output. If the optional 'curve' column of the
+        key_outputs sheet is empty, the 'linear' indicator selects either a linear or a (quarter-)sine curve.
+        :param index: index of the key output in the input_dict
+        :return: a tuple (kernel, parameters) of the appreciation curve
+        """
+        curve_names = self.input_dict.get("key_output_curve")
+        if curve_names is None or not isinstance(curve_names[index], str):
+            return get_curve("linear" if self.input_dict["key_output_linear"][index] else "sine")
+
+        curve_parameters = self.input_dict.get("key_output_curve_parameters")
+        return get_curve(curve_names[index], None if curve_parameters is None else curve_parameters[index])
+
     def _appreciate_single_key_output(self, value: float, args: dict) -> float:
         """
         This function appreciates a single key output, given the value, arguments and start & end point.
         :param value: value of key output
         :param args: dictionary containing whether the key output should be appreciated linear or smaller the better.
+        Optionally, 'key_output_curve' (and 'key_output_curve_parameters') select another appreciation curve.
         :return: the appreciated value of the key output
         """
-        start_and_end = self.start_and_end_points[args["key_output"]]
-        stb_ind = args["key_output_smaller_the_better"]
+        if "key_output_curve" in args:
+            curve = get_curve(args["key_output_curve"], args.get("key_output_curve_parameters"))
+        else:
+            curve = get_curve("linear" if args["key_output_linear"] else "sine")
 
-        # Option 0A: values lie outside the boundaries. Return maximum or minimum based on STB
-        if value <= start_and_end[0] or value >= start_and_end[1]:
-            return stb_ind * (value <= start_and_end[0]) * 100 + (1 - stb_ind) * (value >= start_and_end[1]) * 100
+        appreciation = appreciate_values(
+            value, self.start_and_end_points[args["key_output"]], args["key_output_smaller_the_better"], curve
+        )
+        return float(appreciation)
 
-        # Option 0B: start and end value are the same --> indifferent so return 0
-        if start_and_end[1] - start_and_end[0] < 1e-6:
-            return 0
+    def appreciate_key_outputs(self, key_output_values: np.ndarray) -> np.ndarray:
+        """
+        This function appreciates a matrix of key output values in a vectorized manner, one column at a time.
+        :param key_output_values: array of shape (n, number of key outputs), ordered as input_dict["key_outputs"]
+        :return: array of shape (n, number of key outputs) containing the appreciations
+        """
+        key_output_values = np.asarray(key_output_values, dtype=float).reshape(-1, len(self.input_dict["key_outputs"]))
+        appreciations = np.empty(key_output_values.shape)
+        for index, key_output in enumerate(self.input_dict["key_outputs"]):
+            appreciations[:, index] = appreciate_values(
+                key_output_values[:, index],
+                self.start_and_end_points[key_output],
+                self.input_dict["key_output_smaller_the_better"][index],
+                self.curves[index],
+            )
+        return appreciations
 
-        # Option 1: Linear appreciation
-        #   - if STB = 1: (end - val) / (end - start) * 100
-        #   - if STB = 0: (val - start) / (end - start) * 100
-        if args["key_output_linear"]:
-            return [-1, 1][stb_ind] * (start_and_end[stb_ind] - value) / (start_and_end[1] - start_and_end[0]) * 100
-        # Option 2: Non-linear appreciation
-        #   - if STB = 1: (-sin(0.5 * pi * (val-start) / (end - start) + 1) * 100
-        #   - if STB = 0: sin(0.5 * pi * (val - start) / (end - start) + 0) * 100
-        core_part = (value - start_and_end[0]) / (start_and_end[1] - start_and_end[0])
-        return ([1, -1][stb_ind] * math.sin(0.5 * math.pi * core_part) + stb_ind) * 100
+    def _store_appreciations(self, value_dict_in: dict, appreciations: np.ndarray, weights: np.ndarray) -> None:
+        """
+        This function stores the (weighted) appreciations of a single decision makers option in its dictionary.
+        :param value_dict_in: dictionary corresponding with given scenario and dmo
+        :param appreciations: array with the appreciations of all key outputs
+        :param weights: array with the weights of all key outputs
+        :return: None as results are stored within the output_dict
+        """
+        key_outputs = self.input_dict["key_outputs"]
+        value_dict_in["appreciations"] = {key: float(appreciations[index]) for index, key in enumerate(key_outputs)}
+        weighted_appreciations = self._apply_weights(value_dict_in["appreciations"], weights)
+        value_dict_in["weighted_appreciations"] = {
+            key: weighted_appreciations[index] for index, key in enumerate(key_outputs)
+        }
+        value_dict_in["decision_makers_option_appreciation"] = sum(weighted_appreciations)
 
     def appreciate_single_decision_maker_option(self, value_dict_in: dict) -> None:
         """
         This function calculates the appreciation values, both weighted as well as unweighted for the key outputs for a
         given scenario and decision makers option. Results are stored within the output_dict.
-        :param scenario: given scenario
-        :param decision_maker_option: given dmo
         :param value_dict_in: dictionary corresponding with given scenario and dmo
         :return: None as results are stored within the output_dict
         """
-        value_dict_in["appreciations"] = {}
-        for index, key_output in enumerate(self.input_dict["key_outputs"]):
-            key_output_value = value_dict_in["key_outputs"][key_output]
-            appreciation_args = {
-                "key_output": key_output,
-                "key_output_smaller_the_better": self.input_dict["key_output_smaller_the_better"][index],
-                "key_output_linear": self.input_dict["key_output_linear"][index],
-            }
-            appreciation = self._appreciate_single_key_output(key_output_value, appreciation_args)
-
-            value_dict_in["appreciations"][key_output] = appreciation
-
-        weighted_appreciations = self._apply_weights(value_dict_in["appreciations"])
-        value_dict_in["weighted_appreciations"] = {
-            key: weighted_appreciations[index] for index, key in enumerate(self.input_dict["key_outputs"])
-        }
-        value_dict_in["decision_makers_option_appreciation"] = sum(weighted_appreciations)
+        key_output_values = [[value_dict_in["key_outputs"][key] for key in self.input_dict["key_outputs"]]]
+        appreciations = self.appreciate_key_outputs(key_output_values)
+        self._store_appreciations(value_dict_in, appreciations[0], np.array(self.calculate_weights()))
 
     def appreciate_single_scenario(self, value_dict_in: dict) -> None:
         """
@@ -118,8 +140,15 @@ class Appreciate:
         :param value_dict_in: dictionary corresponding with given scenario
         :return: None as results are stored within the output_dict
         """
-        for _, value_dict_out in value_dict_in.items():
-            self.appreciate_single_decision_maker_option(value_dict_out)
+        options = [option for option, value in value_dict_in.items() if isinstance(value, dict)]
+        key_output_values = [
+            [value_dict_in[option]["key_outputs"][key] for key in self.input_dict["key_outputs"]] for option in options
+        ]
+        # all decision makers options of a scenario are appreciated at once
+        appreciations = self.appreciate_key_outputs(key_output_values)
+        weights = np.array(self.calculate_weights())
+        for index, option in enumerate(options):
+            self._store_appreciations(value_dict_in[option], appreciations[index], weights)
 
     def appreciate_all_scenarios(self) -> None:
         """
@@ -149,7 +178,7 @@ class Appreciate:
             return 0
         return (weights["key_output"] / weights["sum_within_theme"]) * (weights["theme"] / weights["sum_theme"])
 
-    def _calculate_weights(self) -> list:
+    def calculate_weights(self) -> list:
         """
         This function creates a weights list for all key outputs.
         :return: list with weights for all key outputs
@@ -179,16 +208,18 @@ class Appreciate:
 
         return adjusted_weights
 
-    def _apply_weights(self, appreciation_dict: dict) -> np.array:
+    def _apply_weights(self, appreciation_dict: dict, weights: np.ndarray = None) -> np.array:
         """
         This function applies the weights to the appreciations
         :param appreciation_dict: dictionary contain the unweighted appreciations
+        :param weights: the weights of all key outputs, calculated when not given
         :return: a numpy array with the weighted appreciations
         """
         # ensure appreciation vector has same order as weight & key_outputs vector
         appreciations = [appreciation_dict[key_output] for key_output in self.input_dict["key_outputs"]]
         # calculate the (adjusted) weight for given key_output & theme weight
-        weights = self._calculate_weights()
+        if weights is None:
+            weights = self.calculate_weights()
         weighted_appreciations = np.array(appreciations) * np.array(weights)
 
         return weighted_appreciations
@@ -198,12 +229,12 @@ class Appreciate:
         This function applies scenario weights to the decision makers' option appreciations
         :return: None as results are stored within the output_dict
         """
-        total_weight = sum(self.input_dict["scenario_weight"])
+        scenario_weights = np.asarray(self.input_dict["scenario_weight"], dtype=float)
+        matrix = Aggregate(self.input_dict, self.output_dict).get_appreciation_matrix()
+        scenario_appreciations = matrix * scenario_weights[:, np.newaxis] / scenario_weights.sum()
 
-        for scenario, weight in zip(self.input_dict["scenarios"], self.input_dict["scenario_weight"]):
-            for option in self.input_dict["decision_makers_options"]:
-                appreciation = self.output_dict[scenario][option]["decision_makers_option_appreciation"]
-                weighted_appreciation = appreciation * weight / total_weight
+        for scenario, row in zip(self.input_dict["scenarios"], scenario_appreciations):
+            for option, weighted_appreciation in zip(self.input_dict["decision_makers_options"], row):
                 self.output_dict[scenario][option]["scenario_appreciations"] = weighted_appreciation
 
     def _calculate_best_dmo(self) -> None:
@@ -211,12 +242,9 @@ class Appreciate:
         This function calculates the sum of all weighted appreciations per DMO and return the highest sum
         :return: None as results are stored within the output_dict
         """
-        for scenario in self.input_dict["scenarios"]:
-            max_sum = 0
-            best_option = ""
-            for dmo in self.output_dict[scenario].keys():
-                sum_dmo = sum(self.output_dict[scenario][dmo]["weighted_appreciations"].values())
-                if sum_dmo > max_sum:
-                    max_sum = sum_dmo
-                    best_option = dmo
-            self.output_dict[scenario]["highest_weighted_dmo"] = best_option
+        options = self.input_dict["decision_makers_options"]
+        matrix = Aggregate(self.input_dict, self.output_dict).get_appreciation_matrix()
+        # argmax returns the first option in case of ties, only a positive sum qualifies as best option
+        best_indices = matrix.argmax(axis=1)
+        for scenario, row, index in zip(self.input_dict["scenarios"], matrix, best_indices):
+            self.output_dict[scenario]["highest_weighted_dmo"] = str(options[index]) if row[index] > 0 else ""
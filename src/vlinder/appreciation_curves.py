@@ -0,0 +1,217 @@
+"""
+This file contains the library of appreciation curves. Each curve is a vectorized kernel that maps the relative
+position of key output values between their start and end point to a share of the maximum appreciation.
+"""
+
+import numpy as np
+
+
+class CurveError(Exception):
+    """
+    This class deals with the error handling of the appreciation curves.
+    """
+
+    def __init__(self, message):  # ignore warning about super-init | pylint: disable=W0231
+        self.message = message
+
+    def __str__(self):
+        return f"Curve Error: {self.message}"
+
+
+def _linear(core: np.ndarray, _parameters: np.ndarray) -> np.ndarray:
+    """
+    Linear appreciation: f(x) = x
+    :param core: relative position of the values between start (0) and end point (1)
+    :return: share of the maximum appreciation
+    """
+    return core
+
+
+def _sine(core: np.ndarray, _parameters: np.ndarray) -> np.ndarray:
+    """
+    Quarter-sine appreciation: f(x) = sin(0.5 * pi * x)
+    :param core: relative position of the values between start (0) and end point (1)
+    :return: share of the maximum appreciation
+    """
+    return np.sin(0.5 * np.pi * core)
+
+
+def _logistic(core: np.ndarray, parameters: np.ndarray) -> np.ndarray:
+    """
+    Logistic (s-shaped) appreciation, rescaled such that f(0) = 0 and f(1) = 1.
+    :param core: relative position of the values between start (0) and end point (1)
+    :param parameters: [steepness, midpoint]
+    :return: share of the maximum appreciation
+    """
+    steepness, midpoint = parameters
+
+    def sigmoid(x):
+        return 1 / (1 + np.exp(-steepness * (x - midpoint)))
+
+    return (sigmoid(core) - sigmoid(0)) / (sigmoid(1) - sigmoid(0))
+
+
+def _exponential(core: np.ndarray, parameters: np.ndarray) -> np.ndarray:
+    """
+    Exponential appreciation: f(x) = (exp(r * x) - 1) / (exp(r) - 1). A positive rate r gives a convex curve, a
+    negative rate a concave curve and a rate of zero a linear curve.
+    :param core: relative position of the values between start (0) and end point (1)
+    :param parameters: [rate]
+    :return: share of the maximum appreciation
+    """
+    rate = parameters[0]
+    if abs(rate) < 1e-9:
+        return core
+    return np.expm1(rate * core) / np.expm1(rate)
+
+
+def _piecewise_linear(core: np.ndarray, parameters: np.ndarray) -> np.ndarray:
+    """
+    Piecewise-linear appreciation that interpolates between the provided breakpoints.
+    :param core: relative position of the values between start (0) and end point (1)
+    :param parameters: breakpoints of type [[x1, y1], [x2, y2], ..] with x in [0, 1] and y in [0, 100]
+    :return: share of the maximum appreciation
+    """
+    return np.interp(core, parameters[:, 0], parameters[:, 1] / 100)
+
+
+def _step(core: np.ndarray, parameters: np.ndarray) -> np.ndarray:
+    """
+    Step appreciation: each threshold that is passed adds an equal share of the maximum appreciation.
+    :param core: relative position of the values between start (0) and end point (1)
+    :param parameters: [threshold 1, threshold 2, ..] with thresholds in [0, 1]
+    :return: share of the maximum appreciation
+    """
+    return np.searchsorted(parameters, core, side="right") / len(parameters)
+
+
+def _lookup(core: np.ndarray, parameters: np.ndarray) -> np.ndarray:
+    """
+    Lookup table appreciation: a value gets the appreciation of the last entry it has passed.
+    :param core: relative position of the values between start (0) and end point (1)
+    :param parameters: table of type [[x1, y1], [x2, y2], ..] with x in [0, 1] and y in [0, 100]
+    :return: share of the maximum appreciation
+    """
+    positions = np.searchsorted(parameters[:, 0], core, side="right") - 1
+    values = np.concatenate(([0.0], parameters[:, 1] / 100))
+    return values[positions + 1]
+
+
+# registry of all available curves: {name: (kernel, default parameters, parameters are breakpoints)}
+APPRECIATION_CURVES = {
+    "linear": (_linear, np.array([]), False),
+    "sine": (_sine, np.array([]), False),
+    "logistic": (_logistic, np.array([10.0, 0.5]), False),
+    "exponential": (_exponential, np.array([1.0]), False),
+    "piecewise_linear": (_piecewise_linear, None, True),
+    "step": (_step, None, False),
+    "lookup": (_lookup, None, True),
+}
+
+
+def parse_curve_parameters(text) -> np.ndarray or None:
+    """
+    This function converts the textual curve parameters of the key_outputs sheet into an array. Values are separated
+    by a comma. Breakpoints are provided as 'x:y' pairs, e.g. '0.2:10, 0.5:80'.
+    :param text: textual representation of the parameters (or NaN / None if no parameters are provided)
+    :return: None if no parameters are provided, a 1D array for values or a 2D array for breakpoints
+    """
+    if text is None or (not isinstance(text, str) and np.isnan(text)):
+        return None
+    if not isinstance(text, str):
+        return np.array([float(text)])
+
+    entries = [entry.strip() for entry in text.split(",") if entry.strip()]
+    try:
+        if all(":" in entry for entry in entries):
+            return np.array([[float(value) for value in entry.split(":")] for entry in entries])
+        return np.array([float(entry) for entry in entries])
+    except ValueError as error:
+        raise CurveError(f"cannot read curve parameters '{text}'") from error
+
+
+def _validate_curve_parameters(name: str, parameters: np.ndarray, breakpoints: bool) -> None:
+    """
+    This function validates the parameters of a curve. All curves need to be non-decreasing, the direction of the
+    appreciation is determined by 'smaller_the_better'.
+    :param name: name of the curve
+    :param parameters: array of parameters
+    :param breakpoints: indicator whether the parameters should be breakpoints
+    """
+    if breakpoints:
+        if parameters.ndim != 2 or parameters.shape[1] != 2 or len(parameters) == 0:
+            raise CurveError(f"'{name}' requires breakpoints of type 'x:y'")
+        if np.any(np.diff(parameters[:, 0]) <= 0) or np.any(np.diff(parameters[:, 1]) < 0):
+            raise CurveError(f"breakpoints of '{name}' should be increasing")
+        if np.any((parameters[:, 0] < 0) | (parameters[:, 0] > 1)) or np.any(
+            (parameters[:, 1] < 0) | (parameters[:, 1] > 100)
+        ):
+            raise CurveError(f"breakpoints of '{name}' should lie within [0, 1] x [0, 100]")
+        return
+
+    if parameters.ndim != 1:
+        raise CurveError(f"'{name}' does not accept breakpoints")
+    if name == "logistic" and (len(parameters) != 2 or parameters[0] <= 0):
+        raise CurveError("'logistic' requires a positive steepness and a midpoint")
+    if name == "exponential" and len(parameters) != 1:
+        raise CurveError("'exponential' requires a single rate")
+    if name == "step" and (len(parameters) == 0 or np.any(np.diff(parameters) <= 0)):
+        raise CurveError("'step' requires increasing thresholds")
+
+
+def get_curve(name: str, parameters=None) -> tuple:
+    """
+    This function looks up a curve in the registry and prepares its parameters.
+    :param name: name of the curve
+    :param parameters: textual or already parsed parameters (optional if the curve has default parameters)
+    :return: a tuple (kernel, parameters) that can be passed to appreciate_values()
+    """
+    if name not in APPRECIATION_CURVES:
+        raise CurveError(f"curve '{name}' not available. Choose from {list(APPRECIATION_CURVES)}")
+    kernel, default_parameters, breakpoints = APPRECIATION_CURVES[name]
+
+    if parameters is None or isinstance(parameters, (str, float, int)):
+        parameters = parse_curve_parameters(parameters)
+    if parameters is None:
+        if default_parameters is None:
+            raise CurveError(f"'{name}' requires curve parameters")
+        parameters = default_parameters
+    parameters = np.asarray(parameters, dtype=float)
+    _validate_curve_parameters(name, parameters, breakpoints)
+
+    # breakpoints always run from the start point (0, 0) to the end point (1, 100)
+    if name == "piecewise_linear":
+        if parameters[0, 0] > 0:
+            parameters = np.vstack(([0.0, 0.0], parameters))
+        if parameters[-1, 0] < 1:
+            parameters = np.vstack((parameters, [1.0, 100.0]))
+    return kernel, parameters
+
+
+def appreciate_values(values, start_and_end: list, smaller_the_better: int, curve: tuple) -> np.ndarray:
+    """
+    This function appreciates an array of key output values in a single vectorized pass.
+    - values below the start point or above the end point get the minimum or maximum appreciation (based on STB)
+    - if start and end point are the same, all other values get an appreciation of 0 (indifferent)
+    - else the curve determines the appreciation. If STB = 1 the curve is mirrored: 100 - curve.
+    :param values: (array of) key output values
+    :param start_and_end: [start, end] of the key output
+    :param smaller_the_better: indicator whether smaller values should get a higher appreciation
+    :param curve: a tuple (kernel, parameters) as returned by get_curve()
+    :return: array of appreciations in [0, 100]
+    """
+    kernel, parameters = curve
+    values = np.asarray(values, dtype=float)
+    start, end = start_and_end
+    below, above = values <= start, values >= end
+
+    if end - start < 1e-6:
+        appreciations = np.zeros(values.shape)
+    else:
+        core = np.clip((values - start) / (end - start), 0, 1)
+        shaped = kernel(core, parameters)
+        appreciations = (1 - shaped) * 100 if smaller_the_better else shaped * 100
+
+    # values outside the boundaries: return maximum or minimum based on STB
+    outside = smaller_the_better * below * 100 + (1 - smaller_the_better) * above * 100
+    return np.where(below | above, outside, appreciations)
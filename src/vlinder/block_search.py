@@ -0,0 +1,71 @@
+"""
+This file contains the search over blocks of combinations of internal variable inputs, and over contiguous ranges of a
+lattice of combinations in separate processes.
+"""
+
+import numpy as np
+from vlinder.progress import Progress
+from vlinder.scorer import CandidateScorer
+
+
+def search_blocks(scorer, blocks, progress=None):
+    """
+    This function scores blocks of combinations and keeps track of the best one (the first one in case of ties).
+    :param scorer: a CandidateScorer
+    :param blocks: iterable of tuples (index of the first combination in the block, array of combinations)
+    :param progress: an (optional) Progress, the search stops after the block in which its budget is exhausted
+    :return: a tuple (best appreciated value, index of the best combination, best combination)
+    """
+    best_value, best_index, best_combination = -np.inf, -1, None
+    for start, block in blocks:
+        if progress is not None and progress.max_evaluations is not None:
+            block = block[: progress.max_evaluations - progress.evaluations]
+        appreciated_values = scorer.score(block)
+        block_index = appreciated_values.argmax()
+
+        if appreciated_values[block_index] > best_value:
+            best_value = float(appreciated_values[block_index])
+            best_index = start + int(block_index)
+            best_combination = block[block_index].copy()
+        if progress is not None and progress.update(len(block), best_value):
+            break
+    return best_value, best_index, best_combination
+
+
+# pylint: disable=too-many-arguments,too-many-positional-arguments
+def search_lattice_shard(
+    input_dict, output_dict, scenario, objective, constraints, lattice, start, stop, block_size, budget=(None, None)
+):
+    """
+    This function searches a contiguous range of a lattice. It runs in a separate process on a copy of the case, so
+    the scorer is created within the process. The search stops early when the budget, a tuple (seconds, evaluations),
+    is exhausted.
+    :return: a tuple (best appreciated value, index of the best combination, best combination, number of evaluations)
+    """
+    scorer = CandidateScorer(input_dict, output_dict, scenario, objective, constraints)
+    progress = Progress(*budget)
+    return *search_blocks(scorer, lattice.chunks(block_size, start, stop), progress), progress.evaluations
+
+
+def subtract_ranges(ranges, covered):
+    """
+    This function removes the covered ranges from a list of ranges of indices.
+    :param ranges: list of [start, stop] ranges
+    :param covered: list of [start, stop] ranges that have been searched
+    :return: sorted list of the remaining [start, stop] ranges
+    """
+    remaining = []
+    for start, stop in ranges:
+        pieces = [(start, stop)]
+        for covered_start, covered_stop in covered:
+            pieces = [
+                piece
+                for piece_start, piece_stop in pieces
+                for piece in (
+                    (piece_start, min(piece_stop, covered_start)),
+                    (max(piece_start, covered_stop), piece_stop),
+                )
+                if piece[0] < piece[1]
+            ]
+        remaining.extend([int(piece_start), int(piece_stop)] for piece_start, piece_stop in pieces)
+    return sorted(remaining)
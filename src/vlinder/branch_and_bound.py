@@ -0,0 +1,165 @@
+"""
+This file contains the branch-and-bound search over distributions of a budget, in which each internal variable input
+takes one of its allowed values. Partial distributions are pruned based on the feasibility of the remaining budget and
+on upper bounds of the appreciation.
+"""
+
+import math
+from fractions import Fraction
+import numpy as np
+
+
+def get_positions(domains, budget, max_operations=10**8):
+    """
+    This function expresses the budget and the values of the domains in a common unit: the largest value of which the
+    budget and all values of the domains are multiples.
+    :param domains: list with an array of the allowed values of each internal input
+    :param budget: the total of each distribution
+    :param max_operations: limit on the number of totals times the number of values of all domains
+    :return: a tuple (unit, number of totals, list with an integer array of the positions of the values of each
+    domain), where position n stands for n * unit. None if there is no common unit or the totals exceed
+    max_operations.
+    """
+    # the greatest common divisor of the budget, the first value and the first step of each domain
+    fractions = [Fraction(float(budget)).limit_denominator(10**6)]
+    for domain in domains:
+        fractions.extend(Fraction(float(value)).limit_denominator(10**6) for value in np.diff(domain[:2], prepend=0))
+    denominator = math.lcm(*(fraction.denominator for fraction in fractions))
+    numerator = math.gcd(*(int(fraction * denominator) for fraction in fractions))
+    if numerator == 0:
+        return None
+    unit = numerator / denominator
+
+    size = round(budget / unit) + 1
+    positions = [np.rint(domain / unit) for domain in domains]
+    if size * sum(len(position) for position in positions) > max_operations or any(
+        not np.allclose(position * unit, domain) for position, domain in zip(positions, domains)
+    ):
+        return None
+    return unit, size, [position.astype(int) for position in positions]
+
+
+def reachable_totals(domains, budget, max_operations=10**8):
+    """
+    This function determines which totals can be distributed over the internal inputs from each index onwards, such
+    that each internal input takes one of the values of its domain. All totals are expressed in a common unit, see
+    get_positions().
+    :param domains: list with an array of the allowed values of each internal input
+    :param budget: the total of each distribution
+    :param max_operations: limit on the size of the calculation
+    :return: a tuple (unit, list of boolean arrays), where element n of array i indicates whether n * unit can be
+    distributed over the internal inputs from index i onwards. None if there is no common unit or the calculation
+    exceeds max_operations.
+    """
+    result = get_positions(domains, budget, max_operations)
+    if result is None:
+        return None
+    unit, size, positions = result
+
+    totals = [np.zeros(size, dtype=bool) for _ in range(len(domains) + 1)]
+    totals[-1][0] = True
+    for index in range(len(domains) - 1, -1, -1):
+        for shift in positions[index][positions[index] < size]:
+            stop = size - shift
+            totals[index][shift:] |= totals[index + 1][:stop]
+    return unit, totals
+
+
+# pylint: disable=too-many-locals,too-many-statements
+# pylint: disable=too-many-arguments,too-many-positional-arguments
+def branch_and_bound(scorer, domains, budget, incumbent, block_size=10000, progress=None):
+    """
+    This function performs a depth-first branch-and-bound search over all distributions of the budget in which each
+    internal input takes one of the values of its domain. A branch assigns values to the first internal inputs, the
+    last internal input receives the remainder of the budget. Blocks of branches are extended with all values of the
+    next internal input at once:
+    - branches of which the remainder cannot be distributed over the domains of the other internal inputs are
+    infeasible and removed, see reachable_totals().
+    - each branch is bounded by the box of all values that the other internal inputs can still take. Branches of which
+    the upper bound does not exceed the best appreciation found so far are pruned.
+    The branches with the highest upper bound are explored first, such that good distributions are found early.
+    :param scorer: a CandidateScorer, or any object with the methods score() and upper_bound()
+    :param domains: list with an array of the allowed values (in increasing order) of each internal input
+    :param budget: the total of each distribution
+    :param incumbent: a tuple (appreciated value, distribution) of the best known distribution, e.g. (-inf, None)
+    :param block_size: the maximum number of branches that is bounded at once
+    :param progress: an (optional) Progress, the search stops when its budget is exhausted
+    :return: a tuple (best appreciated value, best distribution, number of evaluations including the upper bounds)
+    """
+    best_value, best_point = incumbent
+    if any(len(domain) == 0 for domain in domains):
+        return best_value, best_point, 0
+
+    tolerance = 1e-9 * max(abs(budget), 1)
+    minima = np.array([domain[0] for domain in domains])
+    maxima = np.array([domain[-1] for domain in domains])
+    # the lowest and highest total that can be distributed over the internal inputs from each index onwards
+    suffix_minima = np.append(np.cumsum(minima[::-1])[::-1], 0)
+    suffix_maxima = np.append(np.cumsum(maxima[::-1])[::-1], 0)
+    reachable = reachable_totals(domains, budget)
+
+    def is_feasible(remainders, index):
+        feasible = (remainders >= suffix_minima[index] - tolerance) & (remainders <= suffix_maxima[index] + tolerance)
+        if reachable is not None:
+            unit, totals = reachable
+            positions = np.clip(np.rint(remainders / unit), 0, len(totals[index]) - 1)
+            feasible &= (np.abs(positions * unit - remainders) <= tolerance) & totals[index][positions.astype(int)]
+        return feasible
+
+    evaluations = 0
+    stack = [(np.empty((1, 0)), np.array([np.inf]))]
+    while stack:
+        branches, bounds = stack.pop()
+        branches, bounds = branches[bounds > best_value], bounds[bounds > best_value]
+        depth = branches.shape[1]
+        remainders = budget - branches.sum(axis=1)
+
+        if depth == len(domains) - 1:
+            # the remainder is assigned to the last internal input, if it is one of its values
+            positions = np.minimum(np.searchsorted(domains[-1], remainders - tolerance), len(domains[-1]) - 1)
+            valid = np.abs(domains[-1][positions] - remainders) <= tolerance
+            if not valid.any():
+                continue
+            candidates = np.hstack([branches[valid], remainders[valid, np.newaxis]])
+            values = scorer.score(candidates)
+            evaluations += len(candidates)
+            if values.max() > best_value:
+                best_value, best_point = float(values.max()), candidates[values.argmax()].copy()
+            if progress is not None and progress.update(len(candidates), best_value):
+                break
+            continue
+
+        # split large blocks, the first branches (with the highest upper bounds) are explored first
+        values = domains[depth]
+        rows = max(block_size // len(values), 1)
+        if len(branches) > rows:
+            for start in reversed(range(0, len(branches), rows)):
+                stop = start + rows
+                stack.append((branches[start:stop], bounds[start:stop]))
+            continue
+
+        branches = np.hstack([np.repeat(branches, len(values), axis=0), np.tile(values, len(branches))[:, np.newaxis]])
+        remainders = np.repeat(remainders, len(values)) - branches[:, -1]
+        feasible = is_feasible(remainders, depth + 1)
+        branches, remainders = branches[feasible], remainders[feasible]
+        if branches.size == 0:
+            continue
+        if depth + 1 == len(domains) - 1:
+            stack.append((branches, np.full(len(branches), np.inf)))
+            continue
+
+        # each other internal input takes at least the remainder minus the maximum of the others, and at most the
+        # remainder minus the minimum of the others
+        assigned = depth + 1
+        others_minima, others_maxima = suffix_minima[assigned] - minima, suffix_maxima[assigned] - maxima
+        lower = np.maximum(minima, remainders[:, np.newaxis] - others_maxima)
+        upper = np.minimum(maxima, remainders[:, np.newaxis] - others_minima)
+        lower[:, :assigned] = upper[:, :assigned] = branches
+        bounds = scorer.upper_bound(lower, upper)
+        evaluations += len(branches)
+        if progress is not None and progress.update(len(branches), best_value):
+            break
+        order = np.argsort(-bounds, kind="stable")
+        order = order[bounds[order] > best_value]
+        stack.append((branches[order], bounds[order]))
+    return best_value, best_point, evaluations
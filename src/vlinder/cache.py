@@ -0,0 +1,255 @@
+"""
+This file contains the EvaluationCache class, which remembers the key outputs and appreciation of distributions of the
+internal variable inputs that have been evaluated before, such that repeated optimizations of the same case do not
+evaluate them again.
+"""
+
+import os
+import numpy as np
+
+
+class CacheError(Exception):
+    """
+    This class deals with the error handling of the evaluation cache.
+    """
+
+    def __init__(self, message):  # ignore warning about super-init | pylint: disable=W0231
+        self.message = message
+
+    def __str__(self):
+        return f"Cache Error: {self.message}"
+
+
+class CacheTable:
+    """
+    The CacheTable class holds the entries of a single case key in arrays: the rounded candidates, their appreciation,
+    their key output values and the moment they were last used (-1 for a free slot). A dictionary maps the bytes of
+    each rounded candidate to its slot, such that a block of candidates is looked up with one dictionary access per
+    candidate and all other work is done on whole arrays.
+    """
+
+    def __init__(self, num_inputs, key_output_shape):
+        self.index = {}
+        self.rows = np.empty((0, num_inputs))
+        self.values = np.empty(0)
+        self.key_outputs = np.empty((0, *key_output_shape))
+        self.used = np.empty(0, dtype=np.int64)
+
+    def __len__(self):
+        return len(self.index)
+
+    @staticmethod
+    def get_keys(rows):
+        """
+        This function returns the bytes of each (rounded) row as a single value of an array, the keys of the index.
+        """
+        rows = np.ascontiguousarray(rows)
+        return rows.view(np.dtype((np.void, rows.dtype.itemsize * rows.shape[1]))).reshape(len(rows))
+
+    def find(self, rows):
+        """
+        This function returns the slot of each row, or -1 if the row is not in the table.
+        """
+        return np.array([self.index.get(key, -1) for key in self.get_keys(rows).tolist()], dtype=np.int64)
+
+    def add(self, rows, values, key_outputs):
+        """
+        This function adds rows that are not in the table to free slots, which are created by doubling the arrays if
+        there are not enough of them. Rows that occur more than once are added once.
+        :return: array with the slot of each row
+        """
+        keys, first, inverse = np.unique(self.get_keys(rows), return_index=True, return_inverse=True)
+        free = np.flatnonzero(self.used < 0)
+        if len(free) < len(keys):
+            capacity = max(2 * len(self.used), len(self.used) + len(keys) - len(free))
+            free = np.concatenate((free, np.arange(len(self.used), capacity)))
+            self.rows, self.values, self.key_outputs = (
+                np.concatenate((array, np.empty((capacity - len(array), *array.shape[1:]))))
+                for array in (self.rows, self.values, self.key_outputs)
+            )
+            self.used = np.concatenate((self.used, np.full(capacity - len(self.used), -1, dtype=np.int64)))
+
+        slots = free[: len(keys)]
+        self.index.update(zip(keys.tolist(), slots.tolist()))
+        self.rows[slots], self.values[slots], self.key_outputs[slots] = rows[first], values[first], key_outputs[first]
+        return slots[inverse.reshape(len(rows))]
+
+    def remove(self, slots):
+        """
+        This function removes the entries in the slots from the table.
+        """
+        for key in self.get_keys(self.rows[slots]).tolist():
+            del self.index[key]
+        self.used[slots] = -1
+
+
+class EvaluationCache:
+    """
+    The EvaluationCache class is a bounded least-recently-used (LRU) cache of evaluated distributions. An entry is
+    identified by the case key (a hash of everything the evaluation and appreciation depend on, see
+    CandidateScorer.get_case_key()) and the distribution, rounded to decimals to ignore floating point noise. When the
+    cache holds more than max_size entries, the least recently used entries are removed until it holds at most 90% of
+    max_size, so a full cache does not remove entries at every store. With a path, the cache is loaded from that file
+    (written by numpy) when it exists and written to it with save().
+    """
+
+    def __init__(self, max_size=1000000, path=None, decimals=6):
+        self.max_size = max_size
+        self.path = None if path is None else str(path)
+        self.decimals = decimals
+        self.tables = {}
+        # every entry that is stored or found gets the next moment of use, so the order of use is exact
+        self.clock = 0
+        self.hits = 0
+        self.misses = 0
+        if self.path is not None and os.path.exists(self.path):
+            self.load()
+
+    def __len__(self):
+        return sum(len(table) for table in self.tables.values())
+
+    def _round(self, candidates):
+        """
+        This helper function rounds the candidates to decimals. Adding 0.0 turns -0.0 into 0.0, so both are the same
+        entry.
+        """
+        candidates = np.asarray(candidates, dtype=float)
+        return np.round(candidates.reshape(len(candidates), -1), self.decimals) + 0.0
+
+    def _use(self, table, slots):
+        """
+        This helper function marks the entries in the slots as the most recently used, in the order of the slots.
+        """
+        table.used[slots] = self.clock + np.arange(len(slots))
+        self.clock += len(slots)
+
+    def lookup(self, case_key, candidates):
+        """
+        This function looks up the appreciation of a block of candidates.
+        :param case_key: key of the case, scenario and objective
+        :param candidates: array of shape (n, number of internal variable inputs)
+        :return: a tuple (array with the appreciation of each candidate, NaN if not in the cache, boolean array
+        whether each candidate is in the cache)
+        """
+        values, found = np.full(len(candidates), np.nan), np.zeros(len(candidates), dtype=bool)
+        table = self.tables.get(case_key)
+        if table is not None and len(candidates):
+            slots = table.find(self._round(candidates))
+            found = slots >= 0
+            values[found] = table.values[slots[found]]
+            self._use(table, slots[found])
+        self.hits += int(found.sum())
+        self.misses += int(len(candidates) - found.sum())
+        return values, found
+
+    def get(self, case_key, candidate):
+        """
+        This function returns the cached entry of a single candidate without counting it as a hit or miss.
+        :param case_key: key of the case, scenario and objective
+        :param candidate: array with the value of each internal variable input
+        :return: a tuple (appreciation, array of key output values), or None if the candidate is not in the cache
+        """
+        table = self.tables.get(case_key)
+        slot = -1 if table is None else table.find(self._round([candidate]))[0]
+        return None if slot < 0 else (float(table.values[slot]), table.key_outputs[slot].copy())
+
+    def store(self, case_key, candidates, values, key_outputs):
+        """
+        This function adds a block of evaluated candidates to the cache, and removes the least recently used entries
+        if the cache is full.
+        :param case_key: key of the case, scenario and objective
+        :param candidates: array of shape (n, number of internal variable inputs)
+        :param values: array with the appreciation of each candidate
+        :param key_outputs: array of shape (n, ...) with the key output values of each candidate
+        """
+        if len(candidates) == 0:
+            return
+        rows = self._round(candidates)
+        key_outputs = np.asarray(key_outputs, dtype=float)
+        table = self.tables.setdefault(case_key, CacheTable(rows.shape[1], key_outputs.shape[1:]))
+        slots = table.find(rows)
+        missing = slots < 0
+        if missing.any():
+            slots[missing] = table.add(rows[missing], np.asarray(values, dtype=float)[missing], key_outputs[missing])
+        self._use(table, slots)
+        if len(self) > self.max_size:
+            self._evict(self.max_size - self.max_size // 10)
+
+    def _evict(self, size):
+        """
+        This helper function removes the least recently used entries of all case keys until size entries remain.
+        """
+        used = np.concatenate([table.used[table.used >= 0] for table in self.tables.values()])
+        # the moment of use of the last entry to remove
+        last_removed = np.partition(used, len(used) - size - 1)[len(used) - size - 1]
+        for case_key, table in list(self.tables.items()):
+            table.remove(np.flatnonzero((table.used >= 0) & (table.used <= last_removed)))
+            if not table:
+                del self.tables[case_key]
+
+    def get_statistics(self) -> dict:
+        """
+        This function returns the number of hits and misses, the hit rate and the number of entries of the cache.
+        """
+        lookups = self.hits + self.misses
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "hit_rate": self.hits / lookups if lookups else 0.0,
+            "size": len(self),
+        }
+
+    def clear(self) -> None:
+        """
+        This function removes all entries and resets the statistics.
+        """
+        self.tables.clear()
+        self.hits = 0
+        self.misses = 0
+
+    def save(self, path=None) -> None:
+        """
+        This function writes all entries, with their order of use, to a binary numpy (.npz) file. The file is replaced
+        at once, such that an interruption during writing does not corrupt it.
+        :param path: the file to write, by default the path of the cache
+        """
+        path = path or self.path
+        if path is None:
+            raise CacheError("provide a path to save the cache")
+        arrays = {"case_keys": np.array(list(self.tables), dtype=str)}
+        for number, table in enumerate(self.tables.values()):
+            slots = np.flatnonzero(table.used >= 0)
+            arrays[f"rows_{number}"] = table.rows[slots]
+            arrays[f"values_{number}"] = table.values[slots]
+            arrays[f"key_outputs_{number}"] = table.key_outputs[slots]
+            arrays[f"used_{number}"] = table.used[slots]
+        temporary_path = f"{path}.tmp"
+        with open(temporary_path, "wb") as file:
+            np.savez(file, **arrays)
+        os.replace(temporary_path, path)
+
+    def load(self, path=None) -> None:
+        """
+        This function adds the entries of a file written by save() to the cache, as the most recently used entries in
+        their original order of use.
+        :param path: the file to read, by default the path of the cache
+        """
+        path = path or self.path
+        try:
+            with np.load(path, allow_pickle=False) as data:
+                case_keys = np.asarray(data["case_keys"], dtype=str)
+                tables = [
+                    (str(case_key), *(data[f"{name}_{number}"] for name in ["rows", "values", "key_outputs", "used"]))
+                    for number, case_key in enumerate(case_keys)
+                ]
+        except (OSError, ValueError, KeyError, EOFError) as error:
+            raise CacheError(f"cannot read cache '{path}'") from error
+
+        # the entries of the file are used after the entries of the cache, in the same order as before
+        start = self.clock - min((table[-1].min() for table in tables if len(table[-1])), default=0)
+        for case_key, rows, values, key_outputs, used in tables:
+            self.store(case_key, rows, values, key_outputs)
+            if case_key in self.tables:
+                slots = self.tables[case_key].find(rows)
+                self.tables[case_key].used[slots[slots >= 0]] = start + used[slots >= 0]
+                self.clock = max(self.clock, start + int(used.max()) + 1)
@@ -107,7 +107,7 @@ class CaseExporter:
         )
 
     def _make_table_key_outputs(self):
-        return pd.DataFrame(
+        table = pd.DataFrame(
             {
                 "key_output": self.input_dict["key_outputs"],
                 "theme": self.input_dict["key_output_theme"],
@@ -119,6 +119,11 @@ class CaseExporter:
                 "end": self.input_dict["key_output_end"],
             }
         )
+        # optional columns are only exported when they were provided
+        for col in ["curve", "curve_parameters"]:
+            if f"key_output_{col}" in self.input_dict:
+                table[col] = self.input_dict[f"key_output_{col}"]
+        return table
 
     def _make_table_dmo(self):
         df_wide = pd.DataFrame(
@@ -8,6 +8,7 @@ import warnings
 import pandas as pd
 import numpy as np
 from vlinder.utils import check_numeric
+from vlinder.appreciation_curves import get_curve, CurveError
 
 
 class TemplateError(Exception):
@@ -60,6 +61,11 @@ class CaseImporter:  # pylint: disable=too-few-public-methods
             "scenario_weights": ["scenario", "weights"],
         }
 
+        # -- fields that are not part of template.xlsx, but can be used in a template for given table
+        self.optional_fields = {
+            "key_outputs": ["curve", "curve_parameters"],
+        }
+
     @staticmethod
     def _custom_warning(txt: str):
         """
@@ -98,7 +104,8 @@ class CaseImporter:  # pylint: disable=too-few-public-methods
         if missing_cols:
             raise TemplateError(f"column(s) '{', '.join(missing_cols)}' are missing for '{table}'")
         # 2. Warn the user about columns that will not be used
-        extra_cols = [col for col in column_list if col not in self.validate_dict[table]]
+        optional_cols = self.optional_fields.get(table, [])
+        extra_cols = [col for col in column_list if col not in self.validate_dict[table] + optional_cols]
         if extra_cols:
             self._custom_warning(f"column(s) '{', '.join(extra_cols)}' are not used for '{table}'")
         # 3. Validate whether all mandatory fields are filled in
@@ -254,7 +261,7 @@ class CaseImporter:  # pylint: disable=too-few-public-methods
         :param table: name of the table
         :param data: dataframe of the table
         """
-        columns = self.validate_dict[table]
+        columns = self.validate_dict[table] + [col for col in self.optional_fields.get(table, []) if col in data]
         for col in columns:
             key_name = table if col == table[:-1] else f"{table[:-1]}_{col}"
             self.input_dict[key_name] = data[col].to_numpy()
@@ -393,6 +400,20 @@ class CaseImporter:  # pylint: disable=too-few-public-methods
                 f"have missing start- and/or endpoint"
             )
 
+    def _validate_curves(self):
+        """
+        This function checks whether the (optional) appreciation curves and their parameters are valid.
+        """
+        table = self.dataframes_dict["key_outputs"]
+        if "curve" not in table:
+            return
+
+        for _, row in table[table["curve"].notna()].iterrows():
+            try:
+                get_curve(row["curve"], row.get("curve_parameters"))
+            except CurveError as error:
+                raise TemplateError(f"Invalid curve for key output '{row['key_output']}'. {error.message}") from error
+
     def _validate_dataframes(self):
         """
         This function is the wrapper for validation checks across the dataframes.
@@ -415,6 +436,9 @@ class CaseImporter:  # pylint: disable=too-few-public-methods
         # 3. Check on start and endpoints
         self._validate_start_and_endpoint()
 
+        # 4. Check on appreciation curves
+        self._validate_curves()
+
     def import_case(self) -> dict:
         """
         This function creates the input dictionary. It wraps other functions that deal with reading and validating
@@ -0,0 +1,82 @@
+"""
+This file contains the Checkpoint class that periodically stores the state of a long optimization on disk, such that
+an interrupted optimization can be resumed exactly where it stopped.
+"""
+
+import json
+import os
+import time
+
+
+class CheckpointError(Exception):
+    """
+    This class deals with the error handling of the checkpoints.
+    """
+
+    def __init__(self, message):  # ignore warning about super-init | pylint: disable=W0231
+        self.message = message
+
+    def __str__(self):
+        return f"Checkpoint Error: {self.message}"
+
+
+class Checkpoint:
+    """
+    The Checkpoint class writes the state of a search to a JSON file, at most once per interval (in seconds). Each
+    checkpoint contains a key, e.g. the hash of the case and the settings of the search, that identifies the search it
+    belongs to. A checkpoint is only loaded for the search with the same key.
+    """
+
+    def __init__(self, path, interval=60.0):
+        self.path = str(path)
+        self.interval = interval
+        self.last_save_time = time.perf_counter()
+
+    def read(self) -> dict or None:
+        """
+        This function reads the checkpoint file, without checking whether it belongs to a search.
+        :return: a dictionary with the key and the state of the stored search, or None if there is no checkpoint file
+        yet
+        """
+        if not os.path.exists(self.path):
+            return None
+        try:
+            with open(self.path, "r", encoding="utf-8") as file:
+                return json.load(file)
+        except (OSError, ValueError) as error:
+            raise CheckpointError(f"cannot read checkpoint '{self.path}'") from error
+
+    def load(self, key: dict) -> dict or None:
+        """
+        This function reads the state of the search from the checkpoint file.
+        :param key: dictionary that identifies the search
+        :return: the stored state, or None if there is no checkpoint file yet
+        """
+        checkpoint = self.read()
+        if checkpoint is None:
+            return None
+
+        if checkpoint.get("key") != json.loads(json.dumps(key)):
+            raise CheckpointError(
+                f"checkpoint '{self.path}' belongs to another case or search, remove it to start a new search"
+            )
+        return checkpoint["state"]
+
+    def save(self, key: dict, state: dict, force: bool = False) -> bool:
+        """
+        This function writes the state of the search to the checkpoint file if the interval has passed since the
+        previous save. The file is replaced at once, such that an interruption during writing does not corrupt it.
+        :param key: dictionary that identifies the search
+        :param state: JSON serializable dictionary with the state of the search
+        :param force: write the checkpoint, even if the interval has not passed
+        :return: whether the checkpoint has been written
+        """
+        if not force and time.perf_counter() - self.last_save_time < self.interval:
+            return False
+
+        temporary_path = f"{self.path}.tmp"
+        with open(temporary_path, "w", encoding="utf-8") as file:
+            json.dump({"key": key, "state": state}, file)
+        os.replace(temporary_path, self.path)
+        self.last_save_time = time.perf_counter()
+        return True
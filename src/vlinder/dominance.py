@@ -0,0 +1,230 @@
+"""
+This file contains the Dominance class that deals with Pareto-front and dominance analysis of decision makers
+options. All comparisons are done on blocks of options at once, such that also large sets of generated or optimized
+options (10^4 - 10^5) can be analysed.
+"""
+
+import numpy as np
+import pandas as pd
+
+
+class DominanceError(Exception):
+    """
+    This class deals with the error handling of the dominance analysis.
+    """
+
+    def __init__(self, message):  # ignore warning about super-init | pylint: disable=W0231
+        self.message = message
+
+    def __str__(self):
+        return f"Dominance Error: {self.message}"
+
+
+def _dominates(left: np.ndarray, right: np.ndarray) -> np.ndarray:
+    """
+    This function compares two blocks of options. An option dominates another option if it scores at least as good
+    on all criteria and strictly better on at least one criterion (higher is better).
+    :param left: array of shape (n, criteria)
+    :param right: array of shape (m, criteria)
+    :return: boolean array of shape (n, m) where [i, j] indicates whether left[i] dominates right[j]
+    """
+    at_least_as_good = np.ones((len(left), len(right)), dtype=bool)
+    # one criterion at a time keeps the intermediate arrays two-dimensional
+    for criterion in range(left.shape[1]):
+        at_least_as_good &= left[:, criterion, np.newaxis] >= right[np.newaxis, :, criterion]
+    # equal options have the same total, so only the pairs with the same total are compared as a whole
+    rows, columns = np.nonzero(at_least_as_good & (left.sum(axis=1)[:, np.newaxis] == right.sum(axis=1)))
+    at_least_as_good[rows, columns] = np.any(left[rows] != right[columns], axis=1)
+    return at_least_as_good
+
+
+def _sort_order(values: np.ndarray) -> np.ndarray:
+    """
+    This function sorts the options on their total score (descending). Ties are broken lexicographically on the
+    criteria, such that a dominating option is always placed before the options it dominates.
+    :param values: array of shape (options, criteria)
+    :return: array with the sorted indices of the options
+    """
+    keys = [-values[:, column] for column in reversed(range(values.shape[1]))] + [-values.sum(axis=1)]
+    return np.lexsort(keys)
+
+
+def non_dominated(values: np.ndarray, block_size: int = 1024) -> np.ndarray:
+    """
+    This function determines the non-dominated set (Pareto front). Options are sorted on their total score first: an
+    option can only be dominated by an option with a higher total, so every block only needs to be compared with the
+    front found so far and with itself.
+    :param values: array of shape (options, criteria)
+    :param block_size: number of options that is compared at once
+    :return: boolean array indicating for each option whether it is non-dominated
+    """
+    values = np.asarray(values, dtype=float)
+    order = _sort_order(values)
+    front = np.empty((0, values.shape[1]))
+    is_front = np.zeros(len(values), dtype=bool)
+
+    for start in range(0, len(values), block_size):
+        stop = start + block_size
+        block_index = order[start:stop]
+        block = values[block_index]
+        # step 1: remove options dominated by the current front
+        survivors = ~_dominates(front, block).any(axis=0)
+        # step 2: remove options dominated within the block itself
+        survivors[survivors] = ~_dominates(block[survivors], block[survivors]).any(axis=0)
+
+        is_front[block_index[survivors]] = True
+        front = np.vstack((front, block[survivors]))
+
+    return is_front
+
+
+def dominance_counts(values: np.ndarray, is_front: np.ndarray = None, block_size: int = 1024) -> tuple:
+    """
+    This function counts for each option by how many options it is dominated and how many options it dominates.
+    Only options with a higher total score can dominate an option and options on the Pareto front are not dominated,
+    so each block of options that are not on the front is compared with the (sorted) options up to that block. Blocks
+    that cannot dominate each other (worse on a criterion for all options) are skipped. In the worst case all pairs of
+    options are still compared, so the cost grows quadratically with the number of options (about 3 seconds for 20000
+    options with 8 criteria).
+    :param values: array of shape (options, criteria)
+    :param is_front: boolean array indicating for each option whether it is non-dominated, determined when not given
+    :param block_size: number of options that is compared at once
+    :return: a tuple of arrays (dominated_by, dominates)
+    """
+    values = np.asarray(values, dtype=float)
+    if is_front is None:
+        is_front = non_dominated(values, block_size)
+    order = _sort_order(values)
+    sorted_values = values[order]
+    # the numbers of dominating and dominated options, in sorted order
+    dominated_by, dominates = np.zeros((2, len(values)), dtype=int)
+    # the sorted positions of the options that can be dominated
+    dominated_positions = np.flatnonzero(~np.asarray(is_front)[order])
+
+    if not dominated_positions.size:
+        return np.zeros(len(values), dtype=int), np.zeros(len(values), dtype=int)
+
+    for positions in np.split(dominated_positions, range(block_size, len(dominated_positions), block_size)):
+        block = sorted_values[positions]
+        for left_start in range(0, positions[-1], block_size):
+            left_stop = min(left_start + block_size, positions[-1])
+            # blocks of which all options are worse on a criterion cannot dominate any option of the block
+            if np.any(sorted_values[left_start:left_stop].max(axis=0) < block.min(axis=0)):
+                continue
+            comparison = _dominates(sorted_values[left_start:left_stop], block)
+            dominates[left_start:left_stop] += comparison.sum(axis=1)
+            dominated_by[positions] += comparison.sum(axis=0)
+
+    # map the counts back to the original order of the options
+    result = np.empty((2, len(values)), dtype=int)
+    result[:, order] = dominated_by, dominates
+    return result[0], result[1]
+
+
+def distance_to_front(values: np.ndarray, is_front: np.ndarray, block_size: int = 1024) -> np.ndarray:
+    """
+    This function calculates the Euclidean distance of each option to the closest option on the Pareto front. The
+    squared distances between a block of options and a block of the front are calculated as |a|^2 + |b|^2 - 2 a.b, so
+    the memory use does not depend on the number of criteria nor on the size of the front.
+    :param values: array of shape (options, criteria)
+    :param is_front: boolean array indicating for each option whether it is non-dominated
+    :param block_size: number of options that is compared at once
+    :return: array with the distance to the front (0 for options on the front)
+    """
+    values = np.asarray(values, dtype=float)
+    front = values[is_front]
+    front_norms = (front**2).sum(axis=1)
+    squared_distances = np.full(len(values), np.inf)
+
+    for start in range(0, len(values), block_size):
+        stop = start + block_size
+        block = values[start:stop]
+        block_norms = (block**2).sum(axis=1)
+        for front_start in range(0, len(front), block_size):
+            front_stop = front_start + block_size
+            block_distances = (
+                block_norms[:, np.newaxis]
+                + front_norms[np.newaxis, front_start:front_stop]
+                - 2 * block @ front[front_start:front_stop].T
+            )
+            squared_distances[start:stop] = np.minimum(squared_distances[start:stop], block_distances.min(axis=1))
+
+    # rounding can make the squared distance of (almost) equal options slightly negative
+    distances = np.sqrt(np.maximum(squared_distances, 0))
+    distances[is_front] = 0
+    return distances
+
+
+class Dominance:  # pylint: disable=too-few-public-methods
+    """This class deals with the Pareto-front and dominance analysis of the decision makers options"""
+
+    def __init__(self, input_dict, output_dict):
+        self.input_dict = input_dict
+        self.output_dict = output_dict
+        self.available_levels = {
+            "key_output": self._get_key_output_matrix,
+            "theme": self._get_theme_matrix,
+        }
+
+    def _get_key_output_matrix(self, scenario: str) -> pd.DataFrame:
+        """
+        This function collects the appreciations of all decision makers options for a given scenario.
+        :param scenario: name of the scenario
+        :return: a dataframe with decision makers options as rows and key outputs as columns
+        """
+        return pd.DataFrame(
+            [
+                [self.output_dict[scenario][dmo]["appreciations"][key] for key in self.input_dict["key_outputs"]]
+                for dmo in self.input_dict["decision_makers_options"]
+            ],
+            index=self.input_dict["decision_makers_options"],
+            columns=self.input_dict["key_outputs"],
+        )
+
+    def _get_theme_matrix(self, scenario: str) -> pd.DataFrame:
+        """
+        This function collects the weighted appreciations per theme of all decision makers options for a given
+        scenario.
+        :param scenario: name of the scenario
+        :return: a dataframe with decision makers options as rows and themes as columns
+        """
+        weighted_appreciations = pd.DataFrame(
+            [
+                [
+                    self.output_dict[scenario][dmo]["weighted_appreciations"][key]
+                    for key in self.input_dict["key_outputs"]
+                ]
+                for dmo in self.input_dict["decision_makers_options"]
+            ],
+            index=self.input_dict["decision_makers_options"],
+            columns=self.input_dict["key_outputs"],
+        )
+        return weighted_appreciations.T.groupby(self.input_dict["key_output_theme"], sort=False).sum().T
+
+    def analyse(self, scenario: str, level: str = "key_output") -> pd.DataFrame:
+        """
+        This function analyses the dominance of all decision makers options for a given scenario.
+        :param scenario: name of the scenario
+        :param level: compare decision makers options on 'key_output' appreciations or 'theme' appreciations
+        :return: a dataframe with for each decision makers option whether it is on the Pareto front, by how many
+        options it is dominated, how many options it dominates and its distance to the Pareto front
+        """
+        if scenario not in self.output_dict:
+            raise DominanceError(f"'{scenario}' is not a valid scenario")
+        if level not in self.available_levels:
+            raise DominanceError(f"'{level}' is not a valid level. Choose from {list(self.available_levels)}")
+
+        matrix = self.available_levels[level](scenario)
+        values = matrix.to_numpy(dtype=float)
+
+        is_front = non_dominated(values)
+        dominated_by, dominates = dominance_counts(values, is_front)
+        return pd.DataFrame(
+            {
+                "non_dominated": is_front,
+                "dominated_by": dominated_by,
+                "dominates": dominates,
+                "distance_to_front": distance_to_front(values, is_front),
+            },
+            index=matrix.index,
+        )
@@ -39,6 +39,39 @@ class Evaluate:
             "min": lambda x, y: min(x, y),  # ignore warning about unnecessary lambda | pylint: disable=W0108
             "max": lambda x, y: max(x, y),  # ignore warning about unnecessary lambda | pylint: disable=W0108
         }
+        # element-wise equivalents of the operators above, used to evaluate many candidates at once
+        self.vectorized_operators_dict = {
+            "-": np.subtract,
+            "+": np.add,
+            "*": np.multiply,
+            "/": self._divide_or_zero,
+            "-*": lambda x, y: -np.multiply(x, y),
+            "-/": lambda x, y: self._divide_or_zero(-np.asarray(x, dtype=float), y),
+            ">": lambda x, y: np.greater(x, y).astype(float),
+            "<": lambda x, y: np.less(x, y).astype(float),
+            ">=": lambda x, y: np.greater_equal(x, y).astype(float),
+            "<=": lambda x, y: np.less_equal(x, y).astype(float),
+            "min": np.minimum,
+            "max": np.maximum,
+        }
+        # interval equivalents of the operators above: each argument is a tuple (lower, upper) of bounds
+        self.interval_operators_dict = {
+            "-": lambda x, y: (x[0] - y[1], x[1] - y[0]),
+            "+": lambda x, y: (x[0] + y[0], x[1] + y[1]),
+            "*": self._multiply_intervals,
+            "/": self._divide_intervals,
+            "-*": lambda x, y: self._negate_interval(self._multiply_intervals(x, y)),
+            "-/": lambda x, y: self._negate_interval(self._divide_intervals(x, y)),
+            ">": lambda x, y: (np.greater(x[0], y[1]).astype(float), np.greater(x[1], y[0]).astype(float)),
+            "<": lambda x, y: (np.less(x[1], y[0]).astype(float), np.less(x[0], y[1]).astype(float)),
+            ">=": lambda x, y: (
+                np.greater_equal(x[0], y[1]).astype(float),
+                np.greater_equal(x[1], y[0]).astype(float),
+            ),
+            "<=": lambda x, y: (np.less_equal(x[1], y[0]).astype(float), np.less_equal(x[0], y[1]).astype(float)),
+            "min": lambda x, y: (np.minimum(x[0], y[0]), np.minimum(x[1], y[1])),
+            "max": lambda x, y: (np.maximum(x[0], y[0]), np.maximum(x[1], y[1])),
+        }
 
     def _create_value_dict(self, scen_index: int, dmo_index: int) -> None:
         """
@@ -146,6 +179,168 @@ class Evaluate:
         output_dict = {"key_outputs": self._get_key_outputs()}
         return output_dict
 
+    @staticmethod
+    def _divide_or_zero(x, y):
+        """
+        This function divides element-wise and returns 0 where the denominator equals 0.
+        :param x: (array of) numerators
+        :param y: (array of) denominators
+        :return: array with the results of the division
+        """
+        x, y = np.broadcast_arrays(np.asarray(x, dtype=float), np.asarray(y, dtype=float))
+        return np.divide(x, y, out=np.zeros(x.shape), where=y != 0)
+
+    def evaluate_internal_variable_inputs(self, scenario: str, internal_variable_values: np.ndarray) -> np.ndarray:
+        """
+        This function evaluates all dependencies for many values of the internal variable inputs at once, for a given
+        scenario. Each dependency is calculated for all rows in a single array operation.
+        :param scenario: string of scenario name
+        :param internal_variable_values: array of shape (n, number of internal variable inputs)
+        :return: array of shape (n, number of key outputs) with the key output values, ordered as in the input_dict
+        """
+        return self.evaluate_scenarios([scenario], internal_variable_values)[0]
+
+    def evaluate_scenarios(self, scenarios: list, internal_variable_values: np.ndarray) -> np.ndarray:
+        """
+        This function evaluates all dependencies for many values of the internal variable inputs in several scenarios
+        at once. Internal variables are stored as rows and external variables as columns, such that each dependency is
+        calculated for all combinations of scenarios and values in a single (broadcasted) array operation.
+        :param scenarios: list of scenario names
+        :param internal_variable_values: array of shape (n, number of internal variable inputs)
+        :return: array of shape (scenarios, n, number of key outputs) with the key output values
+        """
+        internal_variable_values = np.asarray(internal_variable_values, dtype=float)
+        scen_indices = [self._find_index("scenarios", scenario) for scenario in scenarios]
+        scenario_values = np.asarray(self.input_dict["scenario_value"], dtype=float)[scen_indices]
+        self.value_dict = {
+            **{key: 0 for key in self.input_dict["key_outputs"]},
+            **dict(zip(self.input_dict["internal_variable_inputs"], internal_variable_values.T[:, np.newaxis, :])),
+            **dict(zip(self.input_dict["external_variable_inputs"], scenario_values.T[:, :, np.newaxis])),
+            **dict(zip(self.input_dict["fixed_inputs"], self.input_dict["fixed_input_value"])),
+        }
+
+        # calculate each destination -- already ordered on hierarchy during the import
+        for index, dest in enumerate(self.input_dict["destination"]):
+            operator = self.input_dict["operator"][index]
+            if operator not in self.vectorized_operators_dict:
+                raise EvaluationError(f"operator {operator} not available")
+
+            result = self.vectorized_operators_dict[operator](
+                self._get_value_of_argument(self.input_dict["argument_1"][index]),
+                self._get_value_of_argument(self.input_dict["argument_2"][index]),
+            )
+            # and check for 'errors' due to floating-point representation
+            result = np.where(np.abs(result) < 1e-9, 0, result)
+            self.value_dict[dest] = self.value_dict.get(dest, 0) + result
+
+        shape = (len(scenarios), len(internal_variable_values))
+        return np.stack(
+            [np.broadcast_to(self.value_dict[key_output], shape) for key_output in self.input_dict["key_outputs"]],
+            axis=2,
+        )
+
+    @staticmethod
+    def _negate_interval(interval: tuple) -> tuple:
+        """This helper function returns the interval of minus the values within the given interval."""
+        return -interval[1], -interval[0]
+
+    @staticmethod
+    def _multiply_intervals(x: tuple, y: tuple) -> tuple:
+        """
+        This function calculates the interval that contains all products of values within two intervals.
+        :param x: tuple (lower, upper) of the first argument
+        :param y: tuple (lower, upper) of the second argument
+        :return: tuple (lower, upper) of the product
+        """
+        with np.errstate(invalid="ignore"):
+            products = np.stack(np.broadcast_arrays(x[0] * y[0], x[0] * y[1], x[1] * y[0], x[1] * y[1]))
+        # an unbounded interval multiplied by zero remains zero
+        products = np.where(np.isnan(products), 0, products)
+        return products.min(axis=0), products.max(axis=0)
+
+    @staticmethod
+    def _divide_intervals(x: tuple, y: tuple) -> tuple:
+        """
+        This function calculates the interval that contains all quotients of values within two intervals, where a
+        division by 0 returns 0. If the denominator can be arbitrarily close to 0, the quotient is unbounded.
+        :param x: tuple (lower, upper) of the numerator
+        :param y: tuple (lower, upper) of the denominator
+        :return: tuple (lower, upper) of the quotient
+        """
+        x_lower, x_upper, y_lower, y_upper = np.broadcast_arrays(
+            *(np.asarray(value, dtype=float) for value in (*x, *y))
+        )
+        with np.errstate(divide="ignore", invalid="ignore"):
+            quotients = np.stack([x_lower / y_lower, x_lower / y_upper, x_upper / y_lower, x_upper / y_upper])
+        lower = np.where(np.isnan(quotients), -np.inf, quotients).min(axis=0)
+        upper = np.where(np.isnan(quotients), np.inf, quotients).max(axis=0)
+
+        # the bounds of the quotients only hold if the denominator does not contain 0
+        signed = (y_lower > 0) | (y_upper < 0)
+        zero = ((x_lower == 0) & (x_upper == 0)) | ((y_lower == 0) & (y_upper == 0))
+        return (
+            np.where(signed, lower, np.where(zero, 0, -np.inf)),
+            np.where(signed, upper, np.where(zero, 0, np.inf)),
+        )
+
+    # pylint: disable=too-many-locals
+    def evaluate_scenario_intervals(self, scenarios: list, lower: np.ndarray, upper: np.ndarray) -> tuple:
+        """
+        This function calculates bounds of the key output values for boxes of internal variable inputs, i.e. each
+        internal variable input can take any value between its lower and upper bound. The dependencies are evaluated
+        with interval arithmetic in the same (broadcasted) manner as evaluate_scenarios(), such that the key output
+        value of every point within a box lies within the calculated bounds.
+        :param scenarios: list of scenario names
+        :param lower: array of shape (n, number of internal variable inputs) with the lower bounds of the boxes
+        :param upper: array of shape (n, number of internal variable inputs) with the upper bounds of the boxes
+        :return: tuple of two arrays of shape (scenarios, n, number of key outputs) with the lower and upper bounds
+        """
+        lower, upper = np.asarray(lower, dtype=float), np.asarray(upper, dtype=float)
+        scen_indices = [self._find_index("scenarios", scenario) for scenario in scenarios]
+        scenario_values = np.asarray(self.input_dict["scenario_value"], dtype=float)[scen_indices]
+        fixed_values = np.asarray(self.input_dict["fixed_input_value"], dtype=float)
+        intervals = {
+            **{key: (0.0, 0.0) for key in self.input_dict["key_outputs"]},
+            **{
+                key: (lower.T[index, np.newaxis, :], upper.T[index, np.newaxis, :])
+                for index, key in enumerate(self.input_dict["internal_variable_inputs"])
+            },
+            **{
+                key: (scenario_values.T[index, :, np.newaxis],) * 2
+                for index, key in enumerate(self.input_dict["external_variable_inputs"])
+            },
+            **{key: (fixed_values[index],) * 2 for index, key in enumerate(self.input_dict["fixed_inputs"])},
+        }
+
+        def get_interval(arg):
+            try:
+                return (float(arg),) * 2
+            except ValueError:
+                return intervals[arg]
+
+        # calculate each destination -- already ordered on hierarchy during the import
+        for index, dest in enumerate(self.input_dict["destination"]):
+            operator = self.input_dict["operator"][index]
+            if operator not in self.interval_operators_dict:
+                raise EvaluationError(f"operator {operator} not available")
+
+            result_lower, result_upper = self.interval_operators_dict[operator](
+                get_interval(self.input_dict["argument_1"][index]), get_interval(self.input_dict["argument_2"][index])
+            )
+            # values close to zero are set to zero, so the bounds are widened to zero
+            result_lower = np.where(np.abs(result_lower) < 1e-9, np.minimum(result_lower, 0), result_lower)
+            result_upper = np.where(np.abs(result_upper) < 1e-9, np.maximum(result_upper, 0), result_upper)
+            dest_lower, dest_upper = intervals.get(dest, (0.0, 0.0))
+            intervals[dest] = (dest_lower + result_lower, dest_upper + result_upper)
+
+        shape = (len(scenarios), len(lower))
+        bounds = [
+            np.stack([np.broadcast_to(intervals[key][side], shape) for key in self.input_dict["key_outputs"]], axis=2)
+            for side in (0, 1)
+        ]
+        # undefined bounds (e.g. an unbounded interval minus itself) can take any value
+        return np.where(np.isnan(bounds[0]), -np.inf, bounds[0]), np.where(np.isnan(bounds[1]), np.inf, bounds[1])
+
     def evaluate_selected_scenario(self, scenario: str) -> dict:
         """
         This function creates an output dictionary for all decision makers option within a given scenario.
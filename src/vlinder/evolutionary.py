@@ -0,0 +1,178 @@
+"""
+This file contains the evolutionary search over the distributions of a budget: a genetic algorithm on the simplex
+{x >= 0, sum(x) = budget}, in which each generation is evaluated as one batch.
+"""
+
+import numpy as np
+
+
+class EvolutionarySearch:
+    """
+    The EvolutionarySearch class improves a population of distributions of a budget generation by generation. The
+    population is divided over islands, one for each starting point, that evolve separately and exchange their best
+    distribution every migration_interval generations. This keeps distributions from different starting points in the
+    population, even if one of them is far better in the first generations.
+    The children of a generation are created by tournament selection of two parents within the island, a random convex
+    combination of the parents (crossover) and, with probability mutation_rate, a random change (mutation). All these
+    operations keep the children on the simplex. The elite best distributions of each island survive unchanged, so the
+    best appreciation never decreases. The search is reproducible for a given seed and can be stored in a checkpoint
+    with get_state() and resumed with set_state().
+    """
+
+    # pylint: disable=too-many-arguments,too-many-positional-arguments
+    def __init__(
+        self,
+        scorer,
+        mutation_rate=0.3,
+        concentration=100.0,
+        elite=1,
+        migration_interval=10,
+        seed=None,
+    ):
+        self.scorer = scorer
+        self.mutation_rate = mutation_rate
+        self.concentration = concentration
+        self.elite = elite
+        self.migration_interval = migration_interval
+        self.rng = np.random.default_rng(seed)
+        # arrays of shape (islands, island size, internal inputs) and (islands, island size), sorted per island
+        self.population = None
+        self.values = None
+        self.generation = 0
+        self.evaluations = 0
+
+    def get_best(self):
+        """
+        This function returns a tuple (best appreciation, best distribution) of the population.
+        """
+        island = int(self.values[:, 0].argmax())
+        return float(self.values[island, 0]), self.population[island, 0]
+
+    def get_generation_size(self) -> int:
+        """
+        This function returns the number of children, and thus evaluations, of a generation.
+        """
+        islands, island_size = self.values.shape
+        return islands * (island_size - min(self.elite, island_size - 1))
+
+    def _sort(self, population, values):
+        """
+        This helper function sorts each island from the highest to the lowest appreciation (the earliest first in case
+        of ties).
+        """
+        order = np.argsort(-values, axis=1, kind="stable")
+        population = np.take_along_axis(population, order[:, :, np.newaxis], axis=1)
+        return population, np.take_along_axis(values, order, axis=1)
+
+    def _score(self, population):
+        """
+        This helper function scores the distributions of all islands as one batch.
+        """
+        return self.scorer.score(population.reshape(-1, population.shape[2])).reshape(population.shape[:2])
+
+    def initialize(self, starting_points, population_size=50) -> int:
+        """
+        This function creates the first generation: an island for each starting point (at most half the population
+        size) with the starting point and mutations of it, and evaluates it.
+        :param starting_points: array of distributions of which the sums equal the budget
+        :param population_size: number of distributions in all islands together
+        :return: the number of evaluations
+        """
+        starting_points = np.asarray(starting_points, dtype=float)[: max(population_size // 2, 1)]
+        island_size = max(population_size // len(starting_points), 2)
+        population = np.repeat(starting_points[:, np.newaxis, :], island_size, axis=1)
+        mutants = self._mutate(population[:, 1:].reshape(-1, starting_points.shape[1]))
+        population[:, 1:] = mutants.reshape((len(starting_points), island_size - 1, -1))
+
+        self.population, self.values = self._sort(population, self._score(population))
+        self.evaluations += population.shape[0] * population.shape[1]
+        return population.shape[0] * population.shape[1]
+
+    def _mutate(self, children):
+        """
+        This function mutates children in one of two ways, each with equal probability:
+        - a sample of a Dirichlet distribution around the child, the higher the concentration, the closer the sample
+        is to the child. A small minimum keeps internal inputs of zero reachable.
+        - a transfer of a random part of one internal input to another.
+        """
+        budgets = children.sum(axis=1, keepdims=True)
+        samples = self.rng.gamma(self.concentration * children / np.where(budgets > 0, budgets, 1) + 0.01)
+        mutants = budgets * samples / samples.sum(axis=1, keepdims=True)
+
+        rows = np.arange(len(children))
+        sources, targets = self.rng.integers(0, children.shape[1], (2, len(children)))
+        # the part is log-uniformly distributed, such that both small and large transfers are tried, and a quarter of
+        # the transfers empties the internal input, as the best distributions often have internal inputs of zero
+        parts = np.where(self.rng.random(len(children)) < 0.25, 1.0, 10 ** (-4 * self.rng.random(len(children))))
+        amounts = parts * children[rows, sources]
+        transfers = children.copy()
+        transfers[rows, sources] -= amounts
+        transfers[rows, targets] += amounts
+        return np.where(self.rng.random((len(children), 1)) < 0.5, mutants, transfers)
+
+    def _select_parents(self, num_children):
+        """
+        This function selects a parent for each child within its island by binary tournaments: the best of two random
+        members.
+        :return: array of shape (islands, num_children, internal inputs)
+        """
+        islands, island_size = self.values.shape
+        # the islands are sorted, so the member with the lowest index wins the tournament
+        indices = self.rng.integers(0, island_size, (islands, num_children, 2)).min(axis=2)
+        return np.take_along_axis(self.population, indices[:, :, np.newaxis], axis=1)
+
+    def step(self) -> int:
+        """
+        This function creates and evaluates the next generation, after which the islands exchange their best
+        distribution every migration_interval generations.
+        :return: the number of evaluations
+        """
+        islands, island_size = self.values.shape
+        num_children = self.get_generation_size() // islands
+        first_parents, second_parents = self._select_parents(num_children), self._select_parents(num_children)
+        weights = self.rng.random((islands, num_children, 1))
+        children = (weights * first_parents + (1 - weights) * second_parents).reshape(-1, self.population.shape[2])
+        mutated = self.rng.random(len(children)) < self.mutation_rate
+        children[mutated] = self._mutate(children[mutated])
+        children = children.reshape((islands, num_children, -1))
+
+        survivors = island_size - num_children
+        self.population, self.values = self._sort(
+            np.concatenate([self.population[:, :survivors], children], axis=1),
+            np.concatenate([self.values[:, :survivors], self._score(children)], axis=1),
+        )
+        self.generation += 1
+        self.evaluations += islands * num_children
+
+        # the best distribution of each island replaces the worst distribution of the next island
+        if islands > 1 and self.generation % self.migration_interval == 0:
+            self.population[:, -1] = np.roll(self.population[:, 0], 1, axis=0)
+            self.values[:, -1] = np.roll(self.values[:, 0], 1)
+            self.population, self.values = self._sort(self.population, self.values)
+        return islands * num_children
+
+    def get_state(self) -> dict:
+        """
+        This function returns the state of the search, including the state of the random number generator, as a JSON
+        serializable dictionary.
+        """
+        return {
+            "generation": self.generation,
+            "evaluations": self.evaluations,
+            "population": self.population.tolist(),
+            "values": self.values.tolist(),
+            "rng": self.rng.bit_generator.state,
+        }
+
+    def set_state(self, state: dict) -> None:
+        """
+        This function restores the state of the search from get_state(), such that it continues exactly where it
+        stopped.
+        :param state: dictionary from get_state()
+        :return: None
+        """
+        self.generation = state["generation"]
+        self.evaluations = state["evaluations"]
+        self.population = np.array(state["population"], dtype=float)
+        self.values = np.array(state["values"], dtype=float)
+        self.rng.bit_generator.state = state["rng"]
@@ -0,0 +1,112 @@
+"""
+This file contains the SimplexLattice class that enumerates all distributions of a budget over a number of internal
+variable inputs. The lattice points are the compositions of the budget (in units of one step) into a fixed number of
+parts, which are generated directly by unranking with the stars-and-bars method.
+"""
+
+from math import comb
+import numpy as np
+
+
+class LatticeError(Exception):
+    """
+    This class deals with the error handling of the simplex lattice.
+    """
+
+    def __init__(self, message):  # ignore warning about super-init | pylint: disable=W0231
+        self.message = message
+
+    def __str__(self):
+        return f"Lattice Error: {self.message}"
+
+
+class SimplexLattice:
+    """
+    This class enumerates all points (x_1, .., x_k) with x_i = n_i * step_size, n_i >= 0 and sum(n_i) = units, in
+    colexicographic order of their stars-and-bars representation. Every point has a unique index in [0, size), such
+    that any range of points can be generated without generating the points before it.
+    """
+
+    def __init__(self, total: float, units: int, num_parts: int):
+        if num_parts < 1:
+            raise LatticeError(f"the number of parts should be at least 1, not {num_parts}")
+        if units < 0 or int(units) != units:
+            raise LatticeError(f"the number of units should be a non-negative integer, not {units}")
+        self.total = total
+        self.units = int(units)
+        self.num_parts = num_parts
+        self.step_size = total / units if units else 0
+        # a composition of 'units' into k parts corresponds with the positions of k - 1 bars among units + k - 1 slots
+        self.slots = self.units + num_parts - 1
+        self.size = comb(self.slots, num_parts - 1)
+        self._binomials = self._get_binomial_table()
+
+    def __len__(self):
+        return self.size
+
+    def _get_binomial_table(self) -> np.ndarray:
+        """
+        This function creates the table binomials[j, c] = C(c, j) for all slots c and bars j. Values above the size of
+        the lattice are never needed for unranking and are capped to keep the table within int64.
+        :return: array of shape (num_parts, slots)
+        """
+        if self.size > np.iinfo(np.int64).max:
+            raise LatticeError(
+                f"the lattice of {self.units} units over {self.num_parts} parts has {self.size} points, which is more "
+                f"than can be indexed ({np.iinfo(np.int64).max}), use fewer units or parts"
+            )
+        binomials = np.zeros((self.num_parts, self.slots), dtype=np.int64)
+        for bars in range(self.num_parts):
+            binomials[bars] = [min(comb(slot, bars), self.size) for slot in range(self.slots)]
+        return binomials
+
+    def unrank_units(self, indices) -> np.ndarray:
+        """
+        This function converts indices into lattice points, expressed in number of units per part. The positions of
+        the bars follow from the combinatorial number system: index = C(c_{k-1}, k-1) + .. + C(c_1, 1).
+        :param indices: array of indices in [0, size)
+        :return: integer array of shape (len(indices), num_parts)
+        """
+        remainder = np.array(indices, dtype=np.int64, ndmin=1)
+        if remainder.size and (remainder.min() < 0 or remainder.max() >= self.size):
+            raise LatticeError(f"indices should be within [0, {self.size})")
+
+        units = np.empty((len(remainder), self.num_parts), dtype=np.int64)
+        upper_bar = np.full(len(remainder), self.slots)
+        for bars in range(self.num_parts - 1, 0, -1):
+            # the largest slot c with C(c, bars) <= remainder is the position of the current (highest) bar
+            position = np.searchsorted(self._binomials[bars], remainder, side="right") - 1
+            remainder = remainder - self._binomials[bars, position]
+            # the stars between this bar and the bar above it form the size of the part
+            units[:, bars] = upper_bar - position - 1
+            upper_bar = position
+        units[:, 0] = upper_bar
+        return units
+
+    def unrank(self, indices, out=None) -> np.ndarray:
+        """
+        This function converts indices into lattice points. The last part is calculated as the remainder of the total,
+        such that every point sums to the total.
+        :param indices: array of indices in [0, size)
+        :param out: (optional) preallocated array of at least len(indices) rows, the points are written in its first
+        rows
+        :return: array of shape (len(indices), num_parts), a view of out if provided
+        """
+        units = self.unrank_units(indices)
+        points = np.multiply(units, float(self.step_size), out=None if out is None else out[: len(units)])
+        points[:, -1] = self.total - points[:, :-1].sum(axis=1)
+        return points
+
+    def chunks(self, chunk_size: int = 10000, start: int = 0, stop: int = None, out=None):
+        """
+        This function lazily generates the lattice points in consecutive chunks.
+        :param chunk_size: the (maximum) number of points per chunk
+        :param start: index of the first point
+        :param stop: index after the last point (default: size of the lattice)
+        :param out: (optional) preallocated array of at least chunk_size rows, which is reused for every chunk. A chunk
+        is then only valid until the next chunk is generated.
+        :return: a generator of tuples (index of the first point in the chunk, array of points)
+        """
+        stop = self.size if stop is None else min(stop, self.size)
+        for chunk_start in range(start, stop, chunk_size):
+            yield chunk_start, self.unrank(np.arange(chunk_start, min(chunk_start + chunk_size, stop)), out)
@@ -0,0 +1,155 @@
+"""
+This file contains the ClusterTree class, which collapses the predecessors of a key output in a dependency graph into
+clusters by generation and hierarchy level, and the script that expands these clusters in the interactive graph.
+"""
+
+import json
+import numpy as np
+
+# the style of a node of the graph, clusters have their own style
+NODE_STYLE = {"size": 4, "font": {"size": 8}, "color": "black"}
+
+# The script is added to the pyvis page, where nodes, edges and network are global variables. A double-click on a
+# cluster replaces it by its children, after which every node is shown as its highest collapsed cluster.
+EXPAND_SCRIPT = """
+<script type="text/javascript">
+    var clusterTree = %s;
+    var expanded = {};
+
+    function representative(id) {
+        var result = id;
+        var parent = clusterTree.parent[id];
+        while (parent !== undefined && parent !== null) {
+            if (!expanded[parent]) {
+                result = parent;
+            }
+            parent = clusterTree.parent[parent];
+        }
+        return result;
+    }
+
+    function showClusters() {
+        var visible = {};
+        clusterTree.leaves.forEach(function (id) {
+            visible[representative(id)] = true;
+        });
+        nodes.remove(nodes.getIds().filter(function (id) { return !visible[id]; }));
+        nodes.update(Object.keys(visible).map(function (id) {
+            return Object.assign({}, clusterTree.style, clusterTree.items[id]);
+        }));
+
+        var shown = {};
+        var visibleEdges = [];
+        clusterTree.edges.forEach(function (edge) {
+            var from = representative(edge[0]);
+            var to = representative(edge[1]);
+            var key = JSON.stringify([from, to]);
+            if (from !== to && !shown[key]) {
+                shown[key] = true;
+                visibleEdges.push({from: from, to: to, arrows: "to", color: "darkorange"});
+            }
+        });
+        edges.clear();
+        edges.add(visibleEdges);
+    }
+
+    network.on("doubleClick", function (params) {
+        if (params.nodes.length === 1 && clusterTree.clusters[params.nodes[0]]) {
+            expanded[params.nodes[0]] = true;
+            showClusters();
+        }
+    });
+</script>
+"""
+
+
+class ClusterTree:
+    """
+    The ClusterTree class divides the predecessors of a key output into a tree of clusters. The key output and the
+    predecessors of the first generations (at most max_nodes nodes in total) are not clustered. The predecessors of
+    every further generation form a cluster, which is divided into a cluster per hierarchy level when it has more than
+    max_nodes nodes. Each node is shown as its highest collapsed cluster, so the graph of a very large model starts
+    with a few nodes and clusters.
+    """
+
+    def __init__(self, generations: dict, levels: dict, max_nodes: int = 30):
+        self.parent = {}
+        self.members = {}
+        self.labels = {}
+
+        nodes_per_generation = np.bincount(list(generations.values())).cumsum()
+        detail_generation = int(np.flatnonzero(nodes_per_generation <= max_nodes)[-1])
+        clustered = {}
+        for node, generation in generations.items():
+            if generation > detail_generation:
+                clustered.setdefault(generation, []).append(node)
+
+        for generation, nodes in sorted(clustered.items()):
+            cluster = f"cluster:{generation}"
+            self._add_cluster(cluster, None, nodes, f"generation {generation}")
+            nodes_per_level = {}
+            for node in nodes:
+                nodes_per_level.setdefault(levels[node], []).append(node)
+            if len(nodes) > max_nodes and len(nodes_per_level) > 1:
+                for level, level_nodes in sorted(nodes_per_level.items()):
+                    self._add_cluster(f"{cluster}:{level}", cluster, level_nodes, f"level {level}")
+
+    def _add_cluster(self, cluster, parent, nodes, name):
+        """
+        This helper function adds a cluster of nodes to the tree, below the parent cluster (None for the top).
+        """
+        self.parent[cluster] = parent
+        self.members[cluster] = list(nodes)
+        self.labels[cluster] = f"{len(nodes)} variables ({name})"
+        for node in nodes:
+            self.parent[node] = cluster
+
+    def get_representative(self, node, expanded=()):
+        """
+        This function returns the highest collapsed cluster that contains the node, or the node itself.
+        :param node: a node of the graph
+        :param expanded: the clusters that are expanded
+        :return: the node or cluster that is shown
+        """
+        result = node
+        parent = self.parent.get(node)
+        while parent is not None:
+            if parent not in expanded:
+                result = parent
+            parent = self.parent.get(parent)
+        return result
+
+    def collapse(self, nodes, edges, expanded=()) -> tuple:
+        """
+        This function collapses a graph to the nodes and clusters that are shown.
+        :param nodes: the nodes of the graph
+        :param edges: the edges (source, target) of the graph
+        :param expanded: the clusters that are expanded
+        :return: a tuple (list of the nodes and clusters that are shown, list of the edges between them)
+        """
+        shown = list(dict.fromkeys(self.get_representative(node, expanded) for node in nodes))
+        shown_edges = {}
+        for source, target in edges:
+            edge = (self.get_representative(source, expanded), self.get_representative(target, expanded))
+            if edge[0] != edge[1]:
+                shown_edges[edge] = None
+        return shown, list(shown_edges)
+
+    def get_script(self, nodes, edges, items: dict) -> str:
+        """
+        This function creates the script that expands a cluster when it is double-clicked in the interactive graph.
+        :param nodes: the nodes of the graph
+        :param edges: the edges (source, target) of the graph
+        :param items: the vis.js item (id, label, position and the style of clusters) of every node and cluster
+        :return: a script element for the pyvis page
+        """
+        data = {
+            "parent": self.parent,
+            "clusters": {cluster: True for cluster in self.members},
+            "leaves": list(nodes),
+            "edges": [list(edge) for edge in edges],
+            "items": items,
+            "style": NODE_STYLE,
+        }
+        # names with "</" must not end the script element
+        return EXPAND_SCRIPT % json.dumps(data, separators=(",", ":")).replace("</", "<\\/")
@@ -126,8 +126,8 @@ class MakeReport:
     This class deals with the transformation into a different format and export of output of an RBS case.
     """
 
-    # pylint: disable=too-many-arguments
-    def __init__(self, output_path, name, input_dict, output_dict, visualize, page_dict=None):
+    # pylint: disable=too-many-arguments,too-many-positional-arguments,too-many-instance-attributes
+    def __init__(self, output_path, name, input_dict, output_dict, visualize, page_dict=None, dependency_graph=None):
         page_dict = page_dict or {}
         self.output_path = Path(output_path)
         self.folder_name = ""
@@ -138,6 +138,8 @@ class MakeReport:
         self.visualize = visualize
         self.visualizer = ""
         self.page_dict = page_dict
+        # the dependency graph of the case, which draws the graphs of all key outputs
+        self.dependency_graph = dependency_graph
 
         # set a default
         self.page_selection = {
@@ -152,10 +154,12 @@ class MakeReport:
         }
         # update pages based on Excel
         self.page_selection = {
-            key: self.input_dict["configuration_value"][list(self.input_dict["configurations"]).index(key)].lower()
-            == "true"
-            if key in self.input_dict["configurations"]
-            else self.page_selection[key]
+            key: (
+                self.input_dict["configuration_value"][list(self.input_dict["configurations"]).index(key)].lower()
+                == "true"
+                if key in self.input_dict["configurations"]
+                else self.page_selection[key]
+            )
             for key in self.page_selection
         }
         # update pages based on hardcoded input
@@ -284,15 +288,20 @@ class MakeReport:
             if self.page_selection["report_" + input_tables]:
                 if input_tables == "key_outputs_theme":
                     input_tables = "key_outputs"
+                # the number of pages of 10 rows
                 if input_tables in ("decision_makers_options", "scenarios"):
-                    number_of_iterations = round((len(self.input_dict[input_tables[:-1] + "_value"][0]) / 10) + 0.5)
+                    number_of_iterations = max(-(-len(self.input_dict[input_tables[:-1] + "_value"][0]) // 10), 1)
                 else:
-                    number_of_iterations = round((len(self.input_dict[input_tables]) / 10) + 0.5)
+                    number_of_iterations = max(-(-len(self.input_dict[input_tables]) // 10), 1)
+                # all pages of the table are drawn at once, as images/table<input_tables><page number>.png
+                self.visualize(
+                    "table",
+                    "key_outputs_theme" if input_tables == "key_outputs" else input_tables,
+                    save=True,
+                    rows_per_page=10,
+                )
                 for number_iteration in range(0, number_of_iterations):
                     pdf.add_page()
-                    input_tables = "key_outputs_theme" if input_tables == "key_outputs" else input_tables
-                    self.visualize("table", input_tables, save=True, number_iteration=number_iteration)
-                    input_tables = "key_outputs" if input_tables == "key_outputs_theme" else input_tables
                     if number_of_iterations > 1:
                         pdf = chapter_title(
                             pdf,
@@ -318,12 +327,13 @@ class MakeReport:
 
         # Create for every key_output a dependency graph slide
         if self.page_selection["report_dependencies"]:
+            if self.dependency_graph is None:
+                self.dependency_graph = DependencyGraph(self.input_dict)
             for key_output in self.input_dict["key_outputs"]:
                 pdf.add_page()
                 pdf = chapter_title(pdf, f"The dependency graph for the key output: {key_output}", rgb)
 
-                dep = DependencyGraph(self.input_dict)
-                dep.draw_graph(selected_ko=key_output, save=True, sc_window_size="1920x1080")
+                self.dependency_graph.draw_graph(selected_ko=key_output, save=True, sc_window_size="1920x1080")
                 pdf.image("images/keyoutput_" + key_output + ".png", x=25, y=25, h=150)
                 pdf = footer_page(pdf, self.name)
 
@@ -1,17 +1,42 @@
-# pylint: disable=W0212
-
 """
 This module contains the Optimize class, which performs grid search optimization
 to maximize the appreciation of decision-maker options.
 """
 
 import math
+import os
+import time
+from contextlib import nullcontext
 from math import comb
-from itertools import combinations_with_replacement, permutations
+from itertools import islice
+from concurrent.futures import ProcessPoolExecutor, as_completed
 import numpy as np
-from vlinder.appreciate import Appreciate
-from vlinder.evaluate import Evaluate
-from vlinder.utils import suppress_print
+from vlinder.block_search import search_blocks, search_lattice_shard, subtract_ranges
+from vlinder.branch_and_bound import branch_and_bound, get_positions
+from vlinder.cache import EvaluationCache
+from vlinder.checkpoint import Checkpoint
+from vlinder.evolutionary import EvolutionarySearch
+from vlinder.lattice import SimplexLattice
+from vlinder.pattern_search import pattern_search
+from vlinder.progress import Progress
+from vlinder.scorer import CandidateScorer, OptimizeError
+from vlinder.separable import allocate_separable, is_separable
+from vlinder.session import OptimizerSession
+from vlinder.utils import hash_case, suppress_print
+
+
+def _neighborhood_offsets(num_internal_inputs):
+    """
+    This function creates the moves to the neighboring points on a lattice: one step is transferred from one internal
+    input to another, such that the total investment does not change.
+    :param num_internal_inputs: number of internal inputs
+    :return: integer array of shape (num_internal_inputs * (num_internal_inputs - 1), num_internal_inputs)
+    """
+    sources, targets = np.where(~np.eye(num_internal_inputs, dtype=bool))
+    offsets = np.zeros((len(sources), num_internal_inputs), dtype=int)
+    offsets[np.arange(len(sources)), sources] = -1
+    offsets[np.arange(len(sources)), targets] = 1
+    return offsets
 
 
 class Optimize:
@@ -20,10 +45,33 @@ class Optimize:
     that maximizes the appreciation value of decision-maker options.
     """
 
+    # pylint: disable=too-many-instance-attributes
     def __init__(self, input_dict, output_dict):
         self.input_dict = input_dict
         self.output_dict = output_dict
-        self.boundaries = None
+        self.session = None
+        self.evaluations = 0
+        self.rounds = []
+        self.objective = "weighted"
+        self.constraints = None
+        self.progress = Progress()
+        self.cache = None
+        # all available optimization methods, see optimize_single_scenario()
+        self.available_methods = {
+            "grid": self._optimize_with_grid_search,
+            "continuous": self._optimize_continuous,
+            "refine": self._optimize_refine,
+            "branch_and_bound": self._optimize_branch_and_bound,
+            "evolutionary": self._optimize_evolutionary,
+            "separable": self._optimize_separable,
+        }
+        # methods that can store their search in a checkpoint and resume from it
+        self.checkpoint_methods = ["grid", "evolutionary"]
+        # methods of which the size of the search follows from max_combinations, see _setup_search()
+        self.calibrated_methods = ["grid", "branch_and_bound", "separable"]
+        # without max_combinations and time_budget, the size of the search is at most 1,000,000 combinations per worker
+        # and at most the number of combinations that can be searched within default_time_budget seconds
+        self.default_time_budget = 10
 
     def find_dict_values(self, scenario):
         """
@@ -51,6 +99,61 @@ class Optimize:
 
         return best_dmo_data, max_investment
 
+    # pylint: disable=too-many-locals
+    def get_constraints(self, max_investment, lower_bounds=None, upper_bounds=None, steps=None):
+        """
+        This function collects the lower bound, upper bound and step of each internal input. Each of them is provided
+        as a dictionary {internal input: value}, or else in the configurations 'Optimize_lower_bound_<input>',
+        'Optimize_upper_bound_<input>' and 'Optimize_step_<input>'. Without bounds, an internal input can take any
+        value between 0 and max_investment. With a step, an internal input can only take multiples of that step.
+        Returns None if no internal input is constrained.
+        """
+        internal_inputs = list(self.input_dict["internal_variable_inputs"])
+        configurations = dict(zip(self.input_dict["configurations"], self.input_dict["configuration_value"]))
+        constraints, constrained = {}, False
+        for key, values, configuration, default in (
+            ("lower_bounds", lower_bounds, "Optimize_lower_bound", 0.0),
+            ("upper_bounds", upper_bounds, "Optimize_upper_bound", float(max_investment)),
+            ("steps", steps, "Optimize_step", 0.0),
+        ):
+            values = dict(values or {})
+            unknown = [name for name in values if name not in internal_inputs]
+            if unknown:
+                raise OptimizeError(f"{key} of unknown internal variable inputs: {unknown}")
+            for name in internal_inputs:
+                if name not in values and f"{configuration}_{name}" in configurations:
+                    values[name] = configurations[f"{configuration}_{name}"]
+            constrained = constrained or bool(values)
+            constraints[key] = np.array([float(values.get(name, default)) for name in internal_inputs])
+
+        if not constrained:
+            return None
+        for index, name in enumerate(internal_inputs):
+            if constraints["lower_bounds"][index] > constraints["upper_bounds"][index]:
+                raise OptimizeError(f"the lower bound of '{name}' exceeds its upper bound")
+            if constraints["steps"][index] < 0:
+                raise OptimizeError(f"the step of '{name}' should not be negative")
+        if not constraints["lower_bounds"].sum() <= max_investment <= constraints["upper_bounds"].sum():
+            raise OptimizeError(f"no distribution of {max_investment} satisfies the bounds of the internal inputs")
+        return constraints
+
+    def get_domains(self, max_investment, step_size):
+        """
+        This function creates the allowed values of each internal input: the multiples of its step (or of step_size if
+        it has no step) between its lower and upper bound.
+        """
+        num_internal_inputs = len(self.input_dict["internal_variable_inputs"])
+        constraints = self.constraints or {
+            "lower_bounds": np.zeros(num_internal_inputs),
+            "upper_bounds": np.full(num_internal_inputs, float(max_investment)),
+            "steps": np.zeros(num_internal_inputs),
+        }
+        domains = []
+        for lower, upper, step in zip(constraints["lower_bounds"], constraints["upper_bounds"], constraints["steps"]):
+            step = step if step > 0 else step_size
+            domains.append(step * np.arange(math.ceil(lower / step - 1e-9), math.floor(upper / step + 1e-9) + 1))
+        return domains
+
     @staticmethod
     def scale_max_investment(max_investment):
         """
@@ -95,118 +198,768 @@ class Optimize:
 
         return step_size
 
+    @staticmethod
+    def generate_lattice(max_investment, step_size, num_internal_inputs):
+        """
+        This function creates the lattice of all distributions of max_investment over the internal inputs in steps of
+        step_size. The number of steps is rounded to an integer, such that no distribution is missed due to floating
+        point errors.
+        """
+        return SimplexLattice(max_investment, round(max_investment / step_size), num_internal_inputs)
+
     @staticmethod
     def generate_combinations(max_investment, step_size, num_internal_inputs):
         """
         This function generates all valid combinations of internal input values whose sum equals max_investment.
         """
-        base_combinations = np.arange(0, max_investment + step_size, step_size)
-        valid_combinations = []
+        lattice = Optimize.generate_lattice(max_investment, step_size, num_internal_inputs)
+        return [tuple(point) for point in lattice.unrank(np.arange(lattice.size))]
 
-        # Generate combinations and filter those that sum to the max investment
-        for combination in combinations_with_replacement(base_combinations, num_internal_inputs):
-            if sum(combination) == max_investment:
-                # Add all unique permutations of the combination
-                for perm in set(permutations(combination)):
-                    valid_combinations.append(perm)
+    @staticmethod
+    def _generate_blocks(combinations, num_internal_inputs, block_size):
+        """
+        This function splits the combinations into blocks (arrays) of at most block_size combinations. Combinations of
+        which the length does not match the number of internal inputs are skipped.
+        """
+        if isinstance(combinations, SimplexLattice):
+            yield from combinations.chunks(block_size)
+            return
+
+        start = 0
+        iterator = iter(combinations)
+        while block := list(islice(iterator, block_size)):
+            block = [combination for combination in block if len(combination) == num_internal_inputs]
+            if block:
+                yield start, np.array(block, dtype=float)
+                start += len(block)
+
+    def _get_scorer(self, scenario, constrained=True, cached=True):
+        """
+        This function creates the scorer of the candidates of a search, which uses the evaluation cache if provided.
+        Searches that score each candidate once in large blocks do not use the cache (cached=False): the vectorized
+        scorer evaluates a candidate about as fast as the cache looks it up.
+        """
+        constraints = self.constraints if constrained else None
+        cache = self.cache if cached else None
+        return CandidateScorer(self._get_input_dict(), self.output_dict, scenario, self.objective, constraints, cache)
 
-        return valid_combinations
+    def _get_checkpoint_key(self, scenario, settings):
+        """
+        This helper function returns the key of a checkpoint: the hash of the case, the scenario, the objective and
+        the constraints, and the settings of the search.
+        """
+        return {
+            "case_hash": hash_case(self._get_input_dict(), scenario, self.objective, self.constraints),
+            **settings,
+        }
+
+    # pylint: disable=too-many-locals,too-many-arguments,too-many-positional-arguments
+    def _search_shards(self, scenario, lattice, shards, block_size, executor):
+        """
+        This function searches contiguous ranges (shards) of the lattice, each in a process of the executor. The
+        remaining time and evaluations of self.progress are divided over the shards, which report their progress when
+        they finish.
+        Returns a list with a tuple (best appreciated value, index of the best combination, best combination, index of
+        the first combination, number of evaluations) per shard.
+        """
+        remaining_seconds = self.progress.get_remaining_seconds()
+        remaining_evaluations = self.progress.get_remaining_evaluations() if self.progress.max_evaluations else None
+        budget = (
+            None if remaining_seconds is None else max(remaining_seconds, 1e-9),
+            None if remaining_evaluations is None else max(math.ceil(remaining_evaluations / len(shards)), 1),
+        )
+        futures = {
+            executor.submit(
+                search_lattice_shard,
+                self._get_input_dict(),
+                self.output_dict,
+                scenario,
+                self.objective,
+                self.constraints,
+                lattice,
+                start,
+                stop,
+                block_size,
+                budget,
+            ): start
+            for start, stop in shards
+        }
+        results = []
+        for future in as_completed(futures):
+            value, index, combination, evaluations = future.result()
+            results.append((value, index, combination, futures[future], evaluations))
+            self.progress.update(evaluations, value)
+        return results
+
+    # pylint: disable=too-many-locals,too-many-arguments,too-many-positional-arguments
+    def _search_lattice(self, scenario, lattice, block_size, workers, checkpoint=None):
+        """
+        This function searches the lattice in blocks of combinations, within this process or divided over contiguous
+        ranges that are searched by a pool of processes (workers). The best results are reduced deterministically: the
+        highest appreciated value wins and ties are broken by the lowest index, which gives the same result for any
+        number of processes.
+        With a Checkpoint, the lattice is searched in segments and after each segment the remaining ranges of the
+        lattice and the best combination so far are stored. A search of the same case and settings resumes from the
+        checkpoint.
+        Returns a tuple (best appreciated value, index of the best combination, best combination).
+        """
+        key = self._get_checkpoint_key(
+            scenario, {"method": "grid", "lattice": [float(lattice.total), lattice.units, lattice.num_parts]}
+        )
+        state = (checkpoint.load(key) if checkpoint is not None else None) or {
+            "remaining": [[0, lattice.size]],
+            "best_appreciated_value": -np.inf,
+            "best_index": -1,
+            "best_combination": None,
+            "evaluations": 0,
+        }
+        self.progress.total = sum(stop - start for start, stop in state["remaining"])
+        segment_size = lattice.size if checkpoint is None else block_size * workers * 10
+
+        scorer = None
+        with ProcessPoolExecutor(max_workers=workers) if workers > 1 else nullcontext() as executor:
+            while state["remaining"] and not self.progress.is_exhausted():
+                start = state["remaining"][0][0]
+                stop = min(state["remaining"][0][1], start + segment_size)
+                if executor is None or stop - start <= block_size:
+                    scorer = scorer or self._get_scorer(scenario, cached=False)
+                    evaluations = self.progress.evaluations
+                    buffer = None if self.session is None else self.session.get_buffer(block_size)
+                    result = search_blocks(scorer, lattice.chunks(block_size, start, stop, buffer), self.progress)
+                    results = [(*result, start, self.progress.evaluations - evaluations)]
+                else:
+                    bounds = np.linspace(start, stop, workers + 1).astype(int)
+                    shards = [
+                        (int(lower), int(upper)) for lower, upper in zip(bounds[:-1], bounds[1:]) if upper > lower
+                    ]
+                    results = self._search_shards(scenario, lattice, shards, block_size, executor)
+
+                for value, index, combination, _, _ in results:
+                    if combination is not None and (value, -index) > (
+                        state["best_appreciated_value"],
+                        -state["best_index"],
+                    ):
+                        state["best_appreciated_value"], state["best_index"] = float(value), int(index)
+                        state["best_combination"] = combination.tolist()
+                state["remaining"] = subtract_ranges(
+                    state["remaining"], [(first, first + evaluations) for _, _, _, first, evaluations in results]
+                )
+                state["evaluations"] += sum(evaluations for *_, evaluations in results)
+                if checkpoint is not None:
+                    checkpoint.save(key, state)
+
+        if checkpoint is not None:
+            checkpoint.save(key, state, force=True)
+        self.evaluations = state["evaluations"]
+        best_combination = state["best_combination"]
+        return (
+            state["best_appreciated_value"],
+            state["best_index"],
+            None if best_combination is None else np.array(best_combination, dtype=float),
+        )
+
+    def _get_input_dict(self):
+        """
+        This function returns the working copy of the case of the current optimization, or the case itself.
+        """
+        return self.input_dict if self.session is None else self.session.input_dict
+
+    def commit(self):
+        """
+        This function adds the result of the last optimization (the optimized DMO and the frozen boundaries) to the
+        case. Until then, the optimization does not change the input_dict of the case.
+        Returns the input_dict of the case with the optimized DMO.
+        """
+        if self.session is None:
+            raise OptimizeError("there is no optimization to commit")
+        self.input_dict = self.session.commit()
+        self.session = None
+        return self.input_dict
 
+    # pylint: disable=too-many-arguments,too-many-positional-arguments
     @suppress_print
-    def grid_search(self, scenario, combinations, opt_dmo_name, best_dmo_data):
+    def grid_search(
+        self, scenario, combinations, opt_dmo_name, best_dmo_data, block_size=10000, workers=1, checkpoint=None
+    ):
         """
         Performs a grid search over all possible combinations of internal input values.
-        The function evaluates each combination, calculates the appreciation value, and returns the best one.
-        """
-        # Get minimum and maximum values for the key outputs across all scenarios
-        self.boundaries = Appreciate(self.input_dict, self.output_dict)._get_start_and_end_points()
-
-        # Initialize the grid search decision-maker option
-        self.input_dict["decision_makers_options"] = np.array(
-            np.append(self.input_dict["decision_makers_options"], opt_dmo_name), dtype=object
-        )
-        self.input_dict["decision_makers_option_value"] = np.vstack(
-            [self.input_dict["decision_makers_option_value"], best_dmo_data["decision_maker_options"]]
-        )
-        self.input_dict["key_output_automatic"] = np.zeros(len(self.input_dict["key_output_automatic"]), dtype=int)
-        self.input_dict["key_output_start"] = np.array([value[0] for value in self.boundaries.values()])
-        self.input_dict["key_output_end"] = np.array([value[1] for value in self.boundaries.values()])
-
-        # Arrays to store results
-        appreciated_values = []
-        tmp_opt_decision_maker_options = None
-        tmp_opt_max_appreciated_value = -np.inf
-
-        # Evaluate each combination
-        for index, combination in enumerate(combinations):
-            comb_array = np.array(combination)
-
-            # Ensure the combination length matches the number of internal inputs
-            if len(comb_array) == len(self.input_dict["internal_variable_inputs"]):
-                self.input_dict["decision_makers_option_value"][
-                    np.where(self.input_dict["decision_makers_options"] == opt_dmo_name)[0][0]
-                ] = comb_array
-
-                # Evaluate and appreciate
-                output_dict = Evaluate(self.input_dict).evaluate_selected_scenario(scenario)[opt_dmo_name]
-                Appreciate(self.input_dict, output_dict).appreciate_single_decision_maker_option(output_dict)
-
-                # Compute the appreciated value
-                appreciated_value = output_dict["decision_makers_option_appreciation"]
-                appreciated_values.append((index, comb_array, appreciated_value))
-
-                # Update the best combination if this is the highest appreciation value
-                if appreciated_value > tmp_opt_max_appreciated_value:
-                    tmp_opt_max_appreciated_value = appreciated_value
-                    tmp_opt_decision_maker_options = comb_array
-
-        if tmp_opt_max_appreciated_value > best_dmo_data["max_appreciated_value"]:
-            self.input_dict["decision_makers_option_value"][
-                np.where(self.input_dict["decision_makers_options"] == opt_dmo_name)[0][0]
-            ] = tmp_opt_decision_maker_options
-            best_dmo = opt_dmo_name
-            best_appreciated_value = tmp_opt_max_appreciated_value
+        The function evaluates blocks of combinations at once, calculates the appreciation values, and returns the best
+        one. The combinations can be provided as an iterable of combinations or as a SimplexLattice. A lattice can be
+        searched by multiple processes (workers), where None uses all available CPUs, and can be resumed from a
+        Checkpoint. The search stops early when the budget of self.progress is exhausted.
+        """
+        is_lattice = isinstance(combinations, SimplexLattice)
+        if checkpoint is not None and not is_lattice:
+            raise OptimizeError("a checkpoint requires the combinations to be provided as a SimplexLattice")
+        self.session = OptimizerSession(self.input_dict, self.output_dict, opt_dmo_name, best_dmo_data)
+        self.progress.restart(combinations.size if is_lattice else None)
+
+        # Evaluate blocks of combinations and keep track of the best one, the boundaries and weights are frozen once
+        workers = os.cpu_count() if workers is None else workers
+        if is_lattice:
+            tmp_opt_max_appreciated_value, _, tmp_opt_decision_maker_options = self._search_lattice(
+                scenario, combinations, block_size, workers, checkpoint
+            )
         else:
-            self.input_dict["decision_makers_option_value"][
-                np.where(self.input_dict["decision_makers_options"] == opt_dmo_name)[0][0]
-            ] = best_dmo_data["decision_maker_options"]
-            best_dmo = best_dmo_data["dmo_name"]
-            best_appreciated_value = best_dmo_data["max_appreciated_value"]
+            scorer = self._get_scorer(scenario, cached=False)
+            tmp_opt_max_appreciated_value, _, tmp_opt_decision_maker_options = search_blocks(
+                scorer,
+                self._generate_blocks(combinations, len(self.input_dict["internal_variable_inputs"]), block_size),
+                self.progress,
+            )
+            self.evaluations = self.progress.evaluations
+
+        return self.session.store(tmp_opt_max_appreciated_value, tmp_opt_decision_maker_options, self.constraints)
+
+    def get_starting_points(self, max_investment):
+        """
+        This function creates the starting points of the continuous search: the distributions of all DMOs, rescaled
+        such that they sum to max_investment, followed by an equal spread of max_investment.
+        """
+        options = np.asarray(self._get_input_dict()["decision_makers_option_value"], dtype=float)
+        totals = options.sum(axis=1)
+        rescaled = options[totals > 0] * max_investment / totals[totals > 0, np.newaxis]
+        equal_spread = np.full(options.shape[1], max_investment / options.shape[1])
+
+        # remove duplicate starting points, but keep the order
+        unique_points = dict.fromkeys(tuple(point) for point in np.vstack([rescaled, equal_spread]))
+        return np.array(list(unique_points))
+
+    # pylint: disable=too-many-arguments,too-many-positional-arguments
+    @suppress_print
+    def continuous_search(
+        self, scenario, opt_dmo_name, best_dmo_data, max_investment, max_evaluations=10000, tolerance=1e-6
+    ):
+        """
+        Performs a continuous search for the best distribution of max_investment over the internal input values. A
+        pattern search is started from each (rescaled) DMO and the evaluations are divided over the starting points.
+        The search from a starting point stops when the step size becomes smaller than tolerance * max_investment.
+        """
+        starting_points = self.get_starting_points(max_investment)
+        self.session = OptimizerSession(self.input_dict, self.output_dict, opt_dmo_name, best_dmo_data)
+        scorer = self._get_scorer(scenario)
+
+        self.evaluations = 0
+        self.progress.restart(max_evaluations)
+        opt_appreciated_value, opt_decision_maker_options = -np.inf, None
+        for start in starting_points:
+            value, point, evaluations = pattern_search(
+                scorer,
+                start,
+                max_investment / 4,
+                tolerance * max_investment,
+                max(max_evaluations // len(starting_points), 1),
+                self.progress,
+            )
+            self.evaluations += evaluations
+            if value > opt_appreciated_value:
+                opt_appreciated_value, opt_decision_maker_options = value, point
+            if self.progress.is_exhausted():
+                break
+
+        return self.session.store(opt_appreciated_value, opt_decision_maker_options, self.constraints)
+
+    # pylint: disable=too-many-locals
+    @suppress_print
+    def refine_search(self, scenario, opt_dmo_name, best_dmo_data, max_investment, **kwargs):
+        """
+        Performs an adaptive coarse-to-fine grid search. A coarse grid (of at most initial_combinations combinations)
+        is evaluated first. In each next round the step size is halved and the neighbors of the top_n best combinations
+        found so far are evaluated. The search stops when the best appreciation improves less than tolerance in a
+        round, or after max_rounds rounds. The number of evaluations and timing per round are stored in self.rounds.
+        """
+        top_n, tolerance = kwargs.get("top_n", 5), kwargs.get("tolerance", 1e-4)
+        num_internal_inputs = len(self.input_dict["internal_variable_inputs"])
+        step_size = self.calculate_step_size(
+            max_investment,
+            self.scale_max_investment(max_investment),
+            num_internal_inputs,
+            kwargs.get("initial_combinations", 1000),
+        )
+        lattice = self.generate_lattice(max_investment, step_size, num_internal_inputs)
+        self.session = OptimizerSession(self.input_dict, self.output_dict, opt_dmo_name, best_dmo_data)
+        scorer = self._get_scorer(scenario)
+
+        self.rounds = []
+        self.progress.restart()
+        offsets = _neighborhood_offsets(num_internal_inputs)
+        candidates = lattice.unrank(np.arange(lattice.size))
+        pool, pool_values = np.empty((0, num_internal_inputs)), np.empty(0)
+        while candidates.size and len(self.rounds) < kwargs.get("max_rounds", 20):
+            start_time = time.perf_counter()
+            previous_best = pool_values[0] if pool_values.size else -np.inf
+
+            # keep the top_n of all evaluated combinations (the earliest found in case of ties)
+            if self.progress.max_evaluations is not None:
+                candidates = candidates[: self.progress.max_evaluations - self.progress.evaluations]
+            pool = np.vstack([pool, candidates])
+            pool_values = np.concatenate([pool_values, scorer.score(candidates)])
+            order = np.argsort(-pool_values, kind="stable")[:top_n]
+            pool, pool_values = pool[order], pool_values[order]
+
+            self.rounds.append(
+                {
+                    "step_size": step_size,
+                    "evaluations": len(candidates),
+                    "best_appreciated_value": float(pool_values[0]),
+                    "seconds": time.perf_counter() - start_time,
+                }
+            )
+            if self.progress.update(len(candidates), pool_values[0]) or pool_values[0] - previous_best < tolerance:
+                break
+
+            # re-grid the neighborhoods of the best combinations with half the step size
+            step_size /= 2
+            candidates = (pool[:, np.newaxis, :] + step_size * offsets[np.newaxis, :, :]).reshape(
+                -1, num_internal_inputs
+            )
+            candidates = np.unique(candidates[np.all(candidates >= 0, axis=1)], axis=0)
 
-        return best_dmo, best_appreciated_value
+        self.evaluations = sum(refinement_round["evaluations"] for refinement_round in self.rounds)
+        return self.session.store(float(pool_values[0]), pool[0], self.constraints)
 
-    def optimize_single_scenario(self, scenario, tmp_opt_dmo_name, max_combinations):
+    # pylint: disable=too-many-arguments,too-many-positional-arguments
+    @suppress_print
+    def branch_and_bound_search(
+        self, scenario, opt_dmo_name, best_dmo_data, max_investment, step_size, block_size=10000
+    ):
         """
-        Wrapper function that performs the full grid search optimization process.
-        It retrieves values, calculates the step size, generates valid combinations,
-        and finds the best distribution of internal inputs to maximize appreciation.
+        Performs a branch-and-bound search over the distributions of max_investment in which each internal input takes
+        one of its allowed values (see get_domains()). The best (rescaled) DMO that satisfies the constraints is used
+        as initial solution. Partial distributions that are infeasible or of which the upper bound of the appreciation
+        does not exceed the best distribution found so far are pruned, see branch_and_bound().
         """
+        domains = self.get_domains(max_investment, step_size)
+        starting_points = self.get_starting_points(max_investment)
+        self.session = OptimizerSession(self.input_dict, self.output_dict, opt_dmo_name, best_dmo_data)
+        scorer = self._get_scorer(scenario, cached=False)
+
+        values = scorer.score(starting_points)
+        incumbent = (float(values.max()), starting_points[values.argmax()])
+        self.progress.restart()
+        self.progress.update(len(starting_points), incumbent[0])
+        opt_appreciated_value, opt_decision_maker_options, evaluations = branch_and_bound(
+            scorer, domains, max_investment, incumbent, block_size, self.progress
+        )
+        self.evaluations = len(starting_points) + evaluations
+        return self.session.store(opt_appreciated_value, opt_decision_maker_options, self.constraints)
+
+    @suppress_print
+    def separable_search(self, scenario, opt_dmo_name, best_dmo_data, max_investment, step_size):
+        """
+        Performs an exact search for the best distribution of max_investment of a separable case (see is_separable()),
+        in which each internal input takes one of its allowed values (see get_domains()). The contribution of each
+        value of an internal input is its appreciation while all other internal inputs are zero, minus the
+        appreciation of zero investments. The best distribution follows from dynamic programming over the budget, see
+        allocate_separable(). Raises an OptimizeError if the dynamic program cannot find it.
+        """
+        domains = self.get_domains(max_investment, step_size)
+        self.session = OptimizerSession(self.input_dict, self.output_dict, opt_dmo_name, best_dmo_data)
+        # the constraints are part of the domains, so zero investments are appreciated as well
+        scorer = self._get_scorer(scenario, constrained=False)
+
+        self.progress.restart()
+        rows = np.cumsum([1] + [len(domain) for domain in domains])
+        candidates = np.zeros((rows[-1], len(domains)))
+        for index, domain in enumerate(domains):
+            start, stop = rows[index], rows[index + 1]
+            candidates[start:stop, index] = domain
+        values = scorer.score(candidates)
+        result = allocate_separable(np.split(values[1:] - values[0], rows[1:-1] - 1), domains, max_investment)
+
+        if result is None:
+            raise OptimizeError(
+                "the budget cannot be distributed over the allowed values of the internal inputs in a common unit "
+                "within the limit of the separable search"
+            )
+        opt_decision_maker_options = result[1]
+        opt_appreciated_value = float(scorer.score(opt_decision_maker_options[np.newaxis])[0])
+        self.evaluations = len(candidates) + 1
+        self.progress.update(self.evaluations, opt_appreciated_value)
+        return self.session.store(opt_appreciated_value, opt_decision_maker_options, self.constraints)
+
+    # pylint: disable=too-many-arguments,too-many-positional-arguments
+    @suppress_print
+    def evolutionary_search(
+        self, scenario, opt_dmo_name, best_dmo_data, max_investment, generations=200, checkpoint=None, **kwargs
+    ):
+        """
+        Performs an evolutionary search for the best distribution of max_investment over the internal input values
+        (see EvolutionarySearch), with the options population_size, mutation_rate, concentration, elite,
+        migration_interval and seed. Each (rescaled) DMO starts an island of the population. The search stops after
+        the given number of generations or before a generation that does not fit in the budget of self.progress, and
+        is resumed from the Checkpoint if provided.
+        """
+        starting_points = self.get_starting_points(max_investment)
+        self.session = OptimizerSession(self.input_dict, self.output_dict, opt_dmo_name, best_dmo_data)
+        scorer = self._get_scorer(scenario)
+        options = {
+            key: kwargs[key]
+            for key in ["mutation_rate", "concentration", "elite", "migration_interval", "seed"]
+            if key in kwargs
+        }
+        search = EvolutionarySearch(scorer, **options)
+        population_size = kwargs.get("population_size", 50)
+        key = self._get_checkpoint_key(
+            scenario,
+            {"method": "evolutionary", "budget": float(max_investment), "population_size": population_size, **options},
+        )
+
+        self.progress.restart()
+        state = checkpoint.load(key) if checkpoint is not None else None
+        if state is None:
+            evaluations = search.initialize(starting_points, population_size)
+            self.progress.update(evaluations, search.get_best()[0])
+        else:
+            search.set_state(state)
+        while search.generation < generations and not self.progress.is_exhausted():
+            remaining_evaluations = self.progress.get_remaining_evaluations()
+            if remaining_evaluations is not None and remaining_evaluations < search.get_generation_size():
+                break
+            self.progress.update(search.step(), search.get_best()[0])
+            if checkpoint is not None:
+                checkpoint.save(key, search.get_state())
+
+        if checkpoint is not None:
+            checkpoint.save(key, search.get_state(), force=True)
+        self.evaluations = search.evaluations
+        return self.session.store(*search.get_best(), self.constraints)
+
+    def _optimize_with_grid_search(
+        self,
+        scenario,
+        opt_dmo_name,
+        best_dmo_data,
+        max_investment,
+        max_combinations=1000000,
+        workers=1,
+        checkpoint=None,
+        checkpoint_interval=60,
+        **_kwargs,
+    ):
+        """
+        This function performs a grid search over a lattice of which the step size is based on max_combinations. If a
+        checkpoint (path of a file) is provided, the search is stored every checkpoint_interval seconds and resumed
+        from the file if it exists.
+        """
+        if max_combinations is None:
+            # a search with a calibrated number of combinations resumes on the lattice of its checkpoint
+            lattice = self._get_checkpoint_lattice(checkpoint)
+        else:
+            # Scale down the maximum investment for more efficient combinatorial calculations
+            scaled_max_investment = self.scale_max_investment(max_investment)
+
+            # Find the optimal step size for generating combinations
+            step_size = self.calculate_step_size(
+                max_investment,
+                scaled_max_investment,
+                len(self.input_dict["internal_variable_inputs"]),
+                max_combinations,
+            )
+
+            # Create the lattice of all valid combinations of internal input values (generated lazily)
+            lattice = self.generate_lattice(
+                max_investment, step_size, len(self.input_dict["internal_variable_inputs"])
+            )
+
+        # Perform grid search over the generated combinations and fill in input_dict
+        return self.grid_search(
+            scenario,
+            lattice,
+            opt_dmo_name,
+            best_dmo_data,
+            workers=workers,
+            checkpoint=None if checkpoint is None else Checkpoint(checkpoint, checkpoint_interval),
+        )
+
+    def _optimize_continuous(
+        self, scenario, opt_dmo_name, best_dmo_data, max_investment, max_evaluations=10000, tolerance=1e-6, **_kwargs
+    ):
+        """
+        This function performs a continuous search, with at most max_evaluations evaluations.
+        """
+        return self.continuous_search(
+            scenario, opt_dmo_name, best_dmo_data, max_investment, max_evaluations, tolerance
+        )
+
+    def _optimize_refine(self, scenario, opt_dmo_name, best_dmo_data, max_investment, **kwargs):
+        """
+        This function performs an adaptive coarse-to-fine grid search.
+        """
+        return self.refine_search(scenario, opt_dmo_name, best_dmo_data, max_investment, **kwargs)
+
+    # pylint: disable=too-many-arguments,too-many-positional-arguments
+    def _optimize_separable(
+        self,
+        scenario,
+        opt_dmo_name,
+        best_dmo_data,
+        max_investment,
+        max_combinations=1000000,
+        fallback="grid",
+        **kwargs,
+    ):
+        """
+        This function performs an exact search of a separable case, where internal inputs without a step take
+        multiples of a step size such that the dynamic program takes about max_combinations operations. Other cases,
+        and cases of which the budget and the allowed values have no common unit that the dynamic program can handle
+        (e.g. the steps of some internal inputs do not fit the step size), are optimized with the fallback method.
+        """
+        if fallback not in self.available_methods or fallback == "separable":
+            methods = [method for method in self.available_methods if method != "separable"]
+            raise OptimizeError(f"fallback method '{fallback}' not available. Choose from {methods}")
+
+        units = max(math.isqrt(max_combinations // len(self.input_dict["internal_variable_inputs"])), 1)
+        if not is_separable(self.input_dict, scenario, self.objective):
+            print(f"The case is not separable, it is optimized with method '{fallback}'")
+        elif get_positions(self.get_domains(max_investment, max_investment / units), max_investment) is None:
+            print(
+                "The allowed values of the internal inputs have no common unit for the separable search, it is "
+                f"optimized with method '{fallback}'"
+            )
+        else:
+            return self.separable_search(scenario, opt_dmo_name, best_dmo_data, max_investment, max_investment / units)
+        return self.available_methods[fallback](
+            scenario, opt_dmo_name, best_dmo_data, max_investment, max_combinations=max_combinations, **kwargs
+        )
+
+    def _optimize_branch_and_bound(
+        self, scenario, opt_dmo_name, best_dmo_data, max_investment, max_combinations=1000000, **_kwargs
+    ):
+        """
+        This function performs a branch-and-bound search, where internal inputs without a step take multiples of the
+        step size of the grid search with max_combinations.
+        """
+        step_size = self.calculate_step_size(
+            max_investment,
+            self.scale_max_investment(max_investment),
+            len(self.input_dict["internal_variable_inputs"]),
+            max_combinations,
+        )
+        return self.branch_and_bound_search(scenario, opt_dmo_name, best_dmo_data, max_investment, step_size)
+
+    # pylint: disable=too-many-arguments,too-many-positional-arguments
+    def _optimize_evolutionary(
+        self,
+        scenario,
+        opt_dmo_name,
+        best_dmo_data,
+        max_investment,
+        generations=200,
+        checkpoint=None,
+        checkpoint_interval=60,
+        **kwargs,
+    ):
+        """
+        This function performs an evolutionary search of at most generations generations. If a checkpoint (path of a
+        file) is provided, the search is stored every checkpoint_interval seconds and resumed from the file if it
+        exists.
+        """
+        return self.evolutionary_search(
+            scenario,
+            opt_dmo_name,
+            best_dmo_data,
+            max_investment,
+            generations,
+            None if checkpoint is None else Checkpoint(checkpoint, checkpoint_interval),
+            **kwargs,
+        )
+
+    def calibrate_max_combinations(self, scenario, max_investment, seconds, sample_size=10000):
+        """
+        This function measures how many combinations are generated and evaluated per second on this machine, and
+        returns the number of combinations that can be searched within the given number of seconds (at least the
+        number of internal inputs).
+        """
+        num_internal_inputs = len(self.input_dict["internal_variable_inputs"])
+        lattice = self.generate_lattice(max_investment, max_investment / 10, num_internal_inputs)
+        scorer = CandidateScorer(self.input_dict, self.output_dict, scenario, self.objective, self.constraints)
+        # the first evaluation includes one-time costs, so it is not measured
+        scorer.score(lattice.unrank([0]))
+
+        indices = np.random.default_rng(0).integers(0, lattice.size, sample_size)
+        start_time = time.perf_counter()
+        scorer.score(lattice.unrank(indices))
+        seconds_per_combination = max(time.perf_counter() - start_time, 1e-9) / sample_size
+        return max(int(seconds / seconds_per_combination), num_internal_inputs)
+
+    @staticmethod
+    def _get_checkpoint_lattice(checkpoint):
+        """
+        This function returns the lattice of the grid search that is stored in the checkpoint file (a path), or None
+        if there is no such checkpoint.
+        """
+        stored = None if checkpoint is None else Checkpoint(checkpoint).read()
+        if stored is None or stored["key"].get("method") != "grid":
+            return None
+        return SimplexLattice(*stored["key"]["lattice"])
+
+    def _finish_search(self):
+        """
+        This function reports the end of a search, writes the evaluation cache to its file, if it has one and it has
+        been used, and commits the result to the case.
+        """
+        self.progress.finish()
+        if self.cache is not None and self.cache.path is not None and self.cache.hits + self.cache.misses:
+            self.cache.save()
+        self.commit()
+
+    # pylint: disable=too-many-arguments,too-many-positional-arguments
+    def _setup_search(self, scenario, method, max_investment, max_combinations, kwargs):
+        """
+        This function prepares a search: it collects the constraints, the budget and the evaluation cache (an
+        EvaluationCache or the path of its file) of the search from kwargs (these options are removed from kwargs).
+        Without max_combinations, the number of combinations is calibrated to the number of combinations that all
+        workers can search within the time_budget on this machine. Without a time_budget, it is 1,000,000 per worker,
+        or fewer if they cannot be searched within the default_time_budget. The calibration differs per run, so a grid
+        search that resumes from a checkpoint is not calibrated again but continues on the lattice of the checkpoint.
+        Returns the maximum number of combinations, or None if the grid search resumes on the lattice of its
+        checkpoint.
+        """
+        if kwargs.get("checkpoint") is not None and method not in self.checkpoint_methods:
+            raise OptimizeError(
+                f"method '{method}' cannot be resumed from a checkpoint. Choose from {self.checkpoint_methods}"
+            )
+        self.constraints = self.get_constraints(
+            max_investment,
+            kwargs.pop("lower_bounds", None),
+            kwargs.pop("upper_bounds", None),
+            kwargs.pop("steps", None),
+        )
+        cache = kwargs.pop("cache", None)
+        self.cache = EvaluationCache(path=cache) if isinstance(cache, (str, os.PathLike)) else cache
+        time_budget = kwargs.pop("time_budget", None)
+        self.progress = Progress(
+            time_budget,
+            kwargs.get("max_evaluations"),
+            kwargs.pop("callback", None),
+            kwargs.pop("progress_interval", 1),
+        )
+        # all processes search combinations during the time budget
+        workers = kwargs.get("workers", 1) or os.cpu_count()
+        if max_combinations is not None or method not in self.calibrated_methods:
+            return max_combinations or 1000000 * workers
+        if method == "grid" and self._get_checkpoint_lattice(kwargs.get("checkpoint")) is not None:
+            return None
+        if time_budget is None:
+            return min(
+                1000000 * workers,
+                self.calibrate_max_combinations(scenario, max_investment, self.default_time_budget * workers),
+            )
+        return self.calibrate_max_combinations(scenario, max_investment, time_budget * workers)
+
+    def optimize_single_scenario(self, scenario, tmp_opt_dmo_name, max_combinations=None, method="grid", **kwargs):
+        """
+        Wrapper function that performs the full optimization process.
+        It retrieves values and finds the best distribution of internal inputs to maximize appreciation with one of the
+        available methods:
+        - 'grid': generates all valid combinations with a step size based on max_combinations and evaluates all of
+        them. The combinations are divided over multiple processes if workers > 1 (None uses all available CPUs).
+        - 'continuous': a pattern search on all distributions of the budget, starting from the existing DMOs and
+        limited by max_evaluations (default: 10000).
+        - 'refine': a coarse grid (initial_combinations, default: 1000) that is refined around the top_n (default: 5)
+        best combinations with halved step sizes, until the improvement is less than tolerance (default: 1e-4) or after
+        max_rounds (default: 20) rounds.
+        - 'branch_and_bound': searches the same distributions as 'grid', but prunes all partial distributions that
+        cannot improve the best distribution found so far, based on bounds of the key outputs.
+        - 'separable': solves a case of which each key output depends on at most one internal input exactly by dynamic
+        programming, with a step size such that it takes about max_combinations operations. Other cases are optimized
+        with the fallback method (default: 'grid').
+        - 'evolutionary': a genetic algorithm on all distributions of the budget of which the first generation contains
+        the existing DMOs, for many internal inputs. It stops after generations (default: 200) generations of
+        population_size (default: 50) distributions, and is reproducible with a seed.
+        Each internal input can be constrained with lower_bounds, upper_bounds and steps (see get_constraints()).
+        'branch_and_bound' only generates distributions that satisfy the constraints, the other methods skip all
+        distributions that do not satisfy them.
+        All methods stop early and return the best distribution found so far when the time_budget (in seconds) or
+        max_evaluations is exhausted. The callback is called with a progress event (see Progress) at most once every
+        progress_interval (default: 1) seconds and when the search ends. Without max_combinations, the number of
+        combinations of 'grid', 'branch_and_bound' and 'separable' is calibrated such that they can be searched within
+        the time_budget on this machine. Without a time_budget, it is 1,000,000 per worker, or fewer if they cannot be
+        searched within the default_time_budget (10 seconds).
+        The 'grid' and 'evolutionary' searches are stored in the checkpoint file (a path) at most once every
+        checkpoint_interval (default: 60) seconds and when the search ends. A search of the same case with the same
+        settings resumes from the checkpoint, e.g. after an interruption or when the budget was exhausted.
+        With a cache (an EvaluationCache, or the path of its file), the 'continuous', 'refine', 'separable' and
+        'evolutionary' methods look up distributions that have been evaluated before instead of evaluating them again.
+        'grid' and 'branch_and_bound' evaluate each distribution once in large blocks, which is about as fast as
+        looking it up, so they do not use the cache.
+        """
+        if method not in self.available_methods:
+            raise OptimizeError(f"method '{method}' not available. Choose from {list(self.available_methods)}")
+
         if tmp_opt_dmo_name in self.input_dict["decision_makers_options"]:
             print("This DMO name already exits, please choose another")
             return self.input_dict
 
-        # Step 1: Retrieve values and setup boundaries
+        # Step 1: Retrieve values, constraints and setup boundaries
         best_dmo_data, max_investment = self.find_dict_values(scenario)
+        max_combinations = self._setup_search(scenario, method, max_investment, max_combinations, kwargs)
 
-        # Step 2: Scale down the maximum investment for more efficient combinatorial calculations
-        scaled_max_investment = self.scale_max_investment(max_investment)
-
-        # TO DO: max_combinations based on CPU
-        # Step 3: Find the optimal step size for generating combinations
-        step_size = self.calculate_step_size(
-            max_investment, scaled_max_investment, len(self.input_dict["internal_variable_inputs"]), max_combinations
+        # Step 2: Search for the best distribution with the selected method and fill in input_dict
+        best_dmo, best_appreciated_value = self.available_methods[method](
+            scenario, tmp_opt_dmo_name, best_dmo_data, max_investment, max_combinations=max_combinations, **kwargs
         )
+        self._finish_search()
+
+        self._print_results(f"For scenario: {scenario}", best_dmo_data, best_dmo, best_appreciated_value)
+        return self.input_dict
+
+    def find_best_dmo_all_scenarios(self, objective):
+        """
+        This function finds the DMO with the highest value of the objective over all scenarios.
+        """
+        scorer = CandidateScorer(self.input_dict, self.output_dict, None, objective)
+        values = scorer.score(self.input_dict["decision_makers_option_value"])
+        index = int(values.argmax())
+
+        best_dmo_data = {
+            "dmo_name": self.input_dict["decision_makers_options"][index],
+            "decision_maker_options": self.input_dict["decision_makers_option_value"][index],
+            "max_appreciated_value": float(values[index]),
+        }
+        return best_dmo_data, sum(best_dmo_data["decision_maker_options"])
 
-        # Step 4: Generate all valid combinations of internal input values
-        combinations = self.generate_combinations(
-            max_investment, step_size, len(self.input_dict["internal_variable_inputs"])
+    def optimize_all_scenarios(
+        self, tmp_opt_dmo_name, objective="weighted", max_combinations=None, method="grid", **kwargs
+    ):
+        """
+        Wrapper function that performs the full optimization process over all scenarios at once. Each combination is
+        evaluated in all scenarios in a single pass, and the combinations are compared on one of the objectives:
+        - 'weighted': the scenario-weighted appreciation (the sum of the 'scenario_appreciations')
+        - 'worst_case': the lowest appreciation over all scenarios
+        - 'regret': minus the maximum regret, where the regret in a scenario is the difference with the best existing
+        DMO in that scenario
+        The available methods and their options are the same as for optimize_single_scenario().
+        """
+        if method not in self.available_methods:
+            raise OptimizeError(f"method '{method}' not available. Choose from {list(self.available_methods)}")
+
+        if tmp_opt_dmo_name in self.input_dict["decision_makers_options"]:
+            print("This DMO name already exits, please choose another")
+            return self.input_dict
+
+        # Step 1: Retrieve the best DMO for the objective, constraints and setup boundaries
+        best_dmo_data, max_investment = self.find_best_dmo_all_scenarios(objective)
+        self.objective = objective
+        max_combinations = self._setup_search(None, method, max_investment, max_combinations, kwargs)
+
+        # Step 2: Search for the best distribution with the selected method and fill in input_dict
+        best_dmo, best_appreciated_value = self.available_methods[method](
+            None, tmp_opt_dmo_name, best_dmo_data, max_investment, max_combinations=max_combinations, **kwargs
         )
+        self._finish_search()
 
-        # Step 5: Perform grid search over the generated combinations and fill in input_dict
-        best_dmo, best_appreciated_value = self.grid_search(scenario, combinations, tmp_opt_dmo_name, best_dmo_data)
+        self._print_results(
+            f"For all scenarios, objective: {objective}", best_dmo_data, best_dmo, best_appreciated_value
+        )
+        return self.input_dict
 
-        # Print the results
-        print("For scenario: ", scenario)
+    def _print_results(self, description, best_dmo_data, best_dmo, best_appreciated_value):
+        """
+        This function prints the initial and optimized appreciation and the corresponding distributions.
+        """
+        print(description)
         print("------------------------------------")
         print(
             "Initial best appreciation:",
@@ -240,5 +993,3 @@ class Optimize:
             "Total increase appreciated value:",
             round(best_appreciated_value - best_dmo_data["max_appreciated_value"], 2),
         )
-
-        return self.input_dict
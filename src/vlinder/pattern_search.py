@@ -0,0 +1,50 @@
+"""
+This file contains the pattern search over the distributions of a budget, a derivative-free local search that moves
+parts of the budget between the internal variable inputs.
+"""
+
+import numpy as np
+
+
+# pylint: disable=too-many-arguments,too-many-positional-arguments,too-many-locals
+def pattern_search(scorer, start, step_size, min_step_size, max_evaluations, progress=None):
+    """
+    This function performs a derivative-free pattern search on the simplex {x >= 0, sum(x) = budget}. All moves that
+    transfer step_size from one internal input to another are evaluated at once. The best improving move is taken,
+    if no move improves the appreciation the step size is halved.
+    :param scorer: a CandidateScorer
+    :param start: starting point of which the sum equals the budget
+    :param step_size: initial amount that is transferred between two internal inputs
+    :param min_step_size: the search stops when the step size becomes smaller than this value
+    :param max_evaluations: the search stops when this number of evaluations is reached
+    :param progress: an (optional) Progress, the search also stops when its budget is exhausted
+    :return: a tuple (best appreciated value, best point, number of evaluations)
+    """
+    point = np.asarray(start, dtype=float)
+    value = float(scorer.score(point[np.newaxis])[0])
+    evaluations = 1
+    if progress is not None:
+        progress.update(1, value)
+
+    # all ordered pairs (source, target) of internal inputs
+    sources, targets = np.where(~np.eye(len(point), dtype=bool))
+    moves = np.arange(len(sources))
+    while step_size >= min_step_size and evaluations < max_evaluations:
+        amounts = np.minimum(step_size, point[sources])
+        candidates = np.repeat(point[np.newaxis], len(sources), axis=0)
+        candidates[moves, sources] -= amounts
+        candidates[moves, targets] += amounts
+        candidates = candidates[amounts > 0][: max_evaluations - evaluations]
+        if candidates.size == 0:
+            break
+
+        values = scorer.score(candidates)
+        evaluations += len(candidates)
+        best_index = values.argmax()
+        if values[best_index] > value:
+            point, value = candidates[best_index], float(values[best_index])
+        else:
+            step_size /= 2
+        if progress is not None and progress.update(len(candidates), value):
+            break
+    return value, point, evaluations
@@ -0,0 +1,132 @@
+"""
+This file contains the Progress class that keeps track of the progress of an optimization, reports it periodically and
+signals when the time or evaluation budget of the optimization is exhausted.
+"""
+
+import time
+import numpy as np
+
+
+class ProgressError(Exception):
+    """
+    This class deals with the error handling of the progress of an optimization.
+    """
+
+    def __init__(self, message):  # ignore warning about super-init | pylint: disable=W0231
+        self.message = message
+
+    def __str__(self):
+        return f"Progress Error: {self.message}"
+
+
+class Progress:
+    """
+    The Progress class counts the evaluations and the best appreciation found so far. At most once per interval (in
+    seconds) a progress event is passed to the callback, which is a dictionary of type:
+    {
+        "evaluations": number of evaluations so far,
+        "best_appreciated_value": best appreciation so far,
+        "evaluations_per_second": average number of evaluations per second,
+        "elapsed_seconds": seconds since the start,
+        "remaining_seconds": estimated number of seconds until the search or the budget ends (None if unknown),
+        "finished": whether the search has ended,
+    }
+    """
+
+    def __init__(self, time_budget=None, max_evaluations=None, callback=None, interval=1.0):
+        if time_budget is not None and time_budget <= 0:
+            raise ProgressError(f"the time budget should be positive, not {time_budget}")
+        if max_evaluations is not None and max_evaluations <= 0:
+            raise ProgressError(f"the maximum number of evaluations should be positive, not {max_evaluations}")
+        self.time_budget = time_budget
+        self.max_evaluations = max_evaluations
+        self.callback = callback
+        self.interval = interval
+        self.total = None
+        self.start_time = self.last_event_time = time.perf_counter()
+        self.evaluations = 0
+        self.best_appreciated_value = -np.inf
+
+    def restart(self, total=None):
+        """
+        This function resets the clock and the counters at the start of a search.
+        :param total: the number of evaluations of the full search, if known
+        :return: None
+        """
+        self.total = total
+        self.start_time = self.last_event_time = time.perf_counter()
+        self.evaluations = 0
+        self.best_appreciated_value = -np.inf
+
+    def get_elapsed_seconds(self) -> float:
+        """This helper function returns the number of seconds since the start of the search."""
+        return time.perf_counter() - self.start_time
+
+    def get_remaining_evaluations(self):
+        """
+        This function returns the number of evaluations that are left until the evaluation budget or the full search
+        ends, or None if neither is known.
+        """
+        limits = [limit for limit in (self.max_evaluations, self.total) if limit is not None]
+        return max(min(limits) - self.evaluations, 0) if limits else None
+
+    def get_remaining_seconds(self) -> float or None:
+        """
+        This helper function returns the time left within the time budget, or None if there is no time budget.
+        """
+        return None if self.time_budget is None else max(self.time_budget - self.get_elapsed_seconds(), 0)
+
+    def is_exhausted(self) -> bool:
+        """This function returns whether the time or evaluation budget is exhausted."""
+        remaining_seconds = self.get_remaining_seconds()
+        out_of_time = remaining_seconds is not None and remaining_seconds <= 0
+        out_of_evaluations = self.max_evaluations is not None and self.evaluations >= self.max_evaluations
+        return out_of_time or out_of_evaluations
+
+    def get_event(self, finished=False) -> dict:
+        """
+        This function creates a progress event. The remaining time is estimated from the average number of evaluations
+        per second and is limited by the time budget.
+        :param finished: whether the search has ended
+        :return: dictionary with the progress of the search
+        """
+        elapsed_seconds = self.get_elapsed_seconds()
+        evaluations_per_second = self.evaluations / elapsed_seconds if elapsed_seconds > 0 else 0.0
+
+        estimates = [self.get_remaining_seconds()]
+        remaining_evaluations = self.get_remaining_evaluations()
+        if remaining_evaluations is not None and evaluations_per_second > 0:
+            estimates.append(remaining_evaluations / evaluations_per_second)
+        estimates = [estimate for estimate in estimates if estimate is not None]
+
+        return {
+            "evaluations": self.evaluations,
+            "best_appreciated_value": float(self.best_appreciated_value),
+            "evaluations_per_second": evaluations_per_second,
+            "elapsed_seconds": elapsed_seconds,
+            "remaining_seconds": 0.0 if finished else (min(estimates) if estimates else None),
+            "finished": finished,
+        }
+
+    def update(self, evaluations: int, best_appreciated_value: float) -> bool:
+        """
+        This function registers evaluations and the best appreciation so far, and passes a progress event to the
+        callback if the interval has passed since the previous event.
+        :param evaluations: number of new evaluations
+        :param best_appreciated_value: the best appreciation found so far
+        :return: whether the budget is exhausted, such that the search should stop
+        """
+        self.evaluations += int(evaluations)
+        self.best_appreciated_value = max(self.best_appreciated_value, best_appreciated_value)
+        if self.callback is not None and time.perf_counter() - self.last_event_time >= self.interval:
+            self.last_event_time = time.perf_counter()
+            self.callback(self.get_event())
+        return self.is_exhausted()
+
+    def finish(self) -> None:
+        """
+        This function passes the final progress event to the callback.
+        :return: None
+        """
+        if self.callback is not None:
+            self.callback(self.get_event(finished=True))
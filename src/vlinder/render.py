@@ -0,0 +1,281 @@
+"""
+This file contains the TableRenderer class, which draws tables as PNG images with matplotlib, for example the pages of
+the input variable tables of a report, the FigurePool class, which reuses matplotlib figures for the charts of
+Visualize, and the GraphRenderer class, which draws static images of dependency graphs.
+"""
+
+import copy
+import io
+from concurrent.futures import ProcessPoolExecutor
+import numpy as np
+import pandas as pd
+from pandas.io.formats.style import Styler
+from matplotlib.backends.backend_agg import FigureCanvasAgg
+from matplotlib.figure import Figure
+from matplotlib.patches import FancyArrowPatch
+from vlinder.utils import number_formatter
+
+
+def _render_tables(tables, options):
+    """
+    This helper function renders a list of tables within a worker process.
+    :param tables: list of tuples (dataframe, title)
+    :param options: keyword arguments of the TableRenderer
+    :return: list with the PNG bytes of each table
+    """
+    renderer = TableRenderer(**options)
+    return [renderer.render(dataframe, title).getvalue() for dataframe, title in tables]
+
+
+class TableRenderer:
+    """
+    The TableRenderer class draws pandas DataFrames, or their Stylers, as table images. All tables are drawn on the
+    same matplotlib figure (without pyplot), which is cleared between tables, so drawing many tables only sets up
+    matplotlib once. A Styler is drawn with its display values and caption, such as the styled tables of Visualize,
+    numeric values of a DataFrame are formatted with number_formatter.
+    """
+
+    def __init__(self, fontsize=10, dpi=150, header_color="#295477", stripe_color="#EEF3F8"):
+        self.options = {"fontsize": fontsize, "dpi": dpi, "header_color": header_color, "stripe_color": stripe_color}
+        self.figure = Figure(dpi=dpi)
+        FigureCanvasAgg(self.figure)
+
+    @staticmethod
+    def _get_cells(table) -> tuple:
+        """
+        This function returns the text of the header and the cells of a table. The cells of a pandas Styler are its
+        display values (such as the number formatting of Visualize._table_styler), without the index, numeric values of
+        a DataFrame are formatted with number_formatter. Background colours of a Styler are not drawn.
+        :param table: a pd.DataFrame or a Styler of a pd.DataFrame
+        :return: tuple (list with the text of each column, list of rows with the text of each cell)
+        """
+        if isinstance(table, Styler):
+            # a copy, such that the index of the styler of the caller is not hidden
+            header, *rows = copy.copy(table).hide(axis="index").to_string(delimiter="\x1f").split("\n")
+            return header.split("\x1f") if len(table.columns) else [], [
+                row.split("\x1f") for row in rows[: len(table.data)]
+            ]
+
+        columns = [
+            (
+                table[column].map(number_formatter)
+                if pd.api.types.is_numeric_dtype(table[column])
+                else table[column].astype(str)
+            )
+            for column in table.columns
+        ]
+        return [str(column) for column in table.columns], [list(row) for row in zip(*columns)] if columns else []
+
+    def _draw(self, header: list, cells: list, title: str) -> io.BytesIO:
+        """
+        This function draws a table with a bold header row and an optional title above it.
+        :param header: the text of each column
+        :param cells: list of rows with the text of each cell
+        :param title: title above the table
+        :return: an in-memory PNG image
+        """
+        self.figure.clear()
+        # a table without rows is drawn as its header with an empty row
+        cells = cells or [[""] * len(header)]
+        # size the figure to the number of characters of the widest cell of each column (a character is about 0.6
+        # times the font size wide) and to the number of rows (a row is about twice the font size high)
+        widths = np.array([len(column) + 2 for column in header] or [1], dtype=float)
+        for row in cells:
+            widths = np.maximum(widths, [len(cell) + 2 for cell in row])
+        points = self.options["fontsize"] / 72
+        row_height = 2 * points
+        title_height = 2.5 * points if title else 0
+        height = row_height * (len(cells) + 1) + title_height
+        # the figure has exactly the size of the table and title, so it is drawn once (bbox_inches="tight" would draw
+        # it twice to measure it)
+        self.figure.set_size_inches(max(0.6 * points * widths.sum(), 2), height)
+
+        axis = self.figure.add_axes((0, 0, 1, 1))
+        axis.axis("off")
+        table = axis.table(
+            cellText=cells,
+            colLabels=header,
+            colWidths=list(widths / widths.sum()),
+            cellLoc="left",
+            bbox=(0, 0, 1, 1 - title_height / height),
+        )
+        table.auto_set_font_size(False)
+        table.set_fontsize(self.options["fontsize"])
+        for (row, _), cell in table.get_celld().items():
+            cell.set_edgecolor("white")
+            if row == 0:
+                cell.set_facecolor(self.options["header_color"])
+                cell.set_text_props(color="white", weight="bold")
+            elif row % 2 == 0:
+                cell.set_facecolor(self.options["stripe_color"])
+        if title:
+            self.figure.text(
+                0.01,
+                1 - title_height / height / 2,
+                title,
+                va="center",
+                color="#777777",
+                fontsize=self.options["fontsize"] + 2,
+            )
+
+        buffer = io.BytesIO()
+        self.figure.savefig(buffer, format="png", dpi=self.options["dpi"])
+        buffer.seek(0)
+        return buffer
+
+    @staticmethod
+    def _get_title(table, title) -> str:
+        """
+        This helper function returns the title of a table, by default the caption of a Styler.
+        """
+        if title is None:
+            title = table.caption if isinstance(table, Styler) else ""
+        return title or ""
+
+    def render(self, table, title: str = None) -> io.BytesIO:
+        """
+        This function draws a table with a bold header row and an optional title above it.
+        :param table: the table to draw, a pd.DataFrame or a Styler (see _get_cells), its columns are the header
+        :param title: title above the table, by default the caption of a Styler
+        :return: an in-memory PNG image
+        """
+        return self._draw(*self._get_cells(table), self._get_title(table, title))
+
+    def render_pages(self, table, title: str = None, rows_per_page: int = 10) -> list:
+        """
+        This function draws a table on consecutive pages of at most rows_per_page rows. The cells are formatted once
+        for all pages.
+        :param table: the table to draw, a pd.DataFrame or a Styler (see _get_cells)
+        :param title: title above every page, by default the caption of a Styler
+        :return: list with an in-memory PNG image of each page
+        """
+        header, cells = self._get_cells(table)
+        title = self._get_title(table, title)
+        pages = []
+        for start in range(0, max(len(cells), 1), rows_per_page):
+            stop = start + rows_per_page
+            pages.append(self._draw(header, cells[start:stop], title))
+        return pages
+
+    def render_many(self, tables, workers: int = 1) -> list:
+        """
+        This function draws many tables, divided over worker processes if workers > 1.
+        :param tables: list of tuples (dataframe, title)
+        :param workers: number of processes
+        :return: list with an in-memory PNG image of each table, in the order of tables
+        """
+        tables = list(tables)
+        if workers <= 1 or len(tables) <= 1:
+            return [self.render(dataframe, title) for dataframe, title in tables]
+
+        # contiguous parts keep the order of the tables, each process sets up its own figure once
+        bounds = np.linspace(0, len(tables), min(workers, len(tables)) + 1).astype(int)
+        with ProcessPoolExecutor(max_workers=workers) as executor:
+            futures = [
+                executor.submit(_render_tables, tables[start:stop], self.options)
+                for start, stop in zip(bounds[:-1], bounds[1:])
+            ]
+            return [io.BytesIO(image) for future in futures for image in future.result()]
+
+
+class FigurePool:
+    """
+    The FigurePool class keeps a matplotlib figure for every figure size that has been requested. The figures are drawn
+    with the non-interactive Agg canvas instead of pyplot, so they work without a display and are not registered in
+    (nor have to be closed from) the pyplot state. A figure is cleared when it is requested again, such that drawing
+    many charts of the same size only creates one figure.
+    """
+
+    def __init__(self, dpi=100):
+        self.dpi = dpi
+        self.figures = {}
+
+    def get_figure(self, figsize=(10, 5)) -> Figure:
+        """
+        This function returns an empty figure of the requested size.
+        :param figsize: tuple (width, height) in inches
+        :return: a cleared matplotlib figure
+        """
+        figure = self.figures.get(tuple(figsize))
+        if figure is None:
+            figure = Figure(figsize=figsize, dpi=self.dpi)
+            FigureCanvasAgg(figure)
+            self.figures[tuple(figsize)] = figure
+        figure.clear()
+        return figure
+
+    @staticmethod
+    def to_png(figure: Figure, **kwargs) -> io.BytesIO:
+        """
+        This function draws a figure as a PNG image.
+        :param figure: the figure to draw
+        :param kwargs: keyword arguments of Figure.savefig, e.g. bbox_inches="tight"
+        :return: an in-memory PNG image
+        """
+        buffer = io.BytesIO()
+        figure.savefig(buffer, format="png", **kwargs)
+        buffer.seek(0)
+        return buffer
+
+
+class GraphRenderer:  # pylint: disable=too-few-public-methods
+    """
+    The GraphRenderer class draws a directed graph with fixed node positions as a static image, without a browser.
+    Nodes are drawn as black dots with their label above them and edges as orange arrows, like the interactive
+    dependency graphs.
+    """
+
+    def __init__(self, width=1920, height=1080, dpi=100, fontsize=9):
+        self.dpi = dpi
+        self.fontsize = fontsize
+        self.figure = Figure(figsize=(width / dpi, height / dpi), dpi=dpi)
+        FigureCanvasAgg(self.figure)
+
+    def render(self, network, pos: dict, image_format: str = "png") -> io.BytesIO:
+        """
+        This function draws a graph on the figure of the renderer.
+        :param network: a networkx graph, or any object with nodes and edges
+        :param pos: dictionary with the (x, y) position of each node, y increases downwards (like on a screen)
+        :param image_format: "png" or "svg"
+        :return: an in-memory image
+        """
+        self.figure.clear()
+        axis = self.figure.add_axes((0, 0, 1, 1))
+        axis.axis("off")
+        points = {node: (float(pos[node][0]), -float(pos[node][1])) for node in network.nodes}
+        for source, target in network.edges:
+            axis.add_patch(
+                FancyArrowPatch(
+                    points[source],
+                    points[target],
+                    arrowstyle="-|>",
+                    mutation_scale=8,
+                    color="darkorange",
+                    linewidth=0.8,
+                    shrinkA=3,
+                    shrinkB=3,
+                )
+            )
+        if points:
+            x_values, y_values = zip(*points.values())
+            axis.scatter(x_values, y_values, s=12, color="black", zorder=3)
+        for node, (x_value, y_value) in points.items():
+            axis.annotate(
+                str(node),
+                (x_value, y_value),
+                xytext=(0, 4),
+                textcoords="offset points",
+                ha="center",
+                va="bottom",
+                fontsize=self.fontsize,
+                fontfamily="sans-serif",
+            )
+        # leave room for the labels of the outer nodes
+        axis.margins(x=0.1, y=0.05)
+
+        buffer = io.BytesIO()
+        # a graph is mostly white space, which the fastest PNG compression already compresses well
+        kwargs = {"pil_kwargs": {"compress_level": 1}} if image_format == "png" else {}
+        self.figure.savefig(buffer, format=image_format, dpi=self.dpi, **kwargs)
+        buffer.seek(0)
+        return buffer
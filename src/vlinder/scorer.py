@@ -0,0 +1,172 @@
+"""
+This file contains the CandidateScorer class, which calculates the appreciation of blocks of candidate distributions
+of the internal variable inputs for all optimization methods, and the OptimizeError of the optimization.
+"""
+
+import numpy as np
+from vlinder.aggregate import expected_appreciation, worst_case
+from vlinder.appreciate import Appreciate
+from vlinder.evaluate import Evaluate
+from vlinder.utils import hash_case
+
+
+class OptimizeError(Exception):
+    """
+    This class deals with the error handling of the optimization.
+    """
+
+    def __init__(self, message):  # ignore warning about super-init | pylint: disable=W0231
+        self.message = message
+
+    def __str__(self):
+        return f"Optimize Error: {self.message}"
+
+
+def is_feasible(candidates, constraints, tolerance=1e-6):
+    """
+    This function checks which candidates satisfy the constraints on the internal inputs.
+    :param candidates: array of shape (n, number of internal variable inputs)
+    :param constraints: dictionary with arrays 'lower_bounds', 'upper_bounds' and 'steps' (0 if a value can take any
+    value between its bounds) as returned by Optimize.get_constraints()
+    :param tolerance: allowed deviation due to floating point errors
+    :return: boolean array of length n
+    """
+    candidates = np.asarray(candidates, dtype=float)
+    within_bounds = (candidates >= constraints["lower_bounds"] - tolerance) & (
+        candidates <= constraints["upper_bounds"] + tolerance
+    )
+    steps = np.where(constraints["steps"] > 0, constraints["steps"], 1)
+    on_steps = (constraints["steps"] == 0) | (np.abs(candidates - np.round(candidates / steps) * steps) <= tolerance)
+    return np.all(within_bounds & on_steps, axis=1)
+
+
+class CandidateScorer:
+    """
+    The CandidateScorer class calculates the appreciation of blocks of candidate internal input values for a single
+    scenario or, if no scenario is provided, an objective over all scenarios. The boundaries and weights of the
+    appreciation are determined once, when the scorer is created. Candidates that do not satisfy the (optional)
+    constraints get an appreciation of -inf. With an (optional) EvaluationCache, candidates that have been scored
+    before are looked up instead of evaluated again.
+    """
+
+    # pylint: disable=too-many-instance-attributes
+
+    # pylint: disable=too-many-arguments,too-many-positional-arguments
+    def __init__(self, input_dict, output_dict, scenario, objective="weighted", constraints=None, cache=None):
+        self.scenario = scenario
+        self.constraints = constraints
+        self.scenarios = list(input_dict["scenarios"])
+        self.evaluate = Evaluate(input_dict)
+        self.appreciate = Appreciate(input_dict, output_dict)
+        self.weights = np.array(self.appreciate.calculate_weights())
+        self.smaller_the_better = np.asarray(input_dict["key_output_smaller_the_better"], dtype=bool)
+        # all available objectives over the appreciations of all scenarios, see score()
+        self.available_objectives = {
+            "weighted": lambda matrix: expected_appreciation(matrix, input_dict["scenario_weight"]),
+            "worst_case": worst_case,
+            "regret": lambda matrix: -(self.reference[:, np.newaxis] - matrix).max(axis=0),
+        }
+        if scenario is None and objective not in self.available_objectives:
+            raise OptimizeError(
+                f"objective '{objective}' not available. Choose from {list(self.available_objectives)}"
+            )
+        self.objective = objective
+        # the regret is calculated with respect to the best existing DMO in each scenario
+        self.reference = None
+        if scenario is None and objective == "regret":
+            self.reference = self.score_scenarios(input_dict["decision_makers_option_value"]).max(axis=1)
+        self.cache = cache
+        self.case_key = self.get_case_key(input_dict) if cache is not None else None
+
+    def get_case_key(self, input_dict) -> str:
+        """
+        This function calculates a hash of everything the score of a candidate depends on: the dependencies and inputs
+        of the case, the boundaries of the appreciation and the weights, the scenario and the objective. Text elements,
+        configurations and the existing DMOs are left out, as they only affect the score through the boundaries and the
+        regret reference, which are included.
+        :param input_dict: dictionary of the case
+        :return: hexadecimal SHA-256 hash
+        """
+        ignored = ["generic_text_elements", "generic_text_element_value", "case_text_elements"]
+        ignored += ["case_text_element_value", "configurations", "configuration_value"]
+        ignored += ["decision_makers_options", "decision_makers_option_value"]
+        case = {key: value for key, value in input_dict.items() if key not in ignored}
+        return hash_case(
+            case,
+            self.appreciate.start_and_end_points,
+            self.weights,
+            self.scenario,
+            self.objective if self.scenario is None else None,
+            self.reference,
+        )
+
+    def score_scenarios(self, candidates):
+        """
+        This function evaluates and appreciates a block of candidates in all scenarios at once.
+        :param candidates: array of shape (n, number of internal variable inputs)
+        :return: array of shape (scenarios, n) with the decision makers option appreciation of each candidate
+        """
+        return self._appreciate_scenarios(self.evaluate.evaluate_scenarios(self.scenarios, candidates))
+
+    def _appreciate_scenarios(self, key_output_values):
+        """
+        This helper function appreciates key output values of shape (scenarios, n, number of key outputs).
+        :return: array of shape (scenarios, n) with the decision makers option appreciation of each candidate
+        """
+        appreciations = self.appreciate.appreciate_key_outputs(key_output_values.reshape(-1, len(self.weights)))
+        return (appreciations * self.weights).sum(axis=1).reshape(len(self.scenarios), -1)
+
+    def _calculate(self, candidates):
+        """
+        This helper function evaluates and appreciates a block of candidates.
+        :return: a tuple (array with the score of each candidate, array of shape (n, number of key outputs), or (n,
+        scenarios, number of key outputs) if no scenario is provided, with the key output values)
+        """
+        if self.scenario is None:
+            key_output_values = self.evaluate.evaluate_scenarios(self.scenarios, candidates)
+            matrix = self._appreciate_scenarios(key_output_values)
+            return self.available_objectives[self.objective](matrix), key_output_values.transpose(1, 0, 2)
+
+        key_output_values = self.evaluate.evaluate_internal_variable_inputs(self.scenario, candidates)
+        appreciations = self.appreciate.appreciate_key_outputs(key_output_values)
+        return (appreciations * self.weights).sum(axis=1), key_output_values
+
+    def score(self, candidates):
+        """
+        This function evaluates and appreciates a block of candidates at once.
+        :param candidates: array of shape (n, number of internal variable inputs)
+        :return: array with the decision makers option appreciation of each candidate in the scenario, or the value of
+        the objective over all scenarios if no scenario is provided
+        """
+        if self.cache is None:
+            values = self._calculate(candidates)[0]
+        else:
+            candidates = np.asarray(candidates, dtype=float)
+            values, found = self.cache.lookup(self.case_key, candidates)
+            if not found.all():
+                missing = candidates[~found]
+                values[~found], key_output_values = self._calculate(missing)
+                self.cache.store(self.case_key, missing, values[~found], key_output_values)
+
+        if self.constraints is not None:
+            values = np.where(is_feasible(candidates, self.constraints), values, -np.inf)
+        return values
+
+    def upper_bound(self, lower, upper):
+        """
+        This function calculates an upper bound of the appreciation of all candidates within boxes, i.e. each internal
+        input can take any value between its lower and upper bound. The key output values are bounded with interval
+        arithmetic over the dependencies. As all appreciation curves are monotone (non-decreasing, or non-increasing if
+        smaller is better) and all objectives are non-decreasing in the appreciations, the bound of each key output
+        that gives the highest appreciation also gives an upper bound of the objective.
+        :param lower: array of shape (n, number of internal variable inputs) with the lower bounds of the boxes
+        :param upper: array of shape (n, number of internal variable inputs) with the upper bounds of the boxes
+        :return: array with an upper bound of the score() of each box
+        """
+        scenarios = self.scenarios if self.scenario is None else [self.scenario]
+        key_output_lower, key_output_upper = self.evaluate.evaluate_scenario_intervals(scenarios, lower, upper)
+        # a negatively weighted key output contributes most with its lowest appreciation
+        best_values = np.where(self.smaller_the_better ^ (self.weights < 0), key_output_lower, key_output_upper)
+        appreciations = self.appreciate.appreciate_key_outputs(best_values.reshape(-1, len(self.weights)))
+        matrix = (appreciations * self.weights).sum(axis=1).reshape(len(scenarios), -1)
+        return matrix[0] if self.scenario is not None else self.available_objectives[self.objective](matrix)
@@ -0,0 +1,90 @@
+"""
+This file contains the analysis of the separability of a case and the exact optimization of separable cases. A case is
+separable if each key output depends on at most one internal variable input. The appreciation of a distribution is
+then the appreciation of zero investments plus a contribution of each internal variable input, which only depends on
+the value of that internal variable input, and the best distribution follows from dynamic programming over the budget.
+"""
+
+import numpy as np
+from vlinder.branch_and_bound import get_positions
+
+
+def find_internal_dependencies(input_dict: dict) -> dict:
+    """
+    This function determines on which internal variable inputs each variable depends, by following the dependencies
+    (destination = argument_1 operator argument_2) in their order of calculation.
+    :param input_dict: dictionary of the case
+    :return: dictionary {variable: set of internal variable inputs}
+    """
+    dependencies = {internal: {internal} for internal in input_dict["internal_variable_inputs"]}
+    for destination, argument_1, argument_2 in zip(
+        input_dict["destination"], input_dict["argument_1"], input_dict["argument_2"]
+    ):
+        # a destination can occur multiple times, its values are added
+        dependencies[destination] = (
+            dependencies.get(destination, set())
+            | dependencies.get(argument_1, set())
+            | dependencies.get(argument_2, set())
+        )
+    return dependencies
+
+
+def is_separable(input_dict: dict, scenario, objective="weighted") -> bool:
+    """
+    This function checks whether the appreciation of a case is separable: each key output depends on at most one
+    internal variable input. Over all scenarios (scenario is None) only the 'weighted' objective, a sum over the
+    scenarios, is separable.
+    :param input_dict: dictionary of the case
+    :param scenario: the selected scenario, or None for all scenarios
+    :param objective: objective over all scenarios
+    :return: whether the appreciation is separable
+    """
+    if scenario is None and objective != "weighted":
+        return False
+    dependencies = find_internal_dependencies(input_dict)
+    return all(len(dependencies.get(key_output, set())) <= 1 for key_output in input_dict["key_outputs"])
+
+
+# pylint: disable=too-many-locals
+def allocate_separable(contributions, domains, budget, max_operations=10**8):
+    """
+    This function finds the distribution of the budget with the highest sum of contributions, in which each internal
+    input takes one of the values of its domain. The dynamic program keeps the best sum of contributions for each
+    total that can be distributed over the first internal inputs, which takes (number of totals) x (number of values
+    of all domains) operations.
+    :param contributions: list with an array of the contribution of each value of the domain of each internal input
+    :param domains: list with an array of the allowed values of each internal input
+    :param budget: the total of each distribution
+    :param max_operations: limit on the size of the calculation
+    :return: a tuple (best sum of contributions, best distribution), or None if the budget cannot be distributed or
+    the calculation exceeds max_operations
+    """
+    result = get_positions(domains, budget, max_operations)
+    if result is None:
+        return None
+    _, size, positions = result
+
+    best = np.full(size, -np.inf)
+    best[0] = 0.0
+    choices = []
+    for contribution, position in zip(contributions, positions):
+        extended, choice = np.full(size, -np.inf), np.full(size, -1)
+        for index in np.flatnonzero(position < size):
+            shift = position[index]
+            # the first value wins in case of ties
+            candidates = best[: size - shift] + contribution[index]
+            improved = candidates > extended[shift:]
+            extended[shift:][improved] = candidates[improved]
+            choice[shift:][improved] = index
+        best = extended
+        choices.append(choice)
+    if best[-1] == -np.inf:
+        return None
+
+    # trace the choices back from the full budget
+    distribution, total = np.zeros(len(domains)), size - 1
+    for index in range(len(domains) - 1, -1, -1):
+        choice = choices[index][total]
+        distribution[index] = domains[index][choice]
+        total -= positions[index][choice]
+    return float(best[-1]), distribution
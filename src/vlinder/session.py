@@ -0,0 +1,85 @@
+"""
+This file contains the OptimizerSession class, which holds the state of a single optimization without changing the
+case that is optimized.
+"""
+
+import numpy as np
+from vlinder.appreciate import Appreciate
+from vlinder.scorer import OptimizeError, is_feasible
+
+
+class OptimizerSession:
+    """
+    The OptimizerSession class keeps a working copy of the case during an optimization: the case with the optimized
+    decision-maker option (initialised as the best DMO) and the boundaries of the appreciation frozen to the minimum
+    and maximum key output values of the original case. The working copy shares all other arrays with the case, which
+    is not changed, so multiple sessions can optimize the same case at the same time. The session also keeps a
+    preallocated buffer for the blocks of candidates of the search. The result only becomes part of a case with
+    commit().
+    """
+
+    def __init__(self, input_dict, output_dict, opt_dmo_name, best_dmo_data):
+        self.opt_dmo_name = opt_dmo_name
+        self.best_dmo_data = best_dmo_data
+        # Get minimum and maximum values for the key outputs across all scenarios
+        self.boundaries = Appreciate(input_dict, output_dict).get_start_and_end_points()
+        # use floats, such that distributions with non-integer values are not truncated
+        self.input_dict = {
+            **input_dict,
+            "decision_makers_options": np.array(
+                np.append(input_dict["decision_makers_options"], opt_dmo_name), dtype=object
+            ),
+            "decision_makers_option_value": np.vstack(
+                [input_dict["decision_makers_option_value"], best_dmo_data["decision_maker_options"]]
+            ).astype(float),
+            "key_output_automatic": np.zeros(len(input_dict["key_output_automatic"]), dtype=int),
+            "key_output_start": np.array([value[0] for value in self.boundaries.values()]),
+            "key_output_end": np.array([value[1] for value in self.boundaries.values()]),
+        }
+        self.buffer = np.empty((0, len(input_dict["internal_variable_inputs"])))
+        self.result = None
+
+    def get_buffer(self, block_size: int) -> np.ndarray:
+        """
+        This function returns a buffer for blocks of at most block_size candidates. The buffer is only reallocated
+        when a larger block is requested, so all blocks of a search are written into the same memory.
+        :param block_size: maximum number of candidates per block
+        :return: array of shape (at least block_size, number of internal variable inputs)
+        """
+        if len(self.buffer) < block_size:
+            self.buffer = np.empty((block_size, self.buffer.shape[1]))
+        return self.buffer
+
+    def store(self, opt_appreciated_value, opt_decision_maker_options, constraints=None):
+        """
+        This function stores the optimized distribution of internal input values in the working copy if it improves
+        the appreciation of the best DMO (or if the best DMO does not satisfy the constraints), otherwise the
+        distribution of the best DMO is stored.
+        :param opt_appreciated_value: appreciation of the optimized distribution
+        :param opt_decision_maker_options: the optimized distribution
+        :param constraints: (optional) constraints on the internal inputs, see Optimize.get_constraints()
+        :return: a tuple (name of the best DMO, appreciation of the best DMO)
+        """
+        initial_appreciated_value = self.best_dmo_data["max_appreciated_value"]
+        if (
+            constraints is not None
+            and not is_feasible([self.best_dmo_data["decision_maker_options"]], constraints).all()
+        ):
+            # any distribution that satisfies the constraints improves a best DMO that does not
+            initial_appreciated_value = -np.inf
+
+        if opt_appreciated_value > initial_appreciated_value:
+            self.input_dict["decision_makers_option_value"][-1] = opt_decision_maker_options
+            self.result = (self.opt_dmo_name, opt_appreciated_value)
+        else:
+            self.input_dict["decision_makers_option_value"][-1] = self.best_dmo_data["decision_maker_options"]
+            self.result = (self.best_dmo_data["dmo_name"], self.best_dmo_data["max_appreciated_value"])
+        return self.result
+
+    def commit(self) -> dict:
+        """
+        This function returns the case with the optimized decision-maker option, after the result has been stored.
+        """
+        if self.result is None:
+            raise OptimizeError("the optimization has not stored a result yet, nothing to commit")
+        return self.input_dict
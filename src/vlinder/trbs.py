@@ -18,6 +18,8 @@ from vlinder.case_exporter import CaseExporter
 from vlinder.case_importer import CaseImporter
 from vlinder.evaluate import Evaluate
 from vlinder.appreciate import Appreciate
+from vlinder.aggregate import Aggregate
+from vlinder.dominance import Dominance
 from vlinder.visualize import Visualize, DependencyGraph
 from vlinder.make_report import MakeReport
 from vlinder.optimize import Optimize
@@ -52,6 +54,7 @@ class TheResponsibleBusinessSimulator:
     dependencies and calculate appreciations.
     """
 
+    # pylint: disable=too-many-instance-attributes
     def __init__(self, name, file_path=None, file_extension=None):
         self.file_path = file_path if file_path is not None else Path(os.path.dirname(vl.__file__)) / "data"
         self.file_extension = file_extension if file_extension is not None else "xlsx"
@@ -60,11 +63,18 @@ class TheResponsibleBusinessSimulator:
         self.dataframe_dict = {}
         self.output_dict = {}
         self.visualizer = None
+        self.visualizer_version = None
+        self.dependency_graph = None
+        self.dependency_graph_version = None
         self.exporter = None
         self.report = None
+        # the Optimize of the last optimization, with its number of evaluations (and rounds of the refine method)
+        self.optimizer = None
 
         self.possible_status = {0: "build", 1: "evaluate", 2: "appreciate", 3: "optimize"}
         self.status = {}
+        # the state version advances with every change of the input_dict or output_dict, see visualize()
+        self.state_version = 0
 
     def __str__(self):
         input_data_formatted = (
@@ -107,6 +117,7 @@ class TheResponsibleBusinessSimulator:
         """
         self.status[status_to_set] = self.possible_status[status_to_set]
         self.status = {key: value for key, value in self.status.items() if key <= status_to_set}
+        self.state_version += 1
 
     def copy(self):
         """
@@ -137,15 +148,54 @@ class TheResponsibleBusinessSimulator:
         case_appreciation.appreciate_all_scenarios()
         self._set_and_reset_status(2)
 
+    def analyse_dominance(self, scenario, level="key_output"):
+        """
+        This function determines which decision makers options are on the Pareto front for a given scenario.
+        :param scenario: the selected scenario of the case
+        :param level: compare the decision makers options on 'key_output' or 'theme' appreciations
+        :return: a dataframe with the dominance analysis per decision makers option
+        """
+        self._status_check([0, 1, 2])
+        return Dominance(self.input_dict, self.output_dict).analyse(scenario, level)
+
+    def aggregate(self, optimism=0.5):
+        """
+        This function compares the decision makers options across all scenarios on several decision criteria.
+        :param optimism: weight of the best case in the Hurwicz criterion, between 0 and 1
+        :return: a dataframe with the decision criteria per decision makers option
+        """
+        self._status_check([0, 1, 2])
+        return Aggregate(self.input_dict, self.output_dict).aggregate(optimism)
+
+    def _get_dependency_graph(self):
+        """
+        This function returns the dependency graph of the case, which is built once and reused for all key outputs
+        until the state version of the case changes.
+        """
+        if self.dependency_graph is None or self.dependency_graph_version != self.state_version:
+            self.dependency_graph = DependencyGraph(self.input_dict)
+            self.dependency_graph_version = self.state_version
+        return self.dependency_graph
+
     def visualize(self, visual_request, key, **kwargs):
-        """This function deals with the visualizations of the outcomes"""
+        """
+        This function deals with the visualizations of the outcomes. The visualizer (with its prepared data) is reused
+        until the state version of the case changes.
+        """
         # currently only checks for build, some visuals will also need evaluate and/or appreciate
         self._status_check([0])
-        if visual_request == "dependency_graph":
-            dependency_tree = DependencyGraph(self.input_dict)
-            return dependency_tree.draw_graph(key, **kwargs)
-
-        self.visualizer = Visualize(self.input_dict, self.output_dict, self._get_options())
+        dependency_graph_requests = {
+            "dependency_graph": "draw_graph",
+            "dependency_graph_image": "save_static_image",
+            "dependency_graph_screenshot": "save_screenshot",
+            "dependency_graph_lod": "draw_level_of_detail",
+        }
+        if visual_request in dependency_graph_requests:
+            return getattr(self._get_dependency_graph(), dependency_graph_requests[visual_request])(key, **kwargs)
+
+        if self.visualizer is None or self.visualizer_version != self.state_version:
+            self.visualizer = Visualize(self.input_dict, self.output_dict, self._get_options())
+            self.visualizer_version = self.state_version
         return self.visualizer.create_visual(visual_request, key, **kwargs)
 
     def transform(self, requested_format, output_path=None):
@@ -171,6 +221,7 @@ class TheResponsibleBusinessSimulator:
         index = np.where(self.input_dict[master_key] == element_key)
         old_value = self.input_dict[input_dict_key][index]
         self.input_dict[input_dict_key][index] = new_value
+        self.state_version += 1
         print(f"The weight for {element_key} in {input_dict_key} is changed from {old_value[0]} to {new_value}.")
 
     def make_report(self, scenario, page_dict=None, output_path=Path.cwd() / "reports/"):
@@ -182,29 +233,50 @@ class TheResponsibleBusinessSimulator:
         page_dict = {} if not page_dict else page_dict
         # Do not show the graphs in notebook when making a report
         matplotlib.pyplot.ioff()
-        self.report = MakeReport(output_path, self.name, self.input_dict, self.output_dict, self.visualize, page_dict)
+        self.report = MakeReport(
+            output_path,
+            self.name,
+            self.input_dict,
+            self.output_dict,
+            self.visualize,
+            page_dict,
+            dependency_graph=self._get_dependency_graph(),
+        )
         location_report = self.report.create_report(scenario, output_path)
         print(location_report)
 
     def optimize(self, scenario, **kwargs):
         """
         This function deals with finding the optimal distribution of decision maker options.
-        :param scenario: the selected scenario of the case
+        :param scenario: the selected scenario of the case, or None to optimize over all scenarios at once
+        :param kwargs: optional 'new_dmo_name', 'new_case_name', 'objective' ('weighted', 'worst_case' or 'regret', if
+        scenario is None), 'method' ('grid', 'continuous', 'refine', 'branch_and_bound', 'evolutionary' or
+        'separable'), the options of the method, the constraints 'lower_bounds', 'upper_bounds' and 'steps', the budget
+        'time_budget', 'max_evaluations' and 'callback', the 'checkpoint' to resume from and the evaluation 'cache'.
+        See the documentation for all options. The Optimize of the search is kept as self.optimizer, with the number of
+        evaluations (and the rounds of the 'refine' method).
         """
         self._status_check([0, 1, 2])
         case_optimizer = Optimize(self.input_dict, self.output_dict)
+        self.optimizer = case_optimizer
 
         try:
             index = list(self.input_dict["configurations"]).index("Optimize_DMO_name")
             optimized_dmo_name = self.input_dict["configuration_value"][index]
-
-            if pd.isna(optimized_dmo_name):
-                raise CaseError("Optimized DMO name is NaN")
-
-            self.input_dict = case_optimizer.optimize_single_scenario(
-                scenario, kwargs.get("new_dmo_name", optimized_dmo_name), kwargs.get("max_combinations", 60000)
-            )
-            self.name = kwargs.get("new_case_name", f"{self.name} - Optimized")
-
         except (ValueError, IndexError, KeyError) as error:
             raise CaseError("cannot find optimized DMO name") from error
+        if pd.isna(optimized_dmo_name):
+            raise CaseError("Optimized DMO name is NaN")
+
+        options = {key: value for key, value in kwargs.items() if key not in ["new_dmo_name", "new_case_name"]}
+        options["workers"] = options.get("workers", 1) or os.cpu_count()
+        if scenario is None:
+            self.input_dict = case_optimizer.optimize_all_scenarios(
+                kwargs.get("new_dmo_name", optimized_dmo_name), **options
+            )
+        else:
+            self.input_dict = case_optimizer.optimize_single_scenario(
+                scenario, kwargs.get("new_dmo_name", optimized_dmo_name), **options
+            )
+        self.name = kwargs.get("new_case_name", f"{self.name} - Optimized")
+        self.state_version += 1
@@ -4,7 +4,10 @@ This module contains general helper functions
 
 import sys
 import os
+import hashlib
+import json
 from functools import wraps
+import numpy as np
 
 
 def round_all_dict_values(my_dict: dict, digits: int = 2) -> dict:
@@ -108,3 +111,27 @@ def suppress_print(func):
         return result
 
     return wrapper
+
+
+def _to_serializable(value):
+    """
+    This helper function converts numpy arrays and numbers to their Python equivalent, and other objects to strings.
+    :param value: an object that the json module cannot serialize
+    :return: a serializable version of the object
+    """
+    if isinstance(value, np.ndarray):
+        return value.tolist()
+    if isinstance(value, np.generic):
+        return value.item()
+    return str(value)
+
+
+def hash_case(*objects) -> str:
+    """
+    This function calculates a hash of (the dictionaries of) a case, such that results can be linked to the exact state
+    of the case. Dictionary keys are sorted, so the hash does not depend on the order of insertion.
+    :param objects: (nested) dictionaries, arrays and values to be hashed
+    :return: hexadecimal SHA-256 hash
+    """
+    text = json.dumps(objects, sort_keys=True, default=_to_serializable)
+    return hashlib.sha256(text.encode("utf-8")).hexdigest()
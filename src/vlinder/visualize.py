@@ -2,11 +2,12 @@
 This file contains the Visualize class that deals with the creation of all graphs and tables
 """
 
-import re
+import io
 import time
 import os
-import warnings
 from pathlib import Path
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
 import pandas as pd
 import numpy as np
 import matplotlib as mpl
@@ -16,8 +17,9 @@ from selenium import webdriver
 from selenium.webdriver.chrome.service import Service
 import networkx as nx
 from pyvis.network import Network
-import dataframe_image as dfi
-from vlinder.utils import round_all_dict_values, number_formatter, get_values_from_target, check_list_content
+from vlinder.utils import round_all_dict_values, number_formatter
+from vlinder.render import TableRenderer, FigurePool, GraphRenderer
+from vlinder.level_of_detail import ClusterTree, NODE_STYLE
 
 
 class VisualizationError(Exception):
@@ -32,14 +34,28 @@ class VisualizationError(Exception):
         return f"Visualization Error: {self.message}"
 
 
+def _render_barcharts(input_dict, outcomes, options, requests):
+    """
+    This helper function renders a list of barcharts within a worker process.
+    :param requests: list of tuples (key, dictionary with the arguments of the barchart)
+    :return: list with the PNG bytes of each barchart
+    """
+    visualizer = Visualize(input_dict, outcomes, options)
+    return [image.getvalue() for image in visualizer.render_barcharts(requests)]
+
+
 class Visualize:
     """This class deals with the creation of all graphs and tables"""
 
+    # pylint: disable=too-many-instance-attributes
     def __init__(self, input_dict, outcomes, options):
         # for visualization purposes two digits is sufficient
         self.input_dict = input_dict
         self.outcomes = round_all_dict_values(outcomes)
         self.options = options
+        self.results_table = None
+        self.table_renderer = None
+        self.figure_pool = FigurePool()
         self.colors = [
             "#295477",
             "#F3DD8C",
@@ -81,6 +97,7 @@ class Visualize:
             "show_legend",
             "save",
             "number_iteration",
+            "rows_per_page",
             "input_variables",
         ]
 
@@ -174,48 +191,51 @@ class Visualize:
             axis.legend_ = None
         return axis
 
+    def _create_results_table(self) -> pd.DataFrame:
+        """
+        This function converts the outcomes into a long-format table with a row per scenario, decision makers option,
+        measure (e.g. 'weighted_appreciations') and key output. Measures with a single value per decision makers option
+        (e.g. 'decision_makers_option_appreciation') have no key output. The table is indexed by measure, such that all
+        rows of a measure are selected at once.
+        :return: a pd.DataFrame with the measure as index and columns scenario, decision_makers_option, key_output and
+        value
+        """
+        rows = [
+            (scenario, dmo, measure, key_output, value)
+            for scenario, scenario_values in self.outcomes.items()
+            if isinstance(scenario_values, dict)
+            for dmo, dmo_values in scenario_values.items()
+            if isinstance(dmo_values, dict)
+            for measure, values in dmo_values.items()
+            for key_output, value in (values.items() if isinstance(values, dict) else [(None, values)])
+        ]
+        columns = ["scenario", "decision_makers_option", "measure", "key_output", "value"]
+        return pd.DataFrame(rows, columns=columns).set_index("measure")
+
+    def get_results_table(self) -> pd.DataFrame:
+        """
+        This function returns the long-format table of the outcomes (see _create_results_table), which is created once
+        and reused by all visuals.
+        """
+        if self.results_table is None:
+            self.results_table = self._create_results_table()
+        return self.results_table
+
     def _format_data_for_visual(self, key_data: str) -> pd.DataFrame:
         """
-        This function formats the values of the given key into a dataframe.
+        This function selects the values of the given key from the results table.
         :param key_data: name of the key that needs formatting
-        :return: a pd.DataFrame with decision maker options as row index, key outputs as columns and weighted
-        appreciations as values.
-        """
-        dim_level = self._find_dimension_level(self.outcomes, key_data)
-        dim_names = ["scenario", "decision_makers_option"]
-
-        # iterate until we are at the level where the 'key_data' can be found
-        dict_for_iteration = self.outcomes.copy()
-        formatted_data = pd.DataFrame(index=range(self.options))
-        while dim_level > 1:
-            dim_values = []
-            tmp_dict = {}
-            for key, value in dict_for_iteration.items():
-                dim_values.append(key)
-                # ensure keys are unique, so we don't lose any values
-                tmp_dict.update({f"@{key}@{tmp_key}": tmp_value for tmp_key, tmp_value in value.items()})
-
-            # for higher dimensions entries will be duplicated in the columns
-            replicate_n = int(self.options / len(dim_values))
-            # using a re(gex) expression the entries to ensure uniqueness in the for-loop are removed again.
-            formatted_data[dim_names.pop(0)] = [
-                re.sub(r"@.*?@", "", value) for value in dim_values for _ in range(replicate_n)
-            ]
-            dict_for_iteration = tmp_dict
-            dim_level -= 1
-
-        # add the values from 'key_data' | this can be either a list of dictionaries or a list of values
-        key_data_list = get_values_from_target(self.outcomes, key_data)
-        key_data_list_content = check_list_content(key_data_list)
-
-        if key_data_list_content == "numeric":
-            # if the final dimension is numeric we initialised too many rows
-            formatted_data = formatted_data.drop_duplicates(ignore_index=True)
-            formatted_data["value"] = key_data_list
-        elif key_data_list_content == "dictionaries":
-            formatted_data[key_data] = [key for dictionary in key_data_list for key, _ in dictionary.items()]
-            formatted_data["value"] = [value for dictionary in key_data_list for _, value in dictionary.items()]
-        return formatted_data
+        :return: a pd.DataFrame with the columns scenario, decision_makers_option, the key outputs (named key_data, if
+        the key has a value per key output) and value.
+        """
+        results_table = self.get_results_table()
+        if key_data not in results_table.index:
+            return pd.DataFrame(columns=["scenario", "decision_makers_option", "value"])
+
+        formatted_data = results_table.loc[[key_data]].reset_index(drop=True)
+        if formatted_data["key_output"].isna().all():
+            return formatted_data.drop(columns=["key_output"])
+        return formatted_data.rename(columns={"key_output": key_data})
 
     @staticmethod
     def _apply_filters(dataframe: pd.DataFrame, drop_used: bool = False, **kwargs) -> pd.DataFrame and str:
@@ -292,7 +312,7 @@ class Visualize:
             else:
                 name_table = "/table" + str(key) + str(number_of_iter)
             if "save" in kwargs:
-                dfi.export(styled_df, "images" + name_table + ".png", table_conversion="matplotlib")
+                self._save_table(styled_df, name_table, kwargs.get("rows_per_page"))
         else:
             table_data = self._format_data_for_visual(key)
             # Filter the data based on potentially provided arguments by the user.
@@ -307,6 +327,26 @@ class Visualize:
             styled_df = self._table_styler(table_data.style, table_name)
         return styled_df
 
+    def _save_table(self, styled_df: pd.DataFrame.style, name_table: str, rows_per_page: int = None) -> None:
+        """
+        This function writes a styled table to images/<name_table>.png, or with rows_per_page, its pages of at most
+        rows_per_page rows to images/<name_table><page number>.png. All tables are drawn by the same renderer, which
+        sets up matplotlib only once.
+        :param styled_df: the table, styled by _table_styler
+        :param name_table: name of the image(s)
+        :param rows_per_page: number of rows of a page, None to write the table as a single image
+        """
+        if self.table_renderer is None:
+            self.table_renderer = TableRenderer()
+        if rows_per_page is None:
+            images = {name_table: self.table_renderer.render(styled_df)}
+        else:
+            pages = self.table_renderer.render_pages(styled_df, rows_per_page=rows_per_page)
+            images = {name_table + str(number): page for number, page in enumerate(pages)}
+        for name, image in images.items():
+            with open("images" + name + ".png", "wb") as file:
+                file.write(image.getvalue())
+
     # pylint: disable=too-many-arguments
     def _create_table_n_col(self, dataframe, col_names, col_values, row_names, left_col_header) -> pd.DataFrame:
         """
@@ -334,11 +374,12 @@ class Visualize:
         index = np.where(self.input_dict["key_outputs"] == dmo)[0][0]
         return self.input_dict["key_output_theme"][index]
 
-    def _create_barchart(self, key: str, **kwargs) -> None:
+    def _draw_barchart(self, axis: mpl.axis, key: str, **kwargs) -> mpl.axis:
         """
-        This function creates and shows a barchart for a given data key.
+        This function draws a barchart for a given data key on a matplotlib axis.
+        :param axis: the axis to draw on
         :param key: name of values of interest
-        :return: a plotted barchart
+        :return: the axis with the barchart
         """
         dims = self._find_dimension_level(self.outcomes, key)
         if dims > 2 and "scenario" not in kwargs and not ("stacked" in kwargs and key == "scenario_appreciations"):
@@ -346,20 +387,12 @@ class Visualize:
         stacked = kwargs["stacked"] if "stacked" in kwargs else True
         show_legend = kwargs["show_legend"] if "show_legend" in kwargs else True
 
-        appreciations = self._format_data_for_visual(key)
-        bar_data, name_str = self._apply_filters(appreciations, drop_used=True, **kwargs)
+        bar_data, name_str = self._apply_filters(self._format_data_for_visual(key), drop_used=True, **kwargs)
         if (key == "decision_makers_option_appreciation") | (key == "scenario_appreciations"):
             rest_cols = [col for col in bar_data.columns if col not in ["decision_makers_option", "value"]]
             bar_data = bar_data.pivot(index="decision_makers_option", columns=rest_cols, values="value").reset_index()
-            if key == "scenario_appreciations":
-                axis = bar_data.plot.bar(
-                    x="decision_makers_option", stacked=stacked, color=self.colors_scen, figsize=(10, 5)
-                )
-            else:
-                axis = bar_data.plot.bar(
-                    x="decision_makers_option", stacked=stacked, color=self.colors, figsize=(10, 5)
-                )
-            self._graph_styler(axis, f"Values of {self._str_snake_case_to_text(key)}{name_str}", show_legend)
+            colors = self.colors_scen if key == "scenario_appreciations" else self.colors
+            bar_data.plot.bar(x="decision_makers_option", stacked=stacked, color=colors, ax=axis)
         else:
             # Apply the function to the "weighted_appreciations" column and add as new column
             bar_data["themes"] = bar_data[key].apply(self.map_values)
@@ -371,19 +404,63 @@ class Visualize:
             bar_colors = bar_data["themes"].map(theme_colors)
             rest_cols = [col for col in bar_data.columns if col not in ["decision_makers_option", "value"]]
             bar_data = bar_data.pivot(index="decision_makers_option", columns=rest_cols, values="value").reset_index()
-            axis = bar_data.plot.bar(x="decision_makers_option", stacked=stacked, color=bar_colors, figsize=(10, 5))
+            bar_data.plot.bar(x="decision_makers_option", stacked=stacked, color=bar_colors, ax=axis)
             # Add border to each bar
             for patch in axis.patches:
                 patch.set_edgecolor("white")
                 patch.set_linewidth(1)
-            self._graph_styler(axis, f"Values of {self._str_snake_case_to_text(key)}{name_str}", show_legend)
+        return self._graph_styler(axis, f"Values of {self._str_snake_case_to_text(key)}{name_str}", show_legend)
 
+    def _create_barchart(self, key: str, **kwargs) -> None:
+        """
+        This function creates and shows a barchart for a given data key. With save, the barchart is drawn on a figure
+        of the figure pool and written to images/figure_<key>.png.
+        :param key: name of values of interest
+        :return: a plotted barchart
+        """
         if "save" in kwargs:
-            plt.savefig("images" + "/figure_" + key + ".png", bbox_inches="tight")
-            plt.close()
+            image = self.render_barcharts([(key, kwargs)])[0]
+            with open("images" + "/figure_" + key + ".png", "wb") as file:
+                file.write(image.getvalue())
         else:
+            _, axis = plt.subplots(figsize=(10, 5))
+            self._draw_barchart(axis, key, **kwargs)
             plt.show()
 
+    def render_barcharts(self, requests, workers: int = 1) -> list:
+        """
+        This function draws a batch of barcharts as PNG images, e.g. the weighted appreciations of every scenario. The
+        barcharts are drawn on the reused figure of the figure pool, without pyplot, or divided over worker processes
+        if workers > 1.
+        :param requests: list of tuples (key, dictionary with the arguments of the barchart, e.g. {"scenario": "A"})
+        :param workers: number of processes
+        :return: list with an in-memory PNG image of each barchart, in the order of requests
+        """
+        requests = [(key, dict(kwargs)) for key, kwargs in requests]
+        for key, kwargs in requests:
+            self._validate_kwargs(**kwargs)
+            if key not in self.available_outputs:
+                raise VisualizationError(f"'{key}' is not a valid option")
+
+        if workers > 1 and len(requests) > 1:
+            # contiguous parts keep the order of the barcharts, each process sets up its own figure pool once
+            bounds = np.linspace(0, len(requests), min(workers, len(requests)) + 1).astype(int)
+            with ProcessPoolExecutor(max_workers=workers) as executor:
+                futures = [
+                    executor.submit(
+                        _render_barcharts, self.input_dict, self.outcomes, self.options, requests[start:stop]
+                    )
+                    for start, stop in zip(bounds[:-1], bounds[1:])
+                ]
+                return [io.BytesIO(image) for future in futures for image in future.result()]
+
+        images = []
+        for key, kwargs in requests:
+            figure = self.figure_pool.get_figure((10, 5))
+            self._draw_barchart(figure.add_subplot(), key, **kwargs)
+            images.append(self.figure_pool.to_png(figure, bbox_inches="tight"))
+        return images
+
     def create_visual(self, visual_request: str, key: str, **kwargs):
         """
         This function redirects the visual_request based on the requested format to the correct helper function.
@@ -404,51 +481,63 @@ class Visualize:
 
 
 class DependencyGraph:
-    """This class deals with the creation of the dependency graph"""
+    """
+    This class deals with the creation of the dependency graph. The graph of all dependencies is built once, the graph
+    of a key output (see ko_filter()) is a view of it, so one instance can draw the graphs of all key outputs.
+    """
 
+    # pylint: disable=too-many-instance-attributes
     def __init__(self, input_dict):
         # Initialize the input dictionary
         self.input_dict = input_dict
+        # the edges (argument, destination), the nodes and the graph of all dependencies, see create_inc_mat()
+        self.edges = None
+        self.nodes = {"destinations": [], "arguments": []}
+        self.graph = None
+        # the generations of the predecessors of each node that has been searched, see get_generations()
+        self.generations = {}
+        # the graph, destinations and arguments of the selected key output
         self.network = None
-        self.inc_mat = None
+        self.destinations = []
+        self.arguments = []
+        self._inc_mat = None
         self.x_coords = {}
         self.y_coords = {}
         self.pos = None
 
-        warnings.simplefilter(action="ignore", category=pd.errors.PerformanceWarning)
-
-    def find_all_predecessors(
-        self, node, max_generation, predecessors=None, current_generation=0, current_max_generation=0
-    ):
+    def get_generations(self, node) -> dict:
         """
-        This recursive function searches for al the predecessors of a certain node in the network.
+        This function searches the graph of all dependencies breadth-first for all predecessors of a node. The result
+        is kept as an index, such that the predecessors of any number of generations are a selection of the index.
+        :param node: the node whose predecessors to find
+        :return: a dictionary with the generation of each predecessor (1 for the arguments of the node, 2 for their
+        arguments, etc.) and of the node itself (0)
+        """
+        if node not in self.generations:
+            generations = {node: 0}
+            queue = deque([node])
+            while queue:
+                current = queue.popleft()
+                for predecessor in self.graph.predecessors(current):
+                    if predecessor not in generations:
+                        generations[predecessor] = generations[current] + 1
+                        queue.append(predecessor)
+            self.generations[node] = generations
+        return self.generations[node]
+
+    def find_all_predecessors(self, node, max_generation):
+        """
+        This function searches for al the predecessors of a certain node in the network.
         :param node: the node whose predecessors to find
         :param max_generation: the amount of generations the function can go back
-        :param predecessors: a set with all the predecessors found
-        :param current_generation: the generation where the function is looking for predecessors
-        :param current_max_generation: the maximum number of generations found
         :return: the predecessors and the maximum number of generations
         """
-
-        # Create an empty set for the first iteration
-        if predecessors is None:
-            predecessors = set()
-
-        for predecessor in self.network.predecessors(node):
-            if max_generation is not None and current_generation >= max_generation:
-                continue
-            if predecessor not in predecessors:
-                predecessors.add(predecessor)
-                # Update the max generation if current generation is greater
-                updated_max_generation = max(current_max_generation, current_generation + 1)
-                # Recursively find all predecessors
-                _, returned_max_generation = self.find_all_predecessors(
-                    predecessor, max_generation, predecessors, current_generation + 1, updated_max_generation
-                )
-                # Keep track of the maximum generation during all recursive calls
-                current_max_generation = max(current_max_generation, returned_max_generation)
-
-        return predecessors, current_max_generation
+        predecessors = {
+            predecessor: generation
+            for predecessor, generation in self.get_generations(node).items()
+            if 0 < generation and (max_generation is None or generation <= max_generation)
+        }
+        return set(predecessors), max(predecessors.values(), default=0)
 
     @staticmethod
     def is_even(number):
@@ -461,27 +550,43 @@ class DependencyGraph:
 
     def create_inc_mat(self):
         """
-        Generate the incidence matrix based on dependencies.
-        """
-        # Incidence matrix
-        last_calc = max(self.input_dict["dependencies_order"])
-        self.inc_mat = pd.DataFrame()
-        for i in range(last_calc + 1):
-            # Select the first dependency
-            dep_idx = list(self.input_dict["dependencies_order"]).index(i)
-            dest = self.input_dict["destination"][dep_idx]
-            args = [self.input_dict["argument_1"][dep_idx], self.input_dict["argument_2"][dep_idx]]
-
-            # Add the arguments and destinations into the incidence matrix
-            if dest not in self.inc_mat.columns:
-                self.inc_mat[dest] = 0
-
-            for arg in args:
+        This function collects the edges (argument, destination) of the dependencies in the order of calculation, the
+        destinations (the columns of the incidence matrix) and the arguments (the rows of the incidence matrix). This
+        takes a single pass over the dependencies, the dense incidence matrix is only created when inc_mat is used.
+        """
+        # the first dependency of every step of the calculation, in the order of the calculation
+        _, rows = np.unique(np.asarray(self.input_dict["dependencies_order"]), return_index=True)
+        destinations, arguments, edges = {}, {}, {}
+        for row in rows:
+            dest = self.input_dict["destination"][row]
+            destinations.setdefault(dest, len(destinations))
+            for arg in [self.input_dict["argument_1"][row], self.input_dict["argument_2"][row]]:
                 if isinstance(arg, str):
-                    if arg not in self.inc_mat.index:
-                        self.inc_mat = self.inc_mat.reindex(self.inc_mat.index.tolist() + [arg])
-                        self.inc_mat.loc[arg] = 0
-                    self.inc_mat.at[arg, dest] = 1
+                    arguments.setdefault(arg, len(arguments))
+                    edges[(arg, dest)] = None
+
+        self.nodes = {"destinations": list(destinations), "arguments": list(arguments)}
+        self.destinations = self.nodes["destinations"]
+        self.arguments = self.nodes["arguments"]
+        # order the edges by destination and then by argument, like the columns and rows of the incidence matrix
+        self.edges = sorted(edges, key=lambda edge: (destinations[edge[1]], arguments[edge[0]]))
+        self._inc_mat = None
+
+    @property
+    def inc_mat(self) -> pd.DataFrame:
+        """
+        The incidence matrix with a row per argument and a column per destination, which is 1 if the argument is used
+        to calculate the destination and 0 otherwise.
+        """
+        if self._inc_mat is None and self.edges is not None:
+            rows = {arg: i for i, arg in enumerate(self.arguments)}
+            columns = {dest: i for i, dest in enumerate(self.destinations)}
+            matrix = np.zeros((len(rows), len(columns)))
+            for arg, dest in self.edges:
+                if arg in rows and dest in columns:
+                    matrix[rows[arg], columns[dest]] = 1.0
+            self._inc_mat = pd.DataFrame(matrix, index=self.arguments, columns=self.destinations)
+        return self._inc_mat
 
     def create_network(self):
         """
@@ -489,33 +594,38 @@ class DependencyGraph:
         """
         # Create the network
         network = nx.DiGraph()
-
-        for dest in self.inc_mat.columns:
-            for arg in self.inc_mat.index:
-                if self.inc_mat.at[arg, dest] == 1:
-                    network.add_edge(arg, dest)
+        network.add_edges_from(self.edges)
+        self.graph = network
         self.network = network
+        self.generations = {}
 
-    def ko_filter(self, selected_ko, max_gen):
+    def ko_filter(self, selected_ko, max_gen, max_nodes=None):
         """
-        This functions filters out only one key output and its predecessors from the network
+        This functions filters out only one key output and its predecessors from the graph of all dependencies
         :param selected_ko: the key output
         :param max_gen: the maximum of generations of predecessors one wants in its network
+        :param max_nodes: if given, the network is filled up to max_nodes nodes with predecessors of the generation
+        after max_gen, in the order of the search
         :return: the total amount of generations in the (filtered) network
         """
         # Select a key output en select only the predecessors of this output
         all_predecessors, tot_gen = self.find_all_predecessors(selected_ko, max_gen)
         all_predecessors.add(selected_ko)
+        if max_nodes is not None and max_gen is not None and len(all_predecessors) < max_nodes:
+            next_generation = [
+                node for node, generation in self.get_generations(selected_ko).items() if generation == max_gen + 1
+            ]
+            if next_generation:
+                all_predecessors.update(next_generation[: max_nodes - len(all_predecessors)])
+                tot_gen = max_gen + 1
 
         # Update the graph
-        self.network = self.network.subgraph(all_predecessors)
-
-        # Select only the needed columns and indices of the inc matrix
-        filtered_columns = [col for col in self.inc_mat.columns if col in all_predecessors]
-        filtered_index = [idx for idx in self.inc_mat.index if idx in all_predecessors]
+        self.network = self.graph.subgraph(all_predecessors)
 
-        # Create the new dataframe
-        self.inc_mat = self.inc_mat.loc[filtered_index, filtered_columns]
+        # Select only the needed destinations and arguments, i.e. columns and rows of the incidence matrix
+        self.destinations = [dest for dest in self.nodes["destinations"] if dest in all_predecessors]
+        self.arguments = [arg for arg in self.nodes["arguments"] if arg in all_predecessors]
+        self._inc_mat = None
 
         return tot_gen
 
@@ -523,14 +633,12 @@ class DependencyGraph:
         """
         This functions creates the x coordinates for the network
         """
-        # First set the coordinates for the destinations to its hierarchy
-        self.x_coords = {
-            dests: self.input_dict["hierarchy"][np.where(self.input_dict["destination"] == dests)[0][-1]]
-            for dests in self.inc_mat.columns
-        }
+        # First set the coordinates for the destinations to the hierarchy of their last dependency
+        last_rows = {dest: row for row, dest in enumerate(self.input_dict["destination"])}
+        self.x_coords = {dests: self.input_dict["hierarchy"][last_rows[dests]] for dests in self.destinations}
 
         # The coordinates of fixed inputs is 0
-        for fixed in set(self.inc_mat.index) - set(self.inc_mat.columns):
+        for fixed in set(self.arguments) - set(self.destinations):
             self.x_coords[fixed] = 0
 
         # Normalize x-coordinates
@@ -543,11 +651,13 @@ class DependencyGraph:
         This functions creates the y coordinates for the network
         """
         # First calculate the y-coordinates for the destinations
+        self.y_coords = {}
         weight = 0
         prev_hier = 1
         count = 0
+        destinations = set(self.destinations)
         for key in self.x_coords.keys():
-            if key in list(self.inc_mat.columns):
+            if key in destinations:
                 if prev_hier != self.x_coords[key]:
                     weight += 0
 
@@ -556,9 +666,9 @@ class DependencyGraph:
                 prev_hier = self.x_coords[key]
 
         # Now create the y coordinates of the fixed inputs
-        list_coords = []
-        list_nodes = []
-        for node in self.inc_mat:
+        list_coords = set()
+        list_nodes = set()
+        for node in self.destinations:
             pres = list(self.network.predecessors(node))
             coor_dest = self.y_coords[node]
 
@@ -566,85 +676,69 @@ class DependencyGraph:
             while coor_dest in list_coords:
                 coor_dest = coor_dest - 4
             for j, node1 in enumerate(pres):
-                if node1 in list_nodes or node1 in self.inc_mat.columns or not isinstance(node1, str):
+                if node1 in list_nodes or node1 in destinations or not isinstance(node1, str):
                     continue
 
                 direction = 1 if self.is_even(j) else -1
                 offset = 2 if self.is_even(j) else 1
 
                 self.y_coords[node1] = coor_dest + direction * ((j + offset) / 2)
-                list_nodes.append(node1)
+                list_nodes.add(node1)
 
-            list_coords.append(coor_dest)
+            list_coords.add(coor_dest)
 
-    def draw_graph(
-        self,
-        selected_ko,
-        max_gen=None,
-        save=False,
-        graph_dir=Path.cwd() / "reports" / "dependency_graphs",
-        sc_dir=Path.cwd() / "images",
-        sc_window_size="1920x1080",
-        return_html=False,
-    ):
+    def _check_request(self, selected_ko, max_gen):
         """
-        This functions draws the network graph
-        :param selected_ko: the key output
-        :param max_gen: the maximum of generations of predecessors one wants in its network
-        :param save: a boolean parameter if there has to be made a screenshot from the graph
-        :return: the dependency graph
+        This function creates the graph of all dependencies once (the graph of every key output is a view of it) and
+        checks the key output and the maximum number of generations of a request.
         """
-        # Create the incidence matrix
-        self.create_inc_mat()
-
-        # Create the graph based on incidence matrix
-        self.create_network()
-
-        # Filter out the network of a key output if wanted
+        if self.graph is None:
+            self.create_inc_mat()
+            self.create_network()
         if selected_ko not in self.input_dict["key_outputs"]:
             raise VisualizationError(f"'{selected_ko}' is not a valid option")
         if isinstance(max_gen, int) is False and max_gen is not None:
             raise VisualizationError(f"'{max_gen}' is not a valid option")
 
-        if max_gen is None:
-            tot_gen = self.ko_filter(selected_ko, max_gen)
-            minus_gen = 1
-            while self.network.number_of_nodes() > 30:
-                self.ko_filter(selected_ko, tot_gen - minus_gen)
-                minus_gen += 1
-        else:
-            self.ko_filter(selected_ko, max_gen)
-
-        # Create the x and y coordinates
+    def _position_nodes(self):
+        """
+        This function calculates the position of every node of the selected network.
+        """
         self.create_x_coords()
-
         self.create_y_coords()
+        self.pos = {node: np.array([self.x_coords[node], self.y_coords[node]], dtype=float) for node in self.network}
 
-        # Add coordinates to the position dictionary
-        self.pos = nx.spring_layout(self.network)
-
-        for node in self.pos.keys():
-            self.pos[node][0] = self.x_coords[node]
-            self.pos[node][1] = self.y_coords[node]
-
-        # Create the pyvis network
-        if save is True:
-            net = Network(
-                notebook=True, directed=True, height="800px", width="100%", layout=False, cdn_resources="in_line"
-            )
-        elif save is False:
-            net = Network(
-                notebook=True,
-                directed=True,
-                height="800px",
-                width="100%",
-                layout=False,
-                cdn_resources="in_line",
-                select_menu=True,
-            )
+    def _prepare_view(self, selected_ko, max_gen=None):
+        """
+        This function selects and positions the network of a key output, with the predecessors of at most max_gen
+        generations. Without max_gen, the network holds the most generations with at most 30 nodes, filled up to 30
+        nodes with predecessors of the next generation.
+        :param selected_ko: the key output
+        :param max_gen: the maximum of generations of predecessors one wants in its network
+        """
+        self._check_request(selected_ko, max_gen)
+        if max_gen is None:
+            nodes_per_generation = np.bincount(list(self.get_generations(selected_ko).values())).cumsum()
+            self.ko_filter(selected_ko, int(np.flatnonzero(nodes_per_generation <= 30)[-1]), max_nodes=30)
         else:
-            raise VisualizationError(f"'{save}' is not a valid option")
-
+            self.ko_filter(selected_ko, max_gen)
+        self._position_nodes()
+
+    def _create_page_network(self, select_menu=False) -> Network:
+        """
+        This function creates the interactive (pyvis) graph of the selected network.
+        :param select_menu: show a menu to select nodes
+        :return: the pyvis network
+        """
+        net = Network(
+            notebook=True,
+            directed=True,
+            height="800px",
+            width="100%",
+            layout=False,
+            cdn_resources="in_line",
+            select_menu=select_menu,
+        )
         net.from_nx(self.network)
 
         # Reshape the graph and set colors
@@ -658,7 +752,103 @@ class DependencyGraph:
         for edge in net.edges:
             edge["color"] = "darkorange"
 
-        net.options = {
+        net.options = self._get_network_options()
+        return net
+
+    @staticmethod
+    def _save_page(net, selected_ko, graph_dir) -> str:
+        """
+        This function writes the page of an interactive graph to graph_dir.
+        :return: the location of the page
+        """
+        Path(graph_dir).mkdir(parents=True, exist_ok=True)
+        graph_location = f"{str(graph_dir)}/{selected_ko.replace(' ', '_')}_graph.html"
+        net.save_graph(graph_location)
+        return graph_location
+
+    def save_image(self, path, window_size="1920x1080", image_format="png"):
+        """
+        This function draws the network as a static image with matplotlib, in the layout of the interactive graph
+        (where a generation is 140 pixels wide), and saves it.
+        :param path: location of the image
+        :param window_size: size of the image in pixels, e.g. "1920x1080"
+        :param image_format: "png" or "svg"
+        :return: the location of the image
+        """
+        Path(path).parent.mkdir(parents=True, exist_ok=True)
+        width, height = (int(size) for size in window_size.split("x"))
+        image = GraphRenderer(width, height).render(
+            self.network, {node: (x * 140, y * 10) for node, (x, y) in self.pos.items()}, image_format
+        )
+        with open(path, "wb") as file:
+            file.write(image.getvalue())
+        return path
+
+    # pylint: disable=too-many-arguments,too-many-positional-arguments
+    def save_static_image(
+        self, selected_ko, max_gen=None, sc_dir=Path.cwd() / "images", sc_window_size="1920x1080", image_format="png"
+    ):
+        """
+        This function draws the graph of a key output (see _prepare_view()) as a static image with matplotlib, without
+        a browser, and saves it as sc_dir/keyoutput_<selected_ko>.<image_format>.
+        :param selected_ko: the key output
+        :param max_gen: the maximum of generations of predecessors one wants in its network
+        :param sc_dir: the directory of the image
+        :param sc_window_size: size of the image in pixels, e.g. "1920x1080"
+        :param image_format: "png" or "svg"
+        :return: the location of the image
+        """
+        if image_format not in ["png", "svg"]:
+            raise VisualizationError(f"'{image_format}' is not a valid option")
+        self._prepare_view(selected_ko, max_gen)
+        return self.save_image(f"{sc_dir}/keyoutput_{selected_ko}.{image_format}", sc_window_size, image_format)
+
+    # pylint: disable=too-many-arguments,too-many-positional-arguments
+    def save_screenshot(
+        self,
+        selected_ko,
+        max_gen=None,
+        graph_dir=Path.cwd() / "reports" / "dependency_graphs",
+        sc_dir=Path.cwd() / "images",
+        sc_window_size="1920x1080",
+    ):
+        """
+        This function saves a screenshot of the interactive graph of a key output (see _prepare_view()), taken with
+        Chrome, as sc_dir/keyoutput_<selected_ko>.png. The page of the graph is written to graph_dir.
+        :param selected_ko: the key output
+        :param max_gen: the maximum of generations of predecessors one wants in its network
+        :return: the location of the screenshot
+        """
+        self._prepare_view(selected_ko, max_gen)
+        graph_location = self._save_page(self._create_page_network(), selected_ko, graph_dir)
+
+        # Use Selenium to take a screenshot
+        service = Service(ChromeDriverManager().install())
+        options = webdriver.ChromeOptions()
+        options.add_argument("headless")
+        options.add_argument(f"window-size={sc_window_size}")
+        driver = webdriver.Chrome(service=service, options=options)
+
+        # Navigate to the dependency graph
+        driver.get(Path(graph_location).resolve().as_uri())
+
+        # Wait for the page to fully load
+        time.sleep(2)
+
+        # Take and store the screenshot
+        Path(sc_dir).mkdir(parents=True, exist_ok=True)
+        sc_location = f"{sc_dir}/keyoutput_{selected_ko}.png"
+        driver.save_screenshot(sc_location)
+
+        driver.quit()
+        return sc_location
+
+    @staticmethod
+    def _get_network_options() -> dict:
+        """
+        This function returns the vis.js options of the interactive graph.
+        """
+        return {
             "physics": {"enabled": False},
             "nodes": {
                 "font": {
@@ -671,39 +861,111 @@ class DependencyGraph:
             },
         }
 
-        # Create the directory if it doesn't exist
-        if not Path(graph_dir).exists():
-            Path(graph_dir).mkdir(parents=True)
+    def _get_level_of_detail_items(self, tree) -> dict:
+        """
+        This function creates the vis.js item of every node (at its position in the layout of the interactive graph)
+        and of every cluster (at the mean position of its nodes, with the number of nodes as label).
+        :param tree: the ClusterTree of the key output
+        :return: a dictionary with the item of each node and cluster
+        """
+        items = {
+            node: {"id": node, "label": node, "x": round(float(x) * 140, 1), "y": round(float(y) * 10, 1)}
+            for node, (x, y) in self.pos.items()
+        }
+        for cluster, members in tree.members.items():
+            x_value, y_value = np.mean([self.pos[member] for member in members], axis=0)
+            items[cluster] = {
+                "id": cluster,
+                "label": tree.labels[cluster],
+                "title": ", ".join(members[:20]) + (", ..." if len(members) > 20 else ""),
+                "x": round(float(x_value) * 140, 1),
+                "y": round(float(y_value) * 10, 1),
+                "size": 10,
+                "font": {"size": 10},
+                "color": "#295477",
+            }
+        return items
+
+    # pylint: disable=too-many-arguments,too-many-positional-arguments
+    def draw_level_of_detail(
+        self,
+        selected_ko,
+        max_gen=None,
+        graph_dir=Path.cwd() / "reports" / "dependency_graphs",
+        return_html=False,
+        max_nodes=30,
+    ):
+        """
+        This function draws the interactive graph of all predecessors of a key output (of at most max_gen
+        generations). Like the graph of draw_graph, the predecessors of the most generations with at most max_nodes
+        nodes are shown, further generations are collapsed into a cluster per generation (and hierarchy level), which
+        shows the number of variables and expands with a double-click. The page loads vis.js from a CDN and only
+        contains the graph, so it stays small.
+        :param selected_ko: the key output
+        :param max_gen: the maximum of generations of predecessors one wants in its network
+        :param graph_dir: the directory of the HTML page
+        :param return_html: return the HTML instead of opening the page
+        :param max_nodes: the maximum number of nodes that are shown before the further generations are collapsed
+        :return: the HTML of the page if return_html
+        """
+        self._check_request(selected_ko, max_gen)
+        if isinstance(max_nodes, int) is False or max_nodes < 1:
+            raise VisualizationError(f"'{max_nodes}' is not a valid option")
+        self.ko_filter(selected_ko, max_gen)
+        self._position_nodes()
+
+        tree = ClusterTree(
+            {node: self.get_generations(selected_ko)[node] for node in self.network}, self.x_coords, max_nodes
+        )
+        items = self._get_level_of_detail_items(tree)
+
+        net = Network(notebook=True, directed=True, height="800px", width="100%", layout=False, cdn_resources="remote")
+        nodes, edges = tree.collapse(self.network.nodes, self.network.edges)
+        for node in nodes:
+            net.add_node(node, **{**NODE_STYLE, **{key: value for key, value in items[node].items() if key != "id"}})
+        for edge in edges:
+            net.add_edge(*edge, color="darkorange")
+        net.options = self._get_network_options()
+        html = net.generate_html().replace(
+            "</body>", tree.get_script(self.network.nodes, self.network.edges, items) + "</body>"
+        )
+        if return_html:
+            return html
 
+        Path(graph_dir).mkdir(parents=True, exist_ok=True)
         graph_location = f"{str(graph_dir)}/{selected_ko.replace(' ', '_')}_graph.html"
+        Path(graph_location).write_text(html, encoding="utf-8")
+        os.system(f"open '{graph_location}'")
+        return None
 
+    # pylint: disable=too-many-arguments,too-many-positional-arguments
+    def draw_graph(
+        self,
+        selected_ko,
+        max_gen=None,
+        save=False,
+        graph_dir=Path.cwd() / "reports" / "dependency_graphs",
+        sc_dir=Path.cwd() / "images",
+        sc_window_size="1920x1080",
+        return_html=False,
+    ):
+        """
+        This functions draws the network graph of a key output (see _prepare_view()).
+        :param selected_ko: the key output
+        :param max_gen: the maximum of generations of predecessors one wants in its network
+        :param save: save a static image of the graph (see save_static_image()), instead of showing the interactive
+        graph in the browser
+        :param return_html: return the HTML of the interactive graph instead of showing it
+        :return: the HTML of the graph if return_html, else the location of the image if save, else None
+        """
+        if save is not True and save is not False:
+            raise VisualizationError(f"'{save}' is not a valid option")
+        if save and not return_html:
+            return self.save_static_image(selected_ko, max_gen, sc_dir, sc_window_size)
+
+        self._prepare_view(selected_ko, max_gen)
+        net = self._create_page_network(select_menu=not save)
         if return_html:
             return net.generate_html()
-
-        net.save_graph(graph_location)
-
-        # Make a screenshot of the graph if save == true, otherwise open a tab and show the graph
-        if save is True:
-            # Use Selenium to take a screenshot
-            service = Service(ChromeDriverManager().install())
-            options = webdriver.ChromeOptions()
-            options.add_argument("headless")
-            options.add_argument(f"window-size={sc_window_size}")
-            driver = webdriver.Chrome(service=service, options=options)
-
-            # Navigate to the dependency graph
-            driver.get(Path(graph_location).resolve().as_uri())
-
-            # Wait for the page to fully load
-            time.sleep(2)
-
-            # Take and store the screenshot
-            if not Path(sc_dir).exists():
-                Path(sc_dir).mkdir(parents=True)
-
-            sc_location = f"{sc_dir}/keyoutput_{selected_ko}.png"
-            driver.save_screenshot(sc_location)
-
-            driver.quit()
-        elif save is False:
-            os.system(f"open '{graph_location}'")
+        os.system(f"open '{self._save_page(net, selected_ko, graph_dir)}'")
+        return None
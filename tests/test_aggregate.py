@@ -0,0 +1,107 @@
+"""
+This module contains all tests for the Aggregate() class and the decision criteria across scenarios
+"""
+
+import copy
+import pytest
+import numpy as np
+from vlinder.appreciate import Appreciate
+from vlinder.aggregate import (
+    Aggregate,
+    AggregationError,
+    expected_appreciation,
+    hurwicz,
+    maximum_regret,
+    rankings,
+    worst_case,
+)
+from .params import INPUT_DICT_BEERWISER, OUTPUT_DICT_BEERWISER
+
+# scenarios as rows, decision makers options as columns
+MATRIX = np.array([[60, 40, 50], [20, 40, 30], [70, 40, 70]])
+
+
+@pytest.fixture(name="aggregate_beerwiser")
+def fixture_aggregate_beerwiser():
+    """
+    This fixture initialises an appreciated Beerwiser case.
+    :return: an Aggregate class for Beerwiser
+    """
+    input_dict = copy.deepcopy(INPUT_DICT_BEERWISER)
+    # only use the key outputs, as other tests may have appreciated the shared output dictionary already
+    output_dict = {
+        scenario: {
+            dmo: {"key_outputs": dict(value["key_outputs"])}
+            for dmo, value in dmos.items()
+            if dmo != "highest_weighted_dmo"
+        }
+        for scenario, dmos in OUTPUT_DICT_BEERWISER.items()
+    }
+    Appreciate(input_dict, output_dict).appreciate_all_scenarios()
+    return Aggregate(input_dict, output_dict)
+
+
+def test_expected_appreciation():
+    """
+    This function tests expected_appreciation to use the normalized scenario weights
+    """
+    assert expected_appreciation(MATRIX, [2, 1, 1]).tolist() == [52.5, 40, 50]
+
+
+def test_expected_appreciation_error():
+    """
+    This function tests expected_appreciation to raise an AggregationError if all scenario weights are 0
+    """
+    with pytest.raises(AggregationError) as aggregation_error:
+        expected_appreciation(MATRIX, [0, 0, 0])
+    assert str(aggregation_error.value) == "Aggregation Error: the sum of the scenario weights cannot be 0"
+
+
+def test_worst_case_and_regret():
+    """
+    This function tests worst_case and maximum_regret to return the maximin and minimax regret values
+    """
+    assert worst_case(MATRIX).tolist() == [20, 40, 30]
+    # regret per scenario: [0, 20, 10], [20, 0, 10], [0, 30, 0]
+    assert maximum_regret(MATRIX).tolist() == [20, 30, 10]
+
+
+@pytest.mark.parametrize("optimism, expected_result", [(0, [20, 40, 30]), (1, [70, 40, 70]), (0.5, [45, 40, 50])])
+def test_hurwicz(optimism, expected_result):
+    """
+    This function tests hurwicz to weigh the best and worst case appreciation
+    :param optimism: weight of the best case
+    :param expected_result: expected Hurwicz values
+    """
+    assert hurwicz(MATRIX, optimism).tolist() == expected_result
+
+
+def test_hurwicz_error():
+    """
+    This function tests hurwicz to raise an AggregationError for an optimism outside [0, 1]
+    """
+    with pytest.raises(AggregationError) as aggregation_error:
+        hurwicz(MATRIX, 1.5)
+    assert str(aggregation_error.value) == "Aggregation Error: optimism should be between 0 and 1, not 1.5"
+
+
+def test_rankings():
+    """
+    This function tests rankings to rank options per scenario, where ties share the best rank
+    """
+    assert rankings(MATRIX).tolist() == [[1, 3, 2], [3, 1, 2], [1, 3, 1]]
+
+
+def test_aggregate(aggregate_beerwiser):
+    """
+    This function tests aggregate to return all decision criteria for all decision makers options of Beerwiser
+    :param aggregate_beerwiser: an Aggregate class for Beerwiser
+    """
+    result = aggregate_beerwiser.aggregate()
+    matrix = aggregate_beerwiser.get_appreciation_matrix()
+
+    assert matrix.shape == (3, 3)
+    assert result.index.tolist() == ["Equal spread", "Focus on training", "Focus on water recycling"]
+    assert list(result.columns) == list(aggregate_beerwiser.available_criteria)
+    assert np.allclose(result["expected_appreciation"], (np.array([2, 1, 3]) @ matrix) / 6)
+    assert np.all(result["maximum_regret"] >= 0)
@@ -2,6 +2,7 @@
 """
 This module contains all tests for the Appreciate() class
 """
+import copy
 import pytest
 import numpy as np
 from vlinder.appreciate import Appreciate
@@ -34,11 +35,11 @@ def fixture_appreciate_beerwiser_min_max_monetary():
 
 def test_get_start_and_end_points(appreciate_beerwiser):
     """
-    This function tests _get_start_and_end_points() to return a dictionary with a list containing the min. and max.
+    This function tests get_start_and_end_points() to return a dictionary with a list containing the min. and max.
     found key output value, over all scenarios.
     :param appreciate_beerwiser:
     """
-    result = appreciate_beerwiser._get_start_and_end_points()
+    result = appreciate_beerwiser.get_start_and_end_points()
     rounded_result = round_all_dict_values(result)
     expected_result = {
         "Accidents reduction": [3.49, 17.44],
@@ -50,11 +51,11 @@ def test_get_start_and_end_points(appreciate_beerwiser):
 
 def test_get_start_and_end_points_min_max_monetary(appreciate_beerwiser_min_max_monetary):
     """
-    This function tests _get_start_and_end_points() to return a dictionary with a list containing the min.
+    This function tests get_start_and_end_points() to return a dictionary with a list containing the min.
     and max when key_output boundaries are provided by the user.
     :param appreciate_beerwiser_min_max_monetary:
     """
-    result = appreciate_beerwiser_min_max_monetary._get_start_and_end_points()
+    result = appreciate_beerwiser_min_max_monetary.get_start_and_end_points()
     rounded_result = round_all_dict_values(result)
     expected_result = {
         "Accidents reduction": [100, 450],
@@ -187,10 +188,10 @@ def test_apply_weights_single_key_output(appreciate_beerwiser, weights_list, exp
 
 def test_calculate_weights(appreciate_beerwiser):
     """
-    This function tests _calculate_weights to return the correct values
+    This function tests calculate_weights to return the correct values
     :param appreciate_beerwiser: an Appreciate() class for Beerwiser
     """
-    result = appreciate_beerwiser._calculate_weights()
+    result = appreciate_beerwiser.calculate_weights()
     rounded_result = [round(value, 2) for value in result]
     expected_result = [0.33, 0.17, 0.50]
     assert rounded_result == expected_result
@@ -206,6 +207,8 @@ def test_apply_weights(appreciate_beerwiser):
     rounded_result = [round(value, 2) for value in result]
     expected_result = [16.67, 8.29, 40.56]
     assert expected_result == rounded_result
+    weights = np.array(appreciate_beerwiser.calculate_weights())
+    assert list(appreciate_beerwiser._apply_weights(appreciation_dict, weights)) == list(result)
 
 
 def test_apply_scenario_weights(appreciate_beerwiser):
@@ -235,3 +238,60 @@ def test_apply_scenario_weights(appreciate_beerwiser):
         "scenario_appreciations": 20.67,
     }
     assert result == expected_result
+
+
+def test_appreciate_single_key_output_with_curve(appreciate_beerwiser):
+    """
+    This function tests _appreciate_single_key_output to use the curve provided in the arguments instead of the
+    'linear' indicator.
+    :param appreciate_beerwiser: an Appreciate() class for Beerwiser
+    """
+    appreciate_beerwiser.start_and_end_points = {"Sample A": [0, 20]}
+    args = {
+        "key_output": "Sample A",
+        "key_output_smaller_the_better": 1,
+        "key_output_linear": 1,
+        "key_output_curve": "piecewise_linear",
+        "key_output_curve_parameters": "0.5:80",
+    }
+    result = appreciate_beerwiser._appreciate_single_key_output(5, args)
+    assert round(result, 2) == 60
+
+
+def test_appreciate_key_outputs_with_curves():
+    """
+    This function tests appreciate_key_outputs to select the curves from the key_output_curve column in the
+    input_dict, and fall back to the 'linear' indicator where no curve is provided.
+    """
+    input_copy = INPUT_DICT_BEERWISER.copy()
+    input_copy["key_output_curve"] = np.array(["step", np.nan, "exponential"], dtype=object)
+    input_copy["key_output_curve_parameters"] = np.array(["0.5", np.nan, np.nan], dtype=object)
+    appreciate = Appreciate(input_copy, OUTPUT_DICT_BEERWISER)
+    appreciate.start_and_end_points = {
+        "Accidents reduction": [0, 10],
+        "Water use reduction": [0, 10],
+        "Production cost reduction": [0, 10],
+    }
+    result = appreciate.appreciate_key_outputs(np.array([[2, 2, 5], [6, 6, 10]]))
+    expected_result = [[0, 20, 37.75], [100, 60, 100]]
+    assert np.round(result, 2).tolist() == expected_result
+
+
+def test_calculate_best_dmo():
+    """
+    This function tests _calculate_best_dmo to store the decision makers option with the highest positive appreciation
+    per scenario, or an empty string if no option has a positive appreciation.
+    """
+    appreciate = Appreciate(copy.deepcopy(INPUT_DICT_BEERWISER), copy.deepcopy(OUTPUT_DICT_BEERWISER))
+    appreciate.appreciate_all_scenarios()
+    for scenario in appreciate.input_dict["scenarios"]:
+        appreciations = {
+            option: appreciate.output_dict[scenario][option]["decision_makers_option_appreciation"]
+            for option in appreciate.input_dict["decision_makers_options"]
+        }
+        assert appreciate.output_dict[scenario]["highest_weighted_dmo"] == max(appreciations, key=appreciations.get)
+
+    for option in appreciate.input_dict["decision_makers_options"]:
+        appreciate.output_dict["Base case"][option]["decision_makers_option_appreciation"] = 0
+    appreciate._calculate_best_dmo()
+    assert appreciate.output_dict["Base case"]["highest_weighted_dmo"] == ""
@@ -0,0 +1,120 @@
+"""
+This module contains all tests for the appreciation curves in appreciation_curves.py
+"""
+
+import pytest
+import numpy as np
+from vlinder.appreciation_curves import (
+    APPRECIATION_CURVES,
+    CurveError,
+    appreciate_values,
+    get_curve,
+    parse_curve_parameters,
+)
+
+
+@pytest.mark.parametrize(
+    "text, expected_result",
+    [
+        (None, None),
+        (np.nan, None),
+        (2.5, np.array([2.5])),
+        ("10, 0.5", np.array([10, 0.5])),
+        ("0.2:10, 0.5:80", np.array([[0.2, 10], [0.5, 80]])),
+    ],
+)
+def test_parse_curve_parameters(text, expected_result):
+    """
+    This function tests parse_curve_parameters to convert the textual parameters into an array
+    :param text: textual parameters
+    :param expected_result: expected array
+    """
+    result = parse_curve_parameters(text)
+    if expected_result is None:
+        assert result is None
+    else:
+        assert np.array_equal(result, expected_result)
+
+
+@pytest.mark.parametrize(
+    "name, parameters, expected_error",
+    [
+        ("cubic", None, "curve 'cubic' not available"),
+        ("step", None, "'step' requires curve parameters"),
+        ("logistic", "-5, 0.5", "'logistic' requires a positive steepness and a midpoint"),
+        ("lookup", "0.5, 0.8", "'lookup' requires breakpoints of type 'x:y'"),
+        ("piecewise_linear", "0.5:80, 0.6:20", "breakpoints of 'piecewise_linear' should be increasing"),
+        ("piecewise_linear", "a:b", "cannot read curve parameters 'a:b'"),
+    ],
+)
+def test_get_curve_errors(name, parameters, expected_error):
+    """
+    This function tests get_curve to raise a CurveError for unknown curves and invalid parameters
+    :param name: name of the curve
+    :param parameters: textual parameters
+    :param expected_error: (start of the) expected error message
+    """
+    with pytest.raises(CurveError) as curve_error:
+        get_curve(name, parameters)
+    assert str(curve_error.value).startswith(f"Curve Error: {expected_error}")
+
+
+@pytest.mark.parametrize("name", ["linear", "sine", "logistic", "exponential"])
+def test_curves_run_from_zero_to_one(name):
+    """
+    This function tests whether the curves with default parameters start at 0 and end at 1
+    :param name: name of the curve
+    """
+    kernel, parameters = get_curve(name)
+    result = kernel(np.array([0.0, 1.0]), parameters)
+    assert np.allclose(result, [0, 1])
+
+
+@pytest.mark.parametrize(
+    "name, parameters, expected_result",
+    [
+        ("linear", None, [0, 25, 50, 100]),
+        ("sine", None, [0, 38.27, 70.71, 100]),
+        ("piecewise_linear", "0.5:80", [0, 40, 80, 100]),
+        ("step", "0.25, 0.75", [0, 50, 50, 100]),
+        ("lookup", "0.2:10, 0.5:60", [0, 10, 60, 100]),
+    ],
+)
+def test_appreciate_values(name, parameters, expected_result):
+    """
+    This function tests appreciate_values to return the correct appreciations for values between start (0) and end
+    point (20), for various curves.
+    :param name: name of the curve
+    :param parameters: textual parameters of the curve
+    :param expected_result: expected appreciations
+    """
+    result = appreciate_values(np.array([0, 5, 10, 20]), [0, 20], 0, get_curve(name, parameters))
+    assert np.round(result, 2).tolist() == expected_result
+
+
+def test_appreciate_values_smaller_the_better():
+    """
+    This function tests appreciate_values to mirror the curve and the boundaries when smaller is better
+    """
+    result = appreciate_values(np.array([-5, 5, 10, 25]), [0, 20], 1, get_curve("step", "0.25, 0.75"))
+    assert result.tolist() == [100, 50, 50, 0]
+
+
+def test_appreciate_values_equal_start_and_end():
+    """
+    This function tests appreciate_values to be indifferent (0) when start and end point are equal
+    """
+    result = appreciate_values(np.array([10.344, 10.345, 10.346]), [10.345, 10.345], 0, get_curve("logistic"))
+    assert result.tolist() == [0, 100, 100]
+
+
+def test_registry_curves_are_non_decreasing():
+    """
+    This function tests that all curves in the registry are non-decreasing, as the direction of the appreciation is
+    determined by 'smaller_the_better'.
+    """
+    example_parameters = {"piecewise_linear": "0.3:50, 0.6:60", "step": "0.1, 0.9", "lookup": "0.4:30, 0.7:90"}
+    core = np.linspace(0, 1, 101)
+    for name in APPRECIATION_CURVES:
+        kernel, parameters = get_curve(name, example_parameters.get(name))
+        assert np.all(np.diff(kernel(core, parameters)) >= 0)
@@ -0,0 +1,71 @@
+"""
+This module contains all tests for the branch-and-bound search
+"""
+
+import itertools
+import numpy as np
+from vlinder.branch_and_bound import branch_and_bound, reachable_totals
+
+
+class LinearScorer:
+    """
+    This class mimics a CandidateScorer with a linear appreciation, of which the upper bound over a box is exact.
+    """
+
+    def __init__(self, coefficients):
+        self.coefficients = np.array(coefficients, dtype=float)
+        self.evaluations = 0
+
+    def score(self, candidates):
+        """
+        This function returns the linear appreciation of each candidate.
+        """
+        self.evaluations += len(candidates)
+        return np.asarray(candidates) @ self.coefficients
+
+    def upper_bound(self, lower, upper):
+        """
+        This function returns the highest linear appreciation within each box.
+        """
+        return np.where(self.coefficients > 0, upper, lower) @ self.coefficients
+
+
+def test_reachable_totals():
+    """
+    This function tests reachable_totals to find all totals that can be distributed over the domains
+    """
+    unit, totals = reachable_totals([np.array([0.0, 1.5]), np.array([1.0, 2.0])], 3)
+    assert unit == 0.5
+    assert np.flatnonzero(totals[0]).tolist() == [2, 4, 5]
+    assert np.flatnonzero(totals[1]).tolist() == [2, 4]
+    assert np.flatnonzero(totals[2]).tolist() == [0]
+
+
+def test_branch_and_bound():
+    """
+    This function tests branch_and_bound to find the best distribution of all distributions within the domains, with
+    fewer evaluations than a full enumeration
+    """
+    coefficients = [1, 5, 2, 4, 3]
+    domains = [np.arange(0, 11, 2.0), np.arange(0, 5, 1.0), np.arange(3, 11, 1.0), np.arange(0, 4, 1.5), np.arange(11)]
+    distributions = np.array([point for point in itertools.product(*domains) if sum(point) == 20])
+    expected_value = (distributions @ coefficients).max()
+
+    scorer = LinearScorer(coefficients)
+    value, point, evaluations = branch_and_bound(scorer, domains, 20, (-np.inf, None), block_size=7)
+    assert value == expected_value
+    assert point.sum() == 20
+    assert all(value in domain for value, domain in zip(point, domains))
+    assert evaluations < len(distributions)
+
+
+def test_branch_and_bound_infeasible():
+    """
+    This function tests branch_and_bound to return the incumbent if no distribution fits the domains
+    """
+    value, point, evaluations = branch_and_bound(
+        LinearScorer([1, 1]), [np.array([0.0, 2.0]), np.array([0.0, 4.0])], 3, (1.0, np.array([1.0, 2.0]))
+    )
+    assert value == 1.0
+    assert point.tolist() == [1.0, 2.0]
+    assert evaluations == 0
@@ -0,0 +1,95 @@
+"""
+This module contains all tests for the EvaluationCache() class
+"""
+
+import numpy as np
+import pytest
+from vlinder.cache import CacheError, EvaluationCache
+
+
+def test_lookup_and_store():
+    """
+    This function tests lookup to find the stored candidates (rounded to decimals) and to count hits and misses
+    """
+    cache = EvaluationCache(decimals=3)
+    candidates = np.array([[1.0, 2.0], [0.0, 3.0]])
+    cache.store("case", candidates, [10.0, 20.0], [[1.0, 1.0], [2.0, 2.0]])
+
+    values, found = cache.lookup("case", np.array([[1.0001, 2.0], [-0.0, 3.0], [3.0, 0.0]]))
+    assert found.tolist() == [True, True, False]
+    assert values[:2].tolist() == [10.0, 20.0]
+    assert np.isnan(values[2])
+    # the same candidate of another case is not found
+    assert not cache.lookup("other case", candidates)[1].any()
+
+    assert cache.get_statistics() == {"hits": 2, "misses": 3, "hit_rate": 0.4, "size": 2}
+    appreciation, key_outputs = cache.get("case", [0.0, 3.0])
+    assert appreciation == 20.0
+    assert key_outputs.tolist() == [2.0, 2.0]
+    assert cache.get("case", [3.0, 0.0]) is None
+
+    cache.clear()
+    assert cache.get_statistics() == {"hits": 0, "misses": 0, "hit_rate": 0.0, "size": 0}
+
+
+def test_least_recently_used():
+    """
+    This function tests store to remove the least recently used entries when the cache is full
+    """
+    cache = EvaluationCache(max_size=2)
+    cache.store("case", [[1.0], [2.0]], [1.0, 2.0], [[1.0], [2.0]])
+    # using the first candidate makes the second the least recently used
+    cache.lookup("case", [[1.0]])
+    cache.store("case", [[3.0]], [3.0], [[3.0]])
+
+    assert len(cache) == 2
+    assert cache.lookup("case", [[1.0], [2.0], [3.0]])[1].tolist() == [True, False, True]
+
+    # a full cache removes a tenth more entries, over all case keys, and reuses their slots
+    cache = EvaluationCache(max_size=20)
+    cache.store("case", np.arange(10.0)[:, np.newaxis], np.arange(10.0), np.zeros((10, 1)))
+    cache.store("other case", np.arange(10.0)[:, np.newaxis], np.arange(10.0), np.zeros((10, 2)))
+    cache.store("case", [[10.0], [10.0]], [10.0, 10.0], [[1.0], [1.0]])
+    assert len(cache) == 18
+    assert cache.lookup("case", np.arange(11.0)[:, np.newaxis])[1].tolist() == [False] * 3 + [True] * 8
+    assert cache.get("case", [10.0])[0] == 10.0
+    capacity = len(cache.tables["case"].rows)
+    cache.store("case", [[11.0], [12.0]], [11.0, 12.0], [[1.0], [1.0]])
+    assert len(cache.tables["case"].rows) == capacity
+
+
+def test_save_and_load(tmp_path):
+    """
+    This function tests save to write the cache to a binary file, from which a new cache is loaded with the same
+    entries and order of use
+    :param tmp_path: temporary directory
+    """
+    path = tmp_path / "cache.npz"
+    cache = EvaluationCache(path=path)
+    cache.store("case", [[1.5, 2.5], [2.5, 1.5]], [1.0, 2.0], [[[1.0, 2.0]], [[3.0, 4.0]]])
+    cache.store("other case", [[0.5, 0.5]], [3.0], [[1.0, 1.0]])
+    cache.lookup("case", [[1.5, 2.5]])
+    cache.save()
+    assert [file.name for file in tmp_path.iterdir()] == ["cache.npz"]
+
+    loaded = EvaluationCache(max_size=2, path=path)
+    assert len(loaded) == 2
+    assert loaded.get("case", [2.5, 1.5]) is None
+    assert loaded.get("case", [1.5, 2.5])[1].tolist() == [[1.0, 2.0]]
+    assert loaded.get("other case", [0.5, 0.5])[0] == 3.0
+
+    with pytest.raises(CacheError) as cache_error:
+        EvaluationCache().save()
+    assert str(cache_error.value) == "Cache Error: provide a path to save the cache"
+
+
+def test_load_error(tmp_path):
+    """
+    This function tests load to raise a CacheError for a corrupt file
+    :param tmp_path: temporary directory
+    """
+    path = tmp_path / "cache.npz"
+    path.write_text("{", encoding="utf-8")
+    with pytest.raises(CacheError) as cache_error:
+        EvaluationCache(path=path)
+    assert str(cache_error.value) == f"Cache Error: cannot read cache '{path}'"
@@ -523,3 +523,58 @@ def test_validate_start_and_endpoint(import_beerwiser_json, automatic_list, expe
         import_beerwiser_json._validate_start_and_endpoint()
 
     assert str(template_error.value) == f"Template Error: {expected_error}"
+
+
+@pytest.mark.parametrize(
+    "curves, parameters, expected_error",
+    [
+        (["logistic", np.nan, np.nan], ["5, 0.4", np.nan, np.nan], None),
+        (
+            ["cubic", np.nan, np.nan],
+            [np.nan, np.nan, np.nan],
+            "Template Error: Invalid curve for key output 'Accidents reduction'. curve 'cubic' not available.",
+        ),
+        (
+            [np.nan, "lookup", np.nan],
+            [np.nan, "0.5", np.nan],
+            "Template Error: Invalid curve for key output 'Water use reduction'. 'lookup' requires breakpoints of "
+            "type 'x:y'",
+        ),
+    ],
+)
+def test_validate_curves(curves, parameters, expected_error):
+    """
+    This function tests _validate_curves to raise a TemplateError for unknown curves or invalid curve parameters.
+    :param curves: values of the optional 'curve' column
+    :param parameters: values of the optional 'curve_parameters' column
+    :param expected_error: the expected error (None if the curves are valid)
+    """
+    importer = CaseImporter(Path.cwd() / "src/vlinder/data", "Beerwiser", "csv")
+    importer._create_dataframes_dict("key_outputs")
+    importer.dataframes_dict["key_outputs"]["curve"] = curves
+    importer.dataframes_dict["key_outputs"]["curve_parameters"] = parameters
+
+    if expected_error is None:
+        assert importer._validate_curves() is None
+    else:
+        with pytest.raises(TemplateError) as template_error:
+            importer._validate_curves()
+        assert str(template_error.value).startswith(expected_error)
+
+
+def test_optional_curve_columns():
+    """
+    This function tests that the optional curve columns do not raise a warning and end up in the input dictionary.
+    """
+    importer = CaseImporter(Path.cwd() / "src/vlinder/data", "Beerwiser", "csv")
+    data = pd.read_csv(importer.path_base / "key_outputs.csv", sep=";")
+    data["curve"] = ["sine", np.nan, "step"]
+    data["curve_parameters"] = [np.nan, np.nan, "0.2, 0.6"]
+
+    with warnings.catch_warnings():
+        warnings.simplefilter("error")
+        checked_data = importer._check_data_columns(data, "key_outputs")
+    importer._convert_to_numpy_arrays("key_outputs", checked_data)
+
+    assert importer.input_dict["key_output_curve"][0] == "sine"
+    assert importer.input_dict["key_output_curve_parameters"][2] == "0.2, 0.6"
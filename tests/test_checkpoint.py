@@ -0,0 +1,55 @@
+"""
+This module contains all tests for the Checkpoint() class
+"""
+
+import pytest
+from vlinder.checkpoint import Checkpoint, CheckpointError
+
+
+def test_save_and_load(tmp_path):
+    """
+    This function tests save to write the state of the search, and load to read it for the same key only
+    :param tmp_path: temporary directory
+    """
+    path = tmp_path / "checkpoint.json"
+    checkpoint = Checkpoint(path, interval=0)
+    assert checkpoint.load({"case_hash": "abc"}) is None
+    assert checkpoint.read() is None
+
+    state = {"remaining": [[10, 20]], "best_appreciated_value": float("-inf"), "best_combination": [1.5, 2.5]}
+    assert checkpoint.save({"case_hash": "abc", "lattice": (10, 2)}, state)
+    assert Checkpoint(path).load({"case_hash": "abc", "lattice": (10, 2)}) == state
+    assert Checkpoint(path).read() == {"key": {"case_hash": "abc", "lattice": [10, 2]}, "state": state}
+    # the temporary file is replaced by the checkpoint
+    assert [file.name for file in tmp_path.iterdir()] == ["checkpoint.json"]
+
+    with pytest.raises(CheckpointError) as checkpoint_error:
+        checkpoint.load({"case_hash": "def", "lattice": (10, 2)})
+    assert str(checkpoint_error.value) == (
+        f"Checkpoint Error: checkpoint '{path}' belongs to another case or search, remove it to start a new search"
+    )
+
+
+def test_save_interval(tmp_path):
+    """
+    This function tests save to write at most once per interval, unless forced
+    :param tmp_path: temporary directory
+    """
+    path = tmp_path / "checkpoint.json"
+    checkpoint = Checkpoint(path, interval=3600)
+    assert not checkpoint.save({}, {"evaluations": 1})
+    assert not path.exists()
+    assert checkpoint.save({}, {"evaluations": 2}, force=True)
+    assert checkpoint.load({}) == {"evaluations": 2}
+
+
+def test_load_error(tmp_path):
+    """
+    This function tests load to raise a CheckpointError for a corrupt checkpoint
+    :param tmp_path: temporary directory
+    """
+    path = tmp_path / "checkpoint.json"
+    path.write_text("{", encoding="utf-8")
+    with pytest.raises(CheckpointError) as checkpoint_error:
+        Checkpoint(path).load({})
+    assert str(checkpoint_error.value) == f"Checkpoint Error: cannot read checkpoint '{path}'"
@@ -0,0 +1,123 @@
+"""
+This module contains all tests for the Dominance() class and the blocked dominance functions
+"""
+
+import copy
+import pytest
+import numpy as np
+from vlinder.appreciate import Appreciate
+from vlinder.dominance import Dominance, DominanceError, non_dominated, dominance_counts, distance_to_front
+from .params import INPUT_DICT_BEERWISER, OUTPUT_DICT_BEERWISER
+
+
+@pytest.fixture(name="dominance_beerwiser")
+def fixture_dominance_beerwiser():
+    """
+    This fixture initialises an appreciated Beerwiser case.
+    :return: a Dominance class for Beerwiser
+    """
+    input_dict = copy.deepcopy(INPUT_DICT_BEERWISER)
+    # only use the key outputs, as other tests may have appreciated the shared output dictionary already
+    output_dict = {
+        scenario: {
+            dmo: {"key_outputs": dict(value["key_outputs"])}
+            for dmo, value in dmos.items()
+            if dmo != "highest_weighted_dmo"
+        }
+        for scenario, dmos in OUTPUT_DICT_BEERWISER.items()
+    }
+    Appreciate(input_dict, output_dict).appreciate_all_scenarios()
+    return Dominance(input_dict, output_dict)
+
+
+def brute_force_dominance(values):
+    """
+    This helper function compares all options with all other options, one pair at a time.
+    :param values: array of shape (options, criteria)
+    :return: a matrix where [i, j] indicates whether option i dominates option j
+    """
+    return np.array([[np.all(left >= right) and np.any(left > right) for right in values] for left in values])
+
+
+def test_non_dominated():
+    """
+    This function tests non_dominated to return the Pareto front of a small example
+    """
+    values = np.array([[1, 5], [2, 4], [1, 4], [3, 1], [2, 4], [0, 0]])
+    result = non_dominated(values, block_size=2)
+    assert result.tolist() == [True, True, False, True, True, False]
+
+
+def test_dominance_counts():
+    """
+    This function tests dominance_counts to return the number of dominating and dominated options
+    """
+    values = np.array([[1, 5], [2, 4], [1, 4], [3, 1], [2, 4], [0, 0]])
+    dominated_by, dominates = dominance_counts(values, block_size=4)
+    assert dominated_by.tolist() == [0, 0, 3, 0, 0, 5]
+    assert dominates.tolist() == [2, 2, 1, 1, 2, 0]
+
+
+def test_blocked_dominance_equals_brute_force():
+    """
+    This function tests that the blocked functions yield the same results as a pairwise comparison, also for options
+    with ties and for blocks that are smaller than the number of options.
+    """
+    rng = np.random.default_rng(42)
+    values = rng.integers(0, 6, size=(300, 3)).astype(float)
+    expected = brute_force_dominance(values)
+
+    assert np.array_equal(non_dominated(values, block_size=32), ~expected.any(axis=0))
+    dominated_by, dominates = dominance_counts(values, block_size=32)
+    assert np.array_equal(dominated_by, expected.sum(axis=0))
+    assert np.array_equal(dominates, expected.sum(axis=1))
+
+    is_front = non_dominated(values)
+    dominated_by, dominates = dominance_counts(values, is_front, block_size=32)
+    assert np.array_equal(dominated_by, expected.sum(axis=0))
+    assert np.array_equal(dominates, expected.sum(axis=1))
+
+    front = values[is_front]
+    expected_distances = np.sqrt(((values[:, np.newaxis] - front[np.newaxis]) ** 2).sum(axis=2)).min(axis=1)
+    assert np.allclose(distance_to_front(values, is_front, block_size=32), expected_distances)
+
+
+def test_distance_to_front():
+    """
+    This function tests distance_to_front to return the distance to the closest non-dominated option
+    """
+    values = np.array([[0, 4], [3, 0], [0, 1], [3, 4]])
+    result = distance_to_front(values, non_dominated(values), block_size=3)
+    assert np.round(result, 2).tolist() == [3, 4, 4.24, 0]
+
+
+@pytest.mark.parametrize("level, expected_columns", [("key_output", 3), ("theme", 3)])
+def test_analyse(dominance_beerwiser, level, expected_columns):
+    """
+    This function tests analyse to return a dominance analysis for all decision makers options of Beerwiser
+    :param dominance_beerwiser: a Dominance class for Beerwiser
+    :param level: the level on which decision makers options are compared
+    :param expected_columns: the expected number of criteria
+    """
+    assert dominance_beerwiser.available_levels[level]("Base case").shape == (3, expected_columns)
+    result = dominance_beerwiser.analyse("Base case", level)
+    assert result.index.tolist() == ["Equal spread", "Focus on training", "Focus on water recycling"]
+    assert result["non_dominated"].tolist() == [True, True, True]
+    assert result["distance_to_front"].tolist() == [0, 0, 0]
+
+
+@pytest.mark.parametrize(
+    "scenario, level, expected_error",
+    [
+        ("Unknown", "key_output", "Dominance Error: 'Unknown' is not a valid scenario"),
+        ("Base case", "kpi", "Dominance Error: 'kpi' is not a valid level. Choose from ['key_output', 'theme']"),
+    ],
+)
+def test_analyse_errors(dominance_beerwiser, scenario, level, expected_error):
+    """
+    This function tests analyse to raise a DominanceError for an invalid scenario or level
+    :param dominance_beerwiser: a Dominance class for Beerwiser
+    """
+    with pytest.raises(DominanceError) as dominance_error:
+        dominance_beerwiser.analyse(scenario, level)
+    assert str(dominance_error.value) == expected_error
@@ -2,6 +2,7 @@
 """This module contains all tests for the Evaluate() class"""
 from pathlib import Path
 import pytest
+import numpy as np
 from vlinder.trbs import TheResponsibleBusinessSimulator
 from vlinder.evaluate import Evaluate, EvaluationError
 from vlinder.utils import round_all_dict_values
@@ -312,3 +313,118 @@ def test_evaluate_all_scenarios_only_structure(evaluate_beerwiser):
     result_structure = {key: type(value) for key, value in result.items()}
     expected_structure = {"Base case": dict, "Optimistic": dict, "Pessimistic": dict}
     assert result_structure == expected_structure
+
+
+@pytest.mark.parametrize(
+    "operator, arg1, arg2",
+    [
+        (operator, [8, 20, 0, 121, 5, 10, 1e-10], [12, 0, 0, -11, 10, 10, 0])
+        for operator in ["-", "+", "*", "/", "-*", "-/", "<", ">", "<=", ">=", "min", "max"]
+    ],
+)
+def test_vectorized_operators(evaluate_beerwiser, operator, arg1, arg2):
+    """
+    This function tests whether the vectorized operators return the same values as the operators for single values.
+    :param evaluate_beerwiser: an Evaluate() class for Beerwiser
+    :param operator: operator that is tested
+    :param arg1: values of first argument
+    :param arg2: values of second argument
+    """
+    result = evaluate_beerwiser.vectorized_operators_dict[operator](np.array(arg1), np.array(arg2))
+    expected_result = [evaluate_beerwiser.operators_dict[operator](x, y) for x, y in zip(arg1, arg2)]
+    assert result.tolist() == expected_result
+
+
+@pytest.mark.parametrize("scenario", ["Base case", "Optimistic", "Pessimistic"])
+def test_evaluate_internal_variable_inputs(evaluate_beerwiser, scenario):
+    """
+    This function tests evaluate_internal_variable_inputs to return the same key output values as
+    evaluate_all_dependencies for all decision makers options of Beerwiser.
+    :param evaluate_beerwiser: an Evaluate() class for Beerwiser
+    :param scenario: name of the scenario
+    """
+    result = evaluate_beerwiser.evaluate_internal_variable_inputs(
+        scenario, INPUT_DICT_BEERWISER["decision_makers_option_value"]
+    )
+    expected_result = [
+        list(evaluate_beerwiser.evaluate_all_dependencies(scenario, dmo)["key_outputs"].values())
+        for dmo in INPUT_DICT_BEERWISER["decision_makers_options"]
+    ]
+    assert result.tolist() == expected_result
+
+
+def test_evaluate_internal_variable_inputs_evaluation_error():
+    """
+    This function tests evaluate_internal_variable_inputs to raise an EvaluationError for an undefined operator.
+    """
+    input_dict = INPUT_DICT_BEERWISER.copy()
+    input_dict["operator"] = np.array(["/*"] * len(input_dict["operator"]))
+    with pytest.raises(EvaluationError) as evaluation_error:
+        Evaluate(input_dict).evaluate_internal_variable_inputs("Base case", [[1, 2]])
+    assert str(evaluation_error.value) == "Evaluation Error: operator /* not available"
+
+
+def test_evaluate_scenarios(evaluate_beerwiser):
+    """
+    This function tests evaluate_scenarios to return the same key output values as evaluating each scenario separately
+    :param evaluate_beerwiser: an Evaluate() class for Beerwiser
+    """
+    scenarios = ["Pessimistic", "Base case"]
+    values = INPUT_DICT_BEERWISER["decision_makers_option_value"]
+    result = evaluate_beerwiser.evaluate_scenarios(scenarios, values)
+
+    assert result.shape == (2, len(values), 3)
+    for index, scenario in enumerate(scenarios):
+        assert np.array_equal(result[index], evaluate_beerwiser.evaluate_internal_variable_inputs(scenario, values))
+
+
+@pytest.mark.parametrize(
+    "operator, arg1, arg2, expected_result",
+    [
+        ("-", (1, 2), (3, 5), (-4, -1)),
+        ("*", (-1, 2), (3, 5), (-5, 10)),
+        ("*", (0, 2), (3, np.inf), (0, np.inf)),
+        ("/", (1, 2), (-4, -1), (-2, -0.25)),
+        ("/", (1, 2), (0, 0), (0, 0)),
+        ("/", (1, 2), (-1, 1), (-np.inf, np.inf)),
+        ("-/", (2, 4), (1, 2), (-4, -1)),
+        (">", (1, 2), (0, 0.5), (1, 1)),
+        (">", (1, 2), (1.5, 3), (0, 1)),
+        ("<=", (1, 2), (3, 4), (1, 1)),
+        ("max", (1, 2), (0, 3), (1, 3)),
+    ],
+)
+def test_interval_operators(evaluate_beerwiser, operator, arg1, arg2, expected_result):
+    """
+    This function tests the interval operators to return the bounds of all results for arguments within the intervals
+    :param evaluate_beerwiser: an Evaluate() class for Beerwiser
+    :param operator: operator that is tested
+    :param arg1: interval (lower, upper) of the first argument
+    :param arg2: interval (lower, upper) of the second argument
+    :param expected_result: interval (lower, upper) of the result
+    """
+    result = evaluate_beerwiser.interval_operators_dict[operator](
+        tuple(np.array(arg1, dtype=float)), tuple(np.array(arg2, dtype=float))
+    )
+    assert tuple(float(bound) for bound in result) == expected_result
+
+
+def test_evaluate_scenario_intervals(evaluate_dsm):
+    """
+    This function tests evaluate_scenario_intervals to return bounds that contain the key output values of all points
+    within the boxes, and to return the key output values themselves for boxes that consist of a single point.
+    :param evaluate_dsm: an Evaluate() class for DSM
+    """
+    scenarios = list(evaluate_dsm.input_dict["scenarios"])
+    generator = np.random.default_rng(0)
+    lower = generator.uniform(0, 1, (50, len(evaluate_dsm.input_dict["internal_variable_inputs"])))
+    upper = lower + generator.uniform(0, 1, lower.shape)
+    result_lower, result_upper = evaluate_dsm.evaluate_scenario_intervals(scenarios, lower, upper)
+
+    for _ in range(10):
+        values = evaluate_dsm.evaluate_scenarios(scenarios, generator.uniform(lower, upper))
+        assert np.all((result_lower <= values + 1e-9) & (values <= result_upper + 1e-9))
+
+    result_lower, result_upper = evaluate_dsm.evaluate_scenario_intervals(scenarios, lower, lower)
+    assert np.array_equal(result_lower, evaluate_dsm.evaluate_scenarios(scenarios, lower))
+    assert np.array_equal(result_upper, result_lower)
@@ -0,0 +1,77 @@
+"""
+This module contains all tests for the EvolutionarySearch() class
+"""
+
+import json
+import numpy as np
+from vlinder.evolutionary import EvolutionarySearch
+
+
+class QuadraticScorer:  # pylint: disable=too-few-public-methods
+    """
+    This class mimics a CandidateScorer with a single optimum at a given target.
+    """
+
+    def __init__(self, target):
+        self.target = np.array(target)
+
+    def score(self, candidates):
+        """
+        This function returns the negative squared distance to the target.
+        """
+        return -((np.asarray(candidates) - self.target) ** 2).sum(axis=1)
+
+
+def run_search(generations, seed=0, state=None):
+    """
+    This function runs an evolutionary search towards [10, 30, 60] from two corners of the simplex.
+    :param generations: number of generations
+    :param seed: seed of the random number generator
+    :param state: state of a previous search to resume from
+    :return: the EvolutionarySearch
+    """
+    search = EvolutionarySearch(QuadraticScorer([10, 30, 60]), seed=seed)
+    if state is None:
+        search.initialize([[100, 0, 0], [0, 100, 0]], population_size=20)
+    else:
+        search.set_state(state)
+    while search.generation < generations:
+        search.step()
+    return search
+
+
+def test_evolutionary_search():
+    """
+    This function tests EvolutionarySearch to find the optimum on the simplex, to keep all distributions on the
+    simplex and to count the evaluations of each generation
+    """
+    search = run_search(100)
+    value, point = search.get_best()
+
+    assert value > -1
+    assert np.allclose(point, [10, 30, 60], atol=1)
+    assert np.allclose(search.population.sum(axis=2), 100)
+    assert np.all(search.population >= 0)
+    assert search.population.shape == (2, 10, 3)
+    assert search.evaluations == 20 + 100 * search.get_generation_size()
+
+
+def test_evolutionary_search_seed():
+    """
+    This function tests EvolutionarySearch to be reproducible with a seed
+    """
+    assert np.array_equal(run_search(10, seed=1).population, run_search(10, seed=1).population)
+    assert not np.array_equal(run_search(10, seed=1).population, run_search(10, seed=2).population)
+
+
+def test_evolutionary_search_state():
+    """
+    This function tests a search that is resumed from a (JSON) state to continue exactly as an uninterrupted search
+    """
+    state = json.loads(json.dumps(run_search(5).get_state()))
+    resumed_search = run_search(10, state=state)
+    search = run_search(10)
+
+    assert np.array_equal(resumed_search.population, search.population)
+    assert np.array_equal(resumed_search.values, search.values)
+    assert resumed_search.evaluations == search.evaluations
@@ -0,0 +1,102 @@
+"""
+This module contains all tests for the SimplexLattice() class
+"""
+
+from math import comb
+import pytest
+import numpy as np
+from vlinder.lattice import LatticeError, SimplexLattice
+
+
+@pytest.mark.parametrize("units, num_parts", [(0, 3), (5, 1), (4, 2), (12, 5), (6, 8)])
+def test_unrank_units_enumerates_all_compositions(units, num_parts):
+    """
+    This function tests unrank_units to generate every composition of the units exactly once
+    :param units: number of units to distribute
+    :param num_parts: number of parts
+    """
+    lattice = SimplexLattice(units, units, num_parts)
+    points = lattice.unrank_units(np.arange(lattice.size))
+
+    assert lattice.size == comb(units + num_parts - 1, num_parts - 1)
+    assert points.shape == (lattice.size, num_parts)
+    assert len({tuple(point) for point in points}) == lattice.size
+    assert np.all(points >= 0)
+    assert np.all(points.sum(axis=1) == units)
+
+
+def test_unrank():
+    """
+    This function tests unrank to return the lattice points in colexicographic order
+    """
+    lattice = SimplexLattice(10, 2, 3)
+    assert lattice.unrank(np.arange(lattice.size)).tolist() == [
+        [0, 0, 10],
+        [0, 5, 5],
+        [5, 0, 5],
+        [0, 10, 0],
+        [5, 5, 0],
+        [10, 0, 0],
+    ]
+
+
+def test_unrank_floating_point_steps():
+    """
+    This function tests unrank to return all points for a step size that cannot be represented exactly, where every
+    point sums to the total.
+    """
+    lattice = SimplexLattice(15700, 15, 3)
+    points = lattice.unrank(np.arange(lattice.size))
+    assert len(points) == comb(17, 2)
+    assert np.allclose(points.sum(axis=1), 15700)
+    assert np.allclose(np.unique(points[:, 0]), np.arange(16) * 15700 / 15)
+
+
+def test_chunks():
+    """
+    This function tests chunks to lazily generate the same points as a single unrank, also for a partial range
+    """
+    lattice = SimplexLattice(100, 20, 4)
+    expected_result = lattice.unrank(np.arange(lattice.size))
+
+    chunks = list(lattice.chunks(chunk_size=300))
+    assert [start for start, _ in chunks] == list(range(0, lattice.size, 300))
+    assert np.array_equal(np.vstack([points for _, points in chunks]), expected_result)
+
+    partial = np.vstack([points for _, points in lattice.chunks(chunk_size=7, start=50, stop=75)])
+    assert np.array_equal(partial, expected_result[50:75])
+
+    # with a preallocated buffer, every chunk is a view of the same memory
+    buffer = np.empty((7, 4))
+    for start, points in lattice.chunks(chunk_size=7, start=50, stop=75, out=buffer):
+        stop = min(start + 7, 75)
+        assert np.shares_memory(points, buffer)
+        assert np.array_equal(points, expected_result[start:stop])
+
+
+@pytest.mark.parametrize(
+    "units, num_parts, indices, expected_error",
+    [
+        (4, 0, [0], "Lattice Error: the number of parts should be at least 1, not 0"),
+        (2.5, 2, [0], "Lattice Error: the number of units should be a non-negative integer, not 2.5"),
+        (4, 2, [5], "Lattice Error: indices should be within [0, 5)"),
+        (
+            1000,
+            20,
+            [0],
+            f"Lattice Error: the lattice of 1000 units over 20 parts has {comb(1019, 19)} points, which is more than "
+            f"can be indexed ({np.iinfo(np.int64).max}), use fewer units or parts",
+        ),
+    ],
+)
+def test_lattice_errors(units, num_parts, indices, expected_error):
+    """
+    This function tests SimplexLattice to raise a LatticeError for invalid input
+    :param units: number of units to distribute
+    :param num_parts: number of parts
+    :param indices: indices to unrank
+    :param expected_error: expected error message
+    """
+    with pytest.raises(LatticeError) as lattice_error:
+        SimplexLattice(10, units, num_parts).unrank(indices)
+    assert str(lattice_error.value) == expected_error
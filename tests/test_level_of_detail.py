@@ -0,0 +1,72 @@
+"""
+This module contains the tests for the ClusterTree class.
+"""
+
+import json
+import pytest
+from vlinder.level_of_detail import ClusterTree
+
+
+@pytest.fixture(name="cluster_tree")
+def fixture_cluster_tree():
+    """
+    This fixture creates the cluster tree of a key output with 2 arguments of generation 1, 2 of generation 2 and 4 of
+    generation 3 (on 2 hierarchy levels), of which the first 2 generations are shown.
+    :return: a tuple (ClusterTree, nodes, edges)
+    """
+    generations = {"ko": 0, "a": 1, "b": 1, "c": 2, "d": 2, "e": 3, "f": 3, "g": 3, "h": 3}
+    levels = {"ko": 3, "a": 2, "b": 2, "c": 1, "d": 1, "e": 0, "f": 0, "g": 0, "h": 1}
+    edges = [("a", "ko"), ("b", "ko"), ("c", "a"), ("d", "b"), ("e", "c"), ("f", "c"), ("g", "d"), ("h", "d")]
+    return ClusterTree(generations, levels, max_nodes=3), list(generations), edges
+
+
+def test_cluster_tree(cluster_tree):
+    """
+    This function tests that the generations after the first max_nodes nodes are clustered, and that a cluster with
+    more than max_nodes nodes is divided per hierarchy level.
+    """
+    tree, _, _ = cluster_tree
+    assert tree.members == {
+        "cluster:2": ["c", "d"],
+        "cluster:3": ["e", "f", "g", "h"],
+        "cluster:3:0": ["e", "f", "g"],
+        "cluster:3:1": ["h"],
+    }
+    assert tree.labels["cluster:3"] == "4 variables (generation 3)"
+    assert tree.get_representative("e") == "cluster:3"
+    assert tree.get_representative("e", expanded={"cluster:3"}) == "cluster:3:0"
+    assert tree.get_representative("a") == "a"
+
+
+def test_collapse(cluster_tree):
+    """
+    This function tests that collapse shows every node as its highest collapsed cluster, without duplicate edges.
+    """
+    tree, nodes, edges = cluster_tree
+    shown, shown_edges = tree.collapse(nodes, edges)
+    assert shown == ["ko", "a", "b", "cluster:2", "cluster:3"]
+    assert shown_edges == [
+        ("a", "ko"),
+        ("b", "ko"),
+        ("cluster:2", "a"),
+        ("cluster:2", "b"),
+        ("cluster:3", "cluster:2"),
+    ]
+
+    shown, shown_edges = tree.collapse(nodes, edges, expanded={"cluster:2", "cluster:3"})
+    assert shown == ["ko", "a", "b", "c", "d", "cluster:3:0", "cluster:3:1"]
+    assert ("cluster:3:1", "d") in shown_edges and ("cluster:3:1", "c") not in shown_edges
+
+
+def test_get_script(cluster_tree):
+    """
+    This function tests that the script contains the cluster tree as JSON, which cannot end the script element.
+    """
+    tree, nodes, edges = cluster_tree
+    items = {node: {"id": node, "label": f"</script>{node}"} for node in nodes}
+    script = tree.get_script(nodes, edges, items)
+    assert script.count("</script>") == 1
+    start, stop = script.index("var clusterTree = ") + len("var clusterTree = "), script.index(";\n")
+    data = json.loads(script[start:stop])
+    assert data["parent"]["h"] == "cluster:3:1"
+    assert data["items"]["a"]["label"] == "</script>a"
@@ -1,11 +1,27 @@
+# Ignore PEP8 protected-access to client class | pylint: disable=W0212
 """
 This module contains all tests for the Optimize() class
 """
 
+import copy
 import pytest
 import numpy as np
-from vlinder.optimize import Optimize
-from vlinder.utils import get_values_from_target, suppress_print
+from vlinder.aggregate import Aggregate
+from vlinder.appreciate import Appreciate
+from vlinder.evaluate import Evaluate
+from vlinder.lattice import SimplexLattice
+from vlinder.block_search import search_blocks
+from vlinder.cache import EvaluationCache
+from vlinder.checkpoint import Checkpoint
+from vlinder.optimize import (
+    CandidateScorer,
+    Optimize,
+    OptimizeError,
+    _neighborhood_offsets,
+)
+from vlinder.pattern_search import pattern_search
+from vlinder.progress import Progress
+from vlinder.utils import get_values_from_target, hash_case, suppress_print
 from .params import INPUT_DICT_BEERWISER, OUTPUT_DICT_BEERWISER
 
 
@@ -184,3 +200,759 @@ def test_optimizer_already_optimal(optimize_beerwiser_aleady_optimal):
         150000,
     ]  # The best DMO is the 'Equal spread', as it has a fictional weighted apprecation of 100
     assert np.array_equal(result_best_dmo, expected_best_dmo)
+
+
+def test_candidate_scorer():
+    """
+    This function tests CandidateScorer to return the same appreciation as a full evaluation and appreciation of the
+    decision makers options, when the boundaries are the same.
+    """
+    input_dict = copy.deepcopy(INPUT_DICT_BEERWISER)
+    output_dict = copy.deepcopy(OUTPUT_DICT_BEERWISER)
+    Appreciate(input_dict, output_dict).appreciate_all_scenarios()
+
+    result = CandidateScorer(input_dict, output_dict, "Base case").score(input_dict["decision_makers_option_value"])
+    expected_result = [
+        output_dict["Base case"][dmo]["decision_makers_option_appreciation"]
+        for dmo in input_dict["decision_makers_options"]
+    ]
+    assert np.allclose(result, expected_result)
+
+
+@pytest.mark.parametrize("block_size", [1, 4, 10000])
+def test_grid_search_lattice(block_size):
+    """
+    This function tests grid_search to find the same optimum for a lattice and a list of combinations, independent of
+    the size of the blocks that are evaluated at once.
+    :param block_size: number of combinations that are evaluated at once
+    """
+    best_dmo_data = {
+        "dmo_name": "Equal spread",
+        "decision_maker_options": np.array([150000, 150000]),
+        "max_appreciated_value": 65.51984611881377,
+    }
+    lattice = Optimize.generate_lattice(300000, 10000, 2)
+    combinations = Optimize.generate_combinations(300000, 10000, 2)
+
+    optimize_lattice = Optimize(copy.deepcopy(INPUT_DICT_BEERWISER), copy.deepcopy(OUTPUT_DICT_BEERWISER))
+    result = optimize_lattice.grid_search("Base case", lattice, "Optimized DMO", best_dmo_data, block_size)
+    optimize_list = Optimize(copy.deepcopy(INPUT_DICT_BEERWISER), copy.deepcopy(OUTPUT_DICT_BEERWISER))
+    expected_result = optimize_list.grid_search("Base case", combinations, "Optimized DMO", best_dmo_data)
+
+    assert result == expected_result
+    assert np.array_equal(
+        optimize_lattice.commit()["decision_makers_option_value"][-1],
+        optimize_list.commit()["decision_makers_option_value"][-1],
+    )
+
+
+@pytest.mark.parametrize("workers", [2, 3])
+def test_grid_search_workers(workers):
+    """
+    This function tests grid_search to find the same optimum when the lattice is divided over multiple processes.
+    :param workers: number of processes
+    """
+    best_dmo_data = {
+        "dmo_name": "Equal spread",
+        "decision_maker_options": np.array([150000, 150000]),
+        "max_appreciated_value": 65.51984611881377,
+    }
+    lattice = Optimize.generate_lattice(300000, 1000, 2)
+
+    optimize_parallel = Optimize(copy.deepcopy(INPUT_DICT_BEERWISER), copy.deepcopy(OUTPUT_DICT_BEERWISER))
+    result = optimize_parallel.grid_search("Base case", lattice, "Optimized DMO", best_dmo_data, 50, workers)
+    optimize_serial = Optimize(copy.deepcopy(INPUT_DICT_BEERWISER), copy.deepcopy(OUTPUT_DICT_BEERWISER))
+    expected_result = optimize_serial.grid_search("Base case", lattice, "Optimized DMO", best_dmo_data, 50)
+
+    assert result == expected_result
+    assert np.array_equal(
+        optimize_parallel.commit()["decision_makers_option_value"][-1],
+        optimize_serial.commit()["decision_makers_option_value"][-1],
+    )
+
+
+def test_search_lattice_tie_break():
+    """
+    This function tests the reduction of the parallel search to select the lowest index in case of equal values, such
+    that the result does not depend on the number of processes.
+    """
+    input_dict = copy.deepcopy(INPUT_DICT_BEERWISER)
+    # all key outputs are weighted with 0, so all combinations have the same appreciation
+    input_dict["key_output_weight"] = np.zeros(len(input_dict["key_output_weight"]))
+    optimize = Optimize(input_dict, copy.deepcopy(OUTPUT_DICT_BEERWISER))
+    lattice = Optimize.generate_lattice(300000, 100, 2)
+
+    result = optimize._search_lattice("Base case", lattice, 10, 4)
+    assert result[0] == 0
+    assert result[1] == 0
+    assert np.array_equal(result[2], lattice.unrank([0])[0])
+
+
+class QuadraticScorer:  # pylint: disable=too-few-public-methods
+    """
+    This class mimics a CandidateScorer with a single optimum at a given target.
+    """
+
+    def __init__(self, target):
+        self.target = np.array(target)
+
+    def score(self, candidates):
+        """
+        This function returns the negative squared distance to the target.
+        """
+        return -((np.asarray(candidates) - self.target) ** 2).sum(axis=1)
+
+
+def test_pattern_search():
+    """
+    This function tests pattern_search to find the optimum on the simplex and to respect the evaluation budget.
+    """
+    value, point, evaluations = pattern_search(QuadraticScorer([10, 30, 60]), [100, 0, 0], 25, 1e-6, 10000)
+    assert np.allclose(point, [10, 30, 60])
+    assert np.isclose(point.sum(), 100)
+    assert value == pytest.approx(0, abs=1e-9)
+    assert evaluations < 10000
+
+    _, point, evaluations = pattern_search(QuadraticScorer([10, 30, 60]), [100, 0, 0], 25, 1e-6, 20)
+    assert evaluations == 20
+    assert np.all(point >= 0)
+
+
+def test_get_starting_points():
+    """
+    This function tests get_starting_points to rescale the DMOs to the budget and to add an equal spread
+    """
+    input_dict = copy.deepcopy(INPUT_DICT_BEERWISER)
+    input_dict["decision_makers_option_value"] = np.array([[150, 150], [0, 0], [300, 0], [2, 2]])
+    result = Optimize(input_dict, OUTPUT_DICT_BEERWISER).get_starting_points(600)
+    assert result.tolist() == [[300, 300], [600, 0]]
+
+
+def test_continuous_search():
+    """
+    This function tests optimize_single_scenario with the continuous method to find at least the optimum of the grid
+    search with fewer evaluations
+    """
+    input_dict = copy.deepcopy(INPUT_DICT_BEERWISER)
+    output_dict = copy.deepcopy(OUTPUT_DICT_BEERWISER)
+    Appreciate(input_dict, output_dict).appreciate_all_scenarios()
+
+    results = {}
+    for method in ["grid", "continuous"]:
+        optimize = Optimize(copy.deepcopy(input_dict), copy.deepcopy(output_dict))
+        suppress_print(optimize.optimize_single_scenario)("Base case", "Optimized DMO", method=method)
+        results[method] = (optimize.evaluations, optimize.input_dict["decision_makers_option_value"][-1])
+
+    assert results["continuous"][0] < results["grid"][0]
+    assert np.isclose(results["continuous"][1].sum(), 300000)
+    assert np.allclose(results["continuous"][1], results["grid"][1])
+
+
+def test_optimize_method_error(optimize_beerwiser):
+    """
+    This function tests optimize_single_scenario to raise an OptimizeError for an unknown method
+    :param optimize_beerwiser: an Optimize() class for Beerwiser
+    """
+    with pytest.raises(OptimizeError) as optimize_error:
+        optimize_beerwiser.optimize_single_scenario("Base case", "Optimized DMO", method="newton")
+    expected_result = (
+        "Optimize Error: method 'newton' not available. "
+        "Choose from ['grid', 'continuous', 'refine', 'branch_and_bound', 'evolutionary', 'separable']"
+    )
+    assert str(optimize_error.value) == expected_result
+
+
+def test_neighborhood_offsets():
+    """
+    This function tests _neighborhood_offsets to return all transfers of one step between two internal inputs
+    """
+    result = _neighborhood_offsets(3)
+    assert sorted(result.tolist()) == [[-1, 0, 1], [-1, 1, 0], [0, -1, 1], [0, 1, -1], [1, -1, 0], [1, 0, -1]]
+
+
+def test_refine_search():
+    """
+    This function tests optimize_single_scenario with the refine method to improve the coarse grid in rounds with
+    halved step sizes, using fewer evaluations than a grid search
+    """
+    input_dict = copy.deepcopy(INPUT_DICT_BEERWISER)
+    output_dict = copy.deepcopy(OUTPUT_DICT_BEERWISER)
+    Appreciate(input_dict, output_dict).appreciate_all_scenarios()
+
+    optimize = Optimize(input_dict, output_dict)
+    suppress_print(optimize.optimize_single_scenario)(
+        "Base case", "Optimized DMO", method="refine", initial_combinations=50, top_n=3
+    )
+    rounds = optimize.rounds
+
+    assert len(rounds) >= 2
+    assert [refinement_round["step_size"] for refinement_round in rounds[1:]] == [
+        rounds[0]["step_size"] / 2**index for index in range(1, len(rounds))
+    ]
+    assert all(refinement_round["seconds"] >= 0 for refinement_round in rounds)
+    assert optimize.evaluations == sum(refinement_round["evaluations"] for refinement_round in rounds)
+    assert optimize.evaluations < 3001
+    assert rounds[-1]["best_appreciated_value"] >= rounds[0]["best_appreciated_value"]
+    assert np.isclose(optimize.input_dict["decision_makers_option_value"][-1].sum(), 300000)
+
+
+@pytest.fixture(name="appreciated_beerwiser")
+def fixture_appreciated_beerwiser():
+    """
+    This fixture initialises an appreciated copy of the Beerwiser case.
+    :return: a tuple (input_dict, output_dict)
+    """
+    input_dict = copy.deepcopy(INPUT_DICT_BEERWISER)
+    output_dict = copy.deepcopy(OUTPUT_DICT_BEERWISER)
+    suppress_print(Appreciate(input_dict, output_dict).appreciate_all_scenarios)()
+    return input_dict, output_dict
+
+
+def test_candidate_scorer_objectives(appreciated_beerwiser):
+    """
+    This function tests CandidateScorer to calculate the objectives over all scenarios from the appreciations in each
+    scenario, for all DMOs of Beerwiser.
+    :param appreciated_beerwiser: a tuple (input_dict, output_dict) of an appreciated Beerwiser case
+    """
+    input_dict, output_dict = appreciated_beerwiser
+    matrix = Aggregate(input_dict, output_dict).get_appreciation_matrix()
+    values = input_dict["decision_makers_option_value"]
+
+    assert np.allclose(CandidateScorer(input_dict, output_dict, None).score_scenarios(values), matrix)
+    expected_results = {
+        "weighted": [
+            sum(output_dict[scenario][dmo]["scenario_appreciations"] for scenario in input_dict["scenarios"])
+            for dmo in input_dict["decision_makers_options"]
+        ],
+        "worst_case": matrix.min(axis=0),
+        "regret": -(matrix.max(axis=1)[:, np.newaxis] - matrix).max(axis=0),
+    }
+    for objective, expected_result in expected_results.items():
+        assert np.allclose(CandidateScorer(input_dict, output_dict, None, objective).score(values), expected_result)
+
+
+def test_candidate_scorer_objective_error(appreciated_beerwiser):
+    """
+    This function tests CandidateScorer to raise an OptimizeError for an unknown objective
+    :param appreciated_beerwiser: a tuple (input_dict, output_dict) of an appreciated Beerwiser case
+    """
+    with pytest.raises(OptimizeError) as optimize_error:
+        CandidateScorer(*appreciated_beerwiser, None, "best_case")
+    expected_result = (
+        "Optimize Error: objective 'best_case' not available. Choose from ['weighted', 'worst_case', 'regret']"
+    )
+    assert str(optimize_error.value) == expected_result
+
+
+@pytest.mark.parametrize("objective", ["weighted", "worst_case", "regret"])
+def test_optimize_all_scenarios(appreciated_beerwiser, objective):
+    """
+    This function tests optimize_all_scenarios to add a DMO that is at least as good as the best existing DMO on the
+    objective, with the same total investment.
+    :param appreciated_beerwiser: a tuple (input_dict, output_dict) of an appreciated Beerwiser case
+    :param objective: objective over all scenarios
+    """
+    optimize = Optimize(*appreciated_beerwiser)
+    best_dmo_data, max_investment = optimize.find_best_dmo_all_scenarios(objective)
+    suppress_print(optimize.optimize_all_scenarios)("Optimized DMO", objective, method="refine")
+    result = optimize.input_dict["decision_makers_option_value"][-1]
+
+    scorer = CandidateScorer(*appreciated_beerwiser, None, objective)
+    assert optimize.input_dict["decision_makers_options"][-1] == "Optimized DMO"
+    assert np.isclose(result.sum(), max_investment)
+    assert scorer.score([result])[0] >= best_dmo_data["max_appreciated_value"] - 1e-9
+
+
+def test_get_constraints():
+    """
+    This function tests get_constraints to combine the constraints of the keyword arguments and the configurations,
+    and to return None without constraints.
+    """
+    input_dict = copy.deepcopy(INPUT_DICT_BEERWISER)
+    optimize = Optimize(input_dict, OUTPUT_DICT_BEERWISER)
+    assert optimize.get_constraints(300000) is None
+
+    input_dict["configurations"] = np.append(
+        input_dict["configurations"],
+        ["Optimize_upper_bound_Invest in water recycling", "Optimize_step_Invest in training of employees"],
+    )
+    input_dict["configuration_value"] = np.append(input_dict["configuration_value"], ["250000", "5000"])
+    result = optimize.get_constraints(300000, lower_bounds={"Invest in training of employees": 100000})
+    assert result["lower_bounds"].tolist() == [100000, 0]
+    assert result["upper_bounds"].tolist() == [300000, 250000]
+    assert result["steps"].tolist() == [5000, 0]
+
+    result = optimize.get_constraints(300000, steps={"Invest in training of employees": 1000})
+    assert result["steps"].tolist() == [1000, 0]
+
+
+@pytest.mark.parametrize(
+    "constraints, expected_result",
+    [
+        ({"lower_bounds": {"Invest in marketing": 1}}, "lower_bounds of unknown internal variable inputs"),
+        (
+            {"lower_bounds": {"Invest in water recycling": 2}, "upper_bounds": {"Invest in water recycling": 1}},
+            "exceeds",
+        ),
+        ({"steps": {"Invest in water recycling": -1}}, "should not be negative"),
+        ({"lower_bounds": {"Invest in water recycling": 200000, "Invest in training of employees": 200000}}, "no "),
+    ],
+)
+def test_get_constraints_error(optimize_beerwiser, constraints, expected_result):
+    """
+    This function tests get_constraints to raise an OptimizeError for constraints that cannot be satisfied
+    :param optimize_beerwiser: an Optimize() class for Beerwiser
+    :param constraints: keyword arguments with the constraints
+    :param expected_result: part of the error message
+    """
+    with pytest.raises(OptimizeError) as optimize_error:
+        optimize_beerwiser.get_constraints(300000, **constraints)
+    assert expected_result in str(optimize_error.value)
+
+
+def test_candidate_scorer_constraints(appreciated_beerwiser):
+    """
+    This function tests CandidateScorer to return -inf for candidates that do not satisfy the constraints
+    :param appreciated_beerwiser: a tuple (input_dict, output_dict) of an appreciated Beerwiser case
+    """
+    constraints = {
+        "lower_bounds": np.array([100000, 0]),
+        "upper_bounds": np.array([300000, 300000]),
+        "steps": np.array([0, 50000]),
+    }
+    candidates = [[150000, 150000], [50000, 250000], [175000, 125000], [200000, 100000]]
+    result = CandidateScorer(*appreciated_beerwiser, "Base case", constraints=constraints).score(candidates)
+    expected_result = CandidateScorer(*appreciated_beerwiser, "Base case").score(candidates)
+
+    assert np.array_equal(np.isinf(result), [False, True, True, False])
+    assert np.array_equal(result[[0, 3]], expected_result[[0, 3]])
+
+
+@pytest.mark.parametrize("scenario, objective", [("Base case", "weighted"), (None, "weighted"), (None, "regret")])
+def test_candidate_scorer_upper_bound(appreciated_beerwiser, scenario, objective):
+    """
+    This function tests CandidateScorer.upper_bound() to bound the score of all candidates within the boxes, and to be
+    equal to the score of boxes that consist of a single candidate.
+    :param appreciated_beerwiser: a tuple (input_dict, output_dict) of an appreciated Beerwiser case
+    :param scenario: name of the scenario (None for all scenarios)
+    :param objective: objective over all scenarios
+    """
+    scorer = CandidateScorer(*appreciated_beerwiser, scenario, objective)
+    generator = np.random.default_rng(0)
+    lower = generator.uniform(0, 200000, (100, 2))
+    upper = lower + generator.uniform(0, 100000, lower.shape)
+    result = scorer.upper_bound(lower, upper)
+
+    for _ in range(10):
+        assert np.all(scorer.score(generator.uniform(lower, upper)) <= result + 1e-9)
+    assert np.allclose(scorer.upper_bound(lower, lower), scorer.score(lower))
+
+
+def test_branch_and_bound_search(appreciated_beerwiser):
+    """
+    This function tests optimize_single_scenario with the branch_and_bound method to find the optimum of the grid
+    search within the constraints, with fewer evaluations
+    :param appreciated_beerwiser: a tuple (input_dict, output_dict) of an appreciated Beerwiser case
+    """
+    constraints = {
+        "lower_bounds": {"Invest in water recycling": 60000},
+        "upper_bounds": {"Invest in water recycling": 120000},
+        "steps": {"Invest in training of employees": 2000},
+    }
+    results = {}
+    for method in ["grid", "branch_and_bound"]:
+        optimize = Optimize(*copy.deepcopy(appreciated_beerwiser))
+        suppress_print(optimize.optimize_single_scenario)(
+            "Base case", "Optimized DMO", max_combinations=1000, method=method, **copy.deepcopy(constraints)
+        )
+        scorer = CandidateScorer(optimize.input_dict, optimize.output_dict, "Base case")
+        result = optimize.input_dict["decision_makers_option_value"][-1]
+        results[method] = (optimize.evaluations, scorer.score([result])[0], result)
+
+    result = results["branch_and_bound"][2]
+    assert results["branch_and_bound"][0] < results["grid"][0]
+    assert results["branch_and_bound"][1] >= results["grid"][1] - 1e-9
+    assert np.isclose(result.sum(), 300000)
+    assert 60000 <= result[1] <= 120000
+    assert result[0] % 2000 == 0
+
+
+@pytest.mark.parametrize("objective", ["weighted", "worst_case", "regret"])
+def test_branch_and_bound_all_scenarios(appreciated_beerwiser, objective):
+    """
+    This function tests optimize_all_scenarios with the branch_and_bound method to find the optimum of the grid search
+    :param appreciated_beerwiser: a tuple (input_dict, output_dict) of an appreciated Beerwiser case
+    :param objective: objective over all scenarios
+    """
+    results = {}
+    for method in ["grid", "branch_and_bound"]:
+        optimize = Optimize(*copy.deepcopy(appreciated_beerwiser))
+        suppress_print(optimize.optimize_all_scenarios)(
+            "Optimized DMO", objective, max_combinations=1000, method=method
+        )
+        scorer = CandidateScorer(optimize.input_dict, optimize.output_dict, None, objective)
+        results[method] = scorer.score(optimize.input_dict["decision_makers_option_value"][-1:])[0]
+
+    assert results["branch_and_bound"] >= results["grid"] - 1e-9
+
+
+@pytest.mark.parametrize("method", ["grid", "continuous", "refine", "evolutionary"])
+def test_optimize_max_evaluations(appreciated_beerwiser, method):
+    """
+    This function tests optimize_single_scenario to stop all methods at max_evaluations and to report the progress
+    :param appreciated_beerwiser: a tuple (input_dict, output_dict) of an appreciated Beerwiser case
+    :param method: optimization method
+    """
+    events = []
+    optimize = Optimize(*appreciated_beerwiser)
+    suppress_print(optimize.optimize_single_scenario)(
+        "Base case", "Optimized DMO", method=method, max_evaluations=50, callback=events.append, progress_interval=0
+    )
+
+    assert 0 < optimize.evaluations <= 50
+    assert events[-1]["finished"]
+    assert events[-1]["evaluations"] == optimize.evaluations
+    best_values = [event["best_appreciated_value"] for event in events]
+    assert best_values == sorted(best_values)
+
+
+def test_search_blocks_time_budget():
+    """
+    This function tests search_blocks to return the best combination so far when the time budget is exhausted
+    """
+    progress = Progress(time_budget=0.05)
+    blocks = ((index, np.array([[index, 100.0 - index]])) for index in range(10**8))
+    best_value, best_index, best_combination = search_blocks(QuadraticScorer([10, 90]), blocks, progress)
+
+    assert progress.evaluations < 10**8
+    assert progress.evaluations > 10
+    assert best_value == 0
+    assert best_index == 10
+    assert best_combination.tolist() == [10, 90]
+
+
+def test_calibrate_max_combinations(appreciated_beerwiser):
+    """
+    This function tests calibrate_max_combinations to return more combinations for more seconds, and at least the
+    number of internal inputs
+    :param appreciated_beerwiser: a tuple (input_dict, output_dict) of an appreciated Beerwiser case
+    """
+    optimize = Optimize(*appreciated_beerwiser)
+    assert optimize.calibrate_max_combinations("Base case", 300000, 0) == 2
+    assert optimize.calibrate_max_combinations("Base case", 300000, 1) > optimize.calibrate_max_combinations(
+        "Base case", 300000, 0.001
+    )
+
+
+@pytest.mark.parametrize("workers", [1, 2])
+def test_grid_search_checkpoint(appreciated_beerwiser, tmp_path, workers):
+    """
+    This function tests grid_search to store an interrupted search in a checkpoint and to resume it, such that the
+    resumed search finds the same result as an uninterrupted search and searches each combination once
+    :param appreciated_beerwiser: a tuple (input_dict, output_dict) of an appreciated Beerwiser case
+    :param tmp_path: temporary directory
+    :param workers: number of processes
+    """
+    lattice = Optimize.generate_lattice(300000, 2000, 2)
+    optimize = Optimize(*copy.deepcopy(appreciated_beerwiser))
+    best_dmo_data, _ = optimize.find_dict_values("Base case")
+    expected_result = optimize.grid_search("Base case", lattice, "Optimized DMO", best_dmo_data, block_size=10)
+
+    evaluations = []
+    for _ in range(4):
+        optimize = Optimize(*copy.deepcopy(appreciated_beerwiser))
+        optimize.progress = Progress(max_evaluations=60)
+        checkpoint = Checkpoint(tmp_path / "checkpoint.json", interval=0)
+        result = optimize.grid_search(
+            "Base case", lattice, "Optimized DMO", best_dmo_data, block_size=10, workers=workers, checkpoint=checkpoint
+        )
+        evaluations.append(optimize.evaluations)
+
+    assert result == expected_result
+    assert evaluations[0] < lattice.size
+    assert evaluations[-1] == lattice.size
+    assert sum(1 for _ in tmp_path.iterdir()) == 1
+
+
+def test_grid_search_checkpoint_time_budget(appreciated_beerwiser, tmp_path, monkeypatch):
+    """
+    This function tests that a grid search of which the number of combinations is calibrated to the time budget
+    resumes on the lattice of its checkpoint under a different time budget, instead of calibrating a new lattice
+    :param appreciated_beerwiser: a tuple (input_dict, output_dict) of an appreciated Beerwiser case
+    :param tmp_path: temporary directory
+    :param monkeypatch: pytest fixture to replace the calibration, which depends on the speed of the machine
+    """
+    checkpoint = tmp_path / "checkpoint.json"
+    evaluations = []
+    for time_budget, max_evaluations, calibrated_combinations in [(0.05, 20, 100), (5, None, 1000)]:
+        monkeypatch.setattr(Optimize, "calibrate_max_combinations", lambda *_, value=calibrated_combinations: value)
+        optimize = Optimize(*copy.deepcopy(appreciated_beerwiser))
+        suppress_print(optimize.optimize_single_scenario)(
+            "Base case",
+            "Optimized DMO",
+            time_budget=time_budget,
+            max_evaluations=max_evaluations,
+            checkpoint=checkpoint,
+        )
+        evaluations.append(optimize.evaluations)
+
+    lattice = SimplexLattice(*Checkpoint(checkpoint).read()["key"]["lattice"])
+    assert evaluations[0] < lattice.size <= 100
+    assert evaluations[1] == lattice.size
+
+
+@pytest.mark.parametrize("calibrated_combinations, expected_combinations", [(500, 500), (10**9, 1000000)])
+def test_default_max_combinations(appreciated_beerwiser, monkeypatch, calibrated_combinations, expected_combinations):
+    """
+    This function tests that without max_combinations and time_budget, the number of combinations is 1,000,000, or
+    fewer if they cannot be searched within the default time budget
+    :param appreciated_beerwiser: a tuple (input_dict, output_dict) of an appreciated Beerwiser case
+    :param monkeypatch: pytest fixture to replace the calibration, which depends on the speed of the machine
+    """
+    seconds = []
+
+    def calibrate(_optimize, _scenario, _max_investment, budget_seconds):
+        seconds.append(budget_seconds)
+        return calibrated_combinations
+
+    monkeypatch.setattr(Optimize, "calibrate_max_combinations", calibrate)
+    optimize = Optimize(*appreciated_beerwiser)
+    max_combinations = optimize._setup_search("Base case", "grid", 300000, None, {})
+    assert max_combinations == expected_combinations
+    assert seconds == [optimize.default_time_budget]
+    assert optimize._setup_search("Base case", "continuous", 300000, None, {}) == 1000000
+    assert len(seconds) == 1
+
+
+def test_checkpoint_method_error(appreciated_beerwiser, tmp_path):
+    """
+    This function tests optimize_single_scenario to raise an OptimizeError for a method that cannot be resumed
+    :param appreciated_beerwiser: a tuple (input_dict, output_dict) of an appreciated Beerwiser case
+    :param tmp_path: temporary directory
+    """
+    optimize = Optimize(*appreciated_beerwiser)
+    with pytest.raises(OptimizeError) as error:
+        optimize.optimize_single_scenario(
+            "Base case", "Optimized DMO", method="continuous", checkpoint=tmp_path / "checkpoint.json"
+        )
+    assert str(error.value) == (
+        "Optimize Error: method 'continuous' cannot be resumed from a checkpoint. Choose from ['grid', 'evolutionary']"
+    )
+
+
+def test_evolutionary_search(appreciated_beerwiser):
+    """
+    This function tests the evolutionary method to find the same appreciation as a fine grid search
+    :param appreciated_beerwiser: a tuple (input_dict, output_dict) of an appreciated Beerwiser case
+    """
+    results = {}
+    for method in ["grid", "evolutionary"]:
+        optimize = Optimize(*copy.deepcopy(appreciated_beerwiser))
+        suppress_print(optimize.optimize_single_scenario)(
+            "Base case", "Optimized DMO", max_combinations=10000, method=method, seed=0, generations=50
+        )
+        scorer = CandidateScorer(optimize.input_dict, optimize.output_dict, "Base case")
+        results[method] = scorer.score(optimize.input_dict["decision_makers_option_value"][-1:])[0]
+
+    assert results["evolutionary"] == pytest.approx(results["grid"], rel=1e-3)
+
+
+def test_evolutionary_search_checkpoint(appreciated_beerwiser, tmp_path):
+    """
+    This function tests the evolutionary method to resume from a checkpoint exactly as an uninterrupted search
+    :param appreciated_beerwiser: a tuple (input_dict, output_dict) of an appreciated Beerwiser case
+    :param tmp_path: temporary directory
+    """
+    results = []
+    for generations, checkpoint in [(5, tmp_path / "checkpoint.json"), (10, tmp_path / "checkpoint.json"), (10, None)]:
+        optimize = Optimize(*copy.deepcopy(appreciated_beerwiser))
+        suppress_print(optimize.optimize_single_scenario)(
+            "Base case", "Optimized DMO", method="evolutionary", seed=0, generations=generations, checkpoint=checkpoint
+        )
+        results.append((optimize.input_dict["decision_makers_option_value"][-1].tolist(), optimize.evaluations))
+
+    assert results[1] == results[2]
+    assert results[0][1] < results[1][1]
+
+
+@pytest.fixture(name="separable_beerwiser")
+def fixture_separable_beerwiser():
+    """
+    This fixture initialises an evaluated and appreciated copy of the Beerwiser case, in which the water use
+    reduction no longer contributes to the production cost reduction, such that each key output depends on one
+    internal input.
+    :return: a tuple (input_dict, output_dict)
+    """
+    input_dict = copy.deepcopy(INPUT_DICT_BEERWISER)
+    input_dict["argument_1"][list(input_dict["argument_1"]).index("Water use reduction")] = "0"
+    output_dict = suppress_print(Evaluate(input_dict).evaluate_all_scenarios)()
+    suppress_print(Appreciate(input_dict, output_dict).appreciate_all_scenarios)()
+    return input_dict, output_dict
+
+
+@pytest.mark.parametrize(
+    "constraints, evaluations",
+    [({}, 2 * 301 + 2), ({"upper_bounds": {"Invest in training of employees": 200000}}, 201 + 301 + 2)],
+)
+def test_separable_search(separable_beerwiser, constraints, evaluations):
+    """
+    This function tests separable_search to find the same distribution as a grid search with the same step size
+    :param separable_beerwiser: a tuple (input_dict, output_dict) of a separable Beerwiser case
+    :param constraints: constraints on the internal inputs
+    :param evaluations: expected number of evaluations of both searches
+    """
+    results = []
+    for method in ["grid_search", "separable_search"]:
+        optimize = Optimize(*copy.deepcopy(separable_beerwiser))
+        best_dmo_data, max_investment = optimize.find_dict_values("Base case")
+        optimize.constraints = optimize.get_constraints(max_investment, **constraints)
+        if method == "grid_search":
+            lattice = Optimize.generate_lattice(max_investment, 1000, 2)
+            result = optimize.grid_search("Base case", lattice, "Optimized DMO", best_dmo_data)
+        else:
+            result = optimize.separable_search("Base case", "Optimized DMO", best_dmo_data, max_investment, 1000)
+        results.append((result, optimize.commit()["decision_makers_option_value"][-1].tolist()))
+
+    assert results[0][0][0] == results[1][0][0]
+    assert results[0][0][1] == pytest.approx(results[1][0][1])
+    assert results[0][1] == results[1][1]
+    assert optimize.evaluations == evaluations
+
+
+def test_separable_fallback(appreciated_beerwiser):
+    """
+    This function tests the separable method to optimize a case that is not separable with the fallback method
+    :param appreciated_beerwiser: a tuple (input_dict, output_dict) of an appreciated Beerwiser case
+    """
+    results = []
+    for method in ["separable", "grid"]:
+        optimize = Optimize(*copy.deepcopy(appreciated_beerwiser))
+        suppress_print(optimize.optimize_single_scenario)("Base case", "Optimized DMO", 1000, method)
+        results.append(optimize.input_dict["decision_makers_option_value"][-1].tolist())
+    assert results[0] == results[1]
+
+    with pytest.raises(OptimizeError) as error:
+        optimize.optimize_single_scenario("Base case", "Other DMO", 1000, "separable", fallback="separable")
+    assert str(error.value).startswith("Optimize Error: fallback method 'separable' not available")
+
+
+def test_separable_step_fallback(separable_beerwiser):
+    """
+    This function tests the separable method to optimize a separable case of which a step does not fit the step size
+    of the dynamic program with the fallback method, and separable_search to raise an OptimizeError for it
+    :param separable_beerwiser: a tuple (input_dict, output_dict) of a separable Beerwiser case
+    """
+    steps = {"Invest in training of employees": 1000}
+    results = []
+    for method in ["separable", "grid"]:
+        optimize = Optimize(*copy.deepcopy(separable_beerwiser))
+        suppress_print(optimize.optimize_single_scenario)("Base case", "Optimized DMO", method=method, steps=steps)
+        results.append(optimize.input_dict["decision_makers_option_value"][-1].tolist())
+    assert results[0] == results[1]
+
+    optimize = Optimize(*copy.deepcopy(separable_beerwiser))
+    best_dmo_data, max_investment = optimize.find_dict_values("Base case")
+    optimize.constraints = optimize.get_constraints(max_investment, steps=steps)
+    with pytest.raises(OptimizeError) as error:
+        optimize.separable_search("Base case", "Optimized DMO", best_dmo_data, max_investment, max_investment / 707)
+    assert str(error.value).startswith("Optimize Error: the budget cannot be distributed")
+
+
+@pytest.mark.parametrize("method", ["continuous", "refine"])
+def test_optimize_cache(appreciated_beerwiser, tmp_path, method):
+    """
+    This function tests optimize_single_scenario to look up all distributions of a repeated optimization in the
+    evaluation cache, also after a change of a text element, and to find the same distribution as without cache
+    :param appreciated_beerwiser: a tuple (input_dict, output_dict) of an appreciated Beerwiser case
+    :param tmp_path: temporary directory
+    :param method: optimization method
+    """
+    path = tmp_path / "cache.npz"
+    results, caches = [], []
+    for cache in [None, path, path]:
+        input_dict, output_dict = copy.deepcopy(appreciated_beerwiser)
+        input_dict["case_text_element_value"][0] = f"title {len(results)}"
+        optimize = Optimize(input_dict, output_dict)
+        suppress_print(optimize.optimize_single_scenario)("Base case", "Optimized DMO", 1000, method, cache=cache)
+        results.append(optimize.input_dict["decision_makers_option_value"][-1].tolist())
+        caches.append(optimize.cache)
+
+    assert results[0] == results[1] == results[2]
+    assert caches[0] is None
+    assert caches[1].get_statistics()["hits"] < caches[1].get_statistics()["misses"]
+    # the second optimization with the cache file does not evaluate any distribution again
+    assert caches[2].get_statistics()["misses"] == 0
+    assert caches[2].get_statistics()["hits"] == optimize.evaluations
+
+
+def test_grid_search_without_cache(appreciated_beerwiser):
+    """
+    This function tests the grid search not to use the evaluation cache, as its vectorized blocks are evaluated about
+    as fast as they are looked up
+    :param appreciated_beerwiser: a tuple (input_dict, output_dict) of an appreciated Beerwiser case
+    """
+    cache = EvaluationCache()
+    optimize = Optimize(*copy.deepcopy(appreciated_beerwiser))
+    suppress_print(optimize.optimize_single_scenario)("Base case", "Optimized DMO", 1000, "grid", cache=cache)
+    assert cache.get_statistics() == {"hits": 0, "misses": 0, "hit_rate": 0.0, "size": 0}
+
+
+def test_cache_case_key(appreciated_beerwiser):
+    """
+    This function tests the case key of the evaluation cache to change with the inputs, the scenario and the objective
+    :param appreciated_beerwiser: a tuple (input_dict, output_dict) of an appreciated Beerwiser case
+    """
+    input_dict, output_dict = copy.deepcopy(appreciated_beerwiser)
+    cache = EvaluationCache()
+    keys = [
+        CandidateScorer(input_dict, output_dict, "Base case", cache=cache).case_key,
+        CandidateScorer(input_dict, output_dict, "Optimistic", cache=cache).case_key,
+        CandidateScorer(input_dict, output_dict, None, "weighted", cache=cache).case_key,
+        CandidateScorer(input_dict, output_dict, None, "worst_case", cache=cache).case_key,
+    ]
+    input_dict["fixed_input_value"][0] += 1
+    keys.append(CandidateScorer(input_dict, output_dict, "Base case", cache=cache).case_key)
+    assert len(set(keys)) == len(keys)
+
+    # the cached score is the same as the calculated score, also over all scenarios
+    for scenario in ["Base case", None]:
+        scorer = CandidateScorer(input_dict, output_dict, scenario, cache=cache)
+        candidates = np.array([[100000.0, 200000.0], [300000.0, 0.0]])
+        expected = CandidateScorer(input_dict, output_dict, scenario).score(candidates)
+        assert scorer.score(candidates) == pytest.approx(expected)
+        assert scorer.score(candidates[::-1]) == pytest.approx(expected[::-1])
+        assert cache.get(scorer.case_key, candidates[0])[0] == pytest.approx(expected[0])
+
+
+def test_optimize_session(appreciated_beerwiser):
+    """
+    This function tests the searches to leave the case untouched until the result is committed, such that multiple
+    optimizations of the same case do not interfere
+    :param appreciated_beerwiser: a tuple (input_dict, output_dict) of an appreciated Beerwiser case
+    """
+    input_dict, output_dict = copy.deepcopy(appreciated_beerwiser)
+    original_dict = copy.deepcopy(input_dict)
+    optimizers = [Optimize(input_dict, output_dict), Optimize(input_dict, output_dict)]
+    best_dmo_data, max_investment = optimizers[0].find_dict_values("Base case")
+    lattice = Optimize.generate_lattice(max_investment, 1000, 2)
+    results = [
+        optimizers[0].grid_search("Base case", lattice, "Optimized DMO", best_dmo_data, block_size=64),
+        optimizers[1].continuous_search("Base case", "Other DMO", best_dmo_data, max_investment, max_evaluations=50),
+    ]
+
+    assert optimizers[0].session.result == results[0]
+    assert hash_case(input_dict) == hash_case(original_dict)
+    assert optimizers[0].input_dict is input_dict
+    # the blocks of the grid search are written into the same preallocated buffer
+    assert optimizers[0].session.buffer.shape == (64, 2)
+
+    committed_dict = optimizers[0].commit()
+    assert committed_dict is optimizers[0].input_dict
+    assert list(committed_dict["decision_makers_options"][-1:]) == ["Optimized DMO"]
+    assert list(optimizers[1].commit()["decision_makers_options"][-1:]) == ["Other DMO"]
+    assert not np.array_equal(committed_dict["key_output_automatic"], input_dict["key_output_automatic"])
+    assert len(input_dict["decision_makers_options"]) == len(original_dict["decision_makers_options"])
+
+    with pytest.raises(OptimizeError) as error:
+        optimizers[0].commit()
+    assert str(error.value) == "Optimize Error: there is no optimization to commit"
@@ -0,0 +1,89 @@
+"""
+This module contains all tests for the Progress() class
+"""
+
+import time
+import pytest
+import numpy as np
+from vlinder.progress import Progress, ProgressError
+
+
+@pytest.mark.parametrize(
+    "time_budget, max_evaluations, expected_result",
+    [
+        (0, None, "Progress Error: the time budget should be positive, not 0"),
+        (None, -5, "Progress Error: the maximum number of evaluations should be positive, not -5"),
+    ],
+)
+def test_progress_error(time_budget, max_evaluations, expected_result):
+    """
+    This function tests Progress to raise a ProgressError for an empty budget
+    :param time_budget: number of seconds
+    :param max_evaluations: number of evaluations
+    :param expected_result: error message
+    """
+    with pytest.raises(ProgressError) as progress_error:
+        Progress(time_budget, max_evaluations)
+    assert str(progress_error.value) == expected_result
+
+
+def test_update():
+    """
+    This function tests update to count the evaluations, keep the best appreciation and signal when the maximum number
+    of evaluations is reached
+    """
+    progress = Progress(max_evaluations=100)
+    assert not progress.update(60, 10.0)
+    assert progress.update(40, 5.0)
+    assert progress.evaluations == 100
+    assert progress.best_appreciated_value == 10.0
+    assert progress.get_remaining_evaluations() == 0
+
+
+def test_time_budget():
+    """
+    This function tests is_exhausted to signal when the time budget has passed
+    """
+    progress = Progress(time_budget=0.01)
+    assert not progress.is_exhausted()
+    time.sleep(0.02)
+    assert progress.is_exhausted()
+    assert progress.get_remaining_seconds() == 0
+
+
+def test_callback():
+    """
+    This function tests the callback to receive progress events at most once per interval and a final event
+    """
+    events = []
+    progress = Progress(callback=events.append, interval=0)
+    progress.restart(total=1000)
+    for _ in range(3):
+        time.sleep(0.001)
+        progress.update(100, 1.0)
+    assert len(events) == 3
+    assert events[-1]["evaluations"] == 300
+    assert events[-1]["evaluations_per_second"] > 0
+    # the remaining 700 evaluations take 7 / 3 of the time of the first 300
+    assert events[-1]["remaining_seconds"] == pytest.approx(7 / 3 * events[-1]["elapsed_seconds"], rel=0.01)
+    assert not events[-1]["finished"]
+
+    progress.finish()
+    assert events[-1]["finished"]
+    assert events[-1]["remaining_seconds"] == 0
+
+    progress = Progress(callback=events.append, interval=3600)
+    progress.update(100, 1.0)
+    assert len(events) == 4
+
+
+def test_restart():
+    """
+    This function tests restart to reset the counters of a previous search
+    """
+    progress = Progress(max_evaluations=100)
+    progress.update(100, 1.0)
+    progress.restart()
+    assert progress.evaluations == 0
+    assert progress.best_appreciated_value == -np.inf
+    assert not progress.is_exhausted()
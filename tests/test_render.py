@@ -0,0 +1,70 @@
+"""
+This module contains the tests for the TableRenderer class.
+"""
+
+import pytest
+import pandas as pd
+from vlinder.render import TableRenderer
+from .params import INPUT_DICT_BEERWISER
+
+
+@pytest.fixture(name="fixed_inputs")
+def fixture_fixed_inputs():
+    """
+    This fixture creates the table of fixed inputs of the Beerwiser case.
+    :return: a pd.DataFrame with the name and value of each fixed input
+    """
+    return pd.DataFrame(
+        {
+            "fixed_inputs": INPUT_DICT_BEERWISER["fixed_inputs"],
+            "fixed_input_value": INPUT_DICT_BEERWISER["fixed_input_value"],
+        }
+    )
+
+
+def test_render(fixed_inputs):
+    """
+    This function tests that render returns a PNG image and reuses the figure of the renderer.
+    """
+    renderer = TableRenderer()
+    figure = renderer.figure
+    images = [renderer.render(fixed_inputs, "Values of fixed inputs"), renderer.render(fixed_inputs.iloc[:2])]
+    assert all(image.getvalue().startswith(b"\x89PNG") for image in images)
+    assert renderer.figure is figure
+    assert len(figure.axes) == 1
+
+
+def test_render_pages(fixed_inputs):
+    """
+    This function tests that render_pages draws a page for every 10 rows.
+    """
+    renderer = TableRenderer()
+    pages = renderer.render_pages(fixed_inputs, "Values of fixed inputs")
+    assert len(pages) == -(-len(fixed_inputs) // 10)
+    assert len(renderer.render_pages(fixed_inputs.iloc[:0])) == 1
+
+
+def test_render_styler(fixed_inputs):
+    """
+    This function tests that a Styler is drawn with its display values and caption, without changing the styler.
+    """
+    renderer = TableRenderer()
+    styler = fixed_inputs.style.format({"fixed_input_value": "{:.1f}".format}).set_caption("Values of fixed inputs")
+    header, cells = renderer._get_cells(styler)  # pylint: disable=protected-access
+    assert header == ["fixed_inputs", "fixed_input_value"]
+    assert cells[0] == [str(fixed_inputs.iloc[0, 0]), f"{fixed_inputs.iloc[0, 1]:.1f}"]
+    assert len(cells) == len(fixed_inputs)
+    assert not any(styler.hide_index_)
+    assert renderer.render(styler).getvalue() == renderer.render(styler, "Values of fixed inputs").getvalue()
+    assert len(renderer.render_pages(styler, rows_per_page=3)) == -(-len(fixed_inputs) // 3)
+
+
+def test_render_many(fixed_inputs):
+    """
+    This function tests that render_many returns the same images with and without worker processes.
+    """
+    renderer = TableRenderer()
+    tables = [(fixed_inputs.iloc[:3], "first"), (fixed_inputs.iloc[3:5], "second"), (fixed_inputs, "third")]
+    serial = [image.getvalue() for image in renderer.render_many(tables)]
+    parallel = [image.getvalue() for image in renderer.render_many(tables, workers=2)]
+    assert serial == parallel
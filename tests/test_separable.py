@@ -0,0 +1,63 @@
+"""
+This module contains all tests for the separability analysis and the dynamic program of separable cases
+"""
+
+import copy
+import itertools
+import numpy as np
+from vlinder.separable import allocate_separable, find_internal_dependencies, is_separable
+from .params import INPUT_DICT_BEERWISER
+
+
+def test_find_internal_dependencies():
+    """
+    This function tests find_internal_dependencies to follow the dependencies of Beerwiser to the key outputs
+    """
+    result = find_internal_dependencies(INPUT_DICT_BEERWISER)
+    training, water = INPUT_DICT_BEERWISER["internal_variable_inputs"]
+
+    assert result["Accidents reduction"] == {training}
+    assert result["Water use reduction"] == {water}
+    assert result["Production cost reduction"] == {training, water}
+    assert result["Cost of training per employee"] == {training}
+
+
+def test_is_separable():
+    """
+    This function tests is_separable to detect key outputs that depend on multiple internal inputs, and objectives
+    over all scenarios that are not a sum
+    """
+    assert not is_separable(INPUT_DICT_BEERWISER, "Base case")
+
+    input_dict = copy.deepcopy(INPUT_DICT_BEERWISER)
+    # the water use reduction no longer contributes to the production cost reduction
+    input_dict["argument_1"][list(input_dict["argument_1"]).index("Water use reduction")] = "0"
+    assert is_separable(input_dict, "Base case")
+    assert is_separable(input_dict, None, "weighted")
+    assert not is_separable(input_dict, None, "worst_case")
+
+
+def test_allocate_separable():
+    """
+    This function tests allocate_separable to find the best distribution of all distributions within the domains
+    """
+    rng = np.random.default_rng(0)
+    domains = [np.arange(0, 11, 2.0), np.arange(0, 5, 1.0), np.arange(3, 11, 1.0), np.arange(0, 4, 1.5)]
+    contributions = [rng.normal(size=len(domain)) for domain in domains]
+    distributions = [
+        (sum(contribution[i] for contribution, i in zip(contributions, index)), [d[i] for d, i in zip(domains, index)])
+        for index in itertools.product(*(range(len(domain)) for domain in domains))
+        if sum(domain[i] for domain, i in zip(domains, index)) == 15
+    ]
+    expected_value, expected_distribution = max(distributions, key=lambda distribution: distribution[0])
+
+    value, distribution = allocate_separable(contributions, domains, 15)
+    assert np.isclose(value, expected_value)
+    assert distribution.tolist() == expected_distribution
+
+
+def test_allocate_separable_infeasible():
+    """
+    This function tests allocate_separable to return None if the budget cannot be distributed over the domains
+    """
+    assert allocate_separable([np.zeros(2), np.zeros(2)], [np.array([0.0, 2.0]), np.array([0.0, 4.0])], 3) is None
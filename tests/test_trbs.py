@@ -6,6 +6,7 @@ Most function are calls to other classes. The testing for that can be found in t
 import pytest
 
 from vlinder.trbs import TheResponsibleBusinessSimulator, CaseError
+from vlinder.utils import suppress_print
 
 
 @pytest.fixture(name="case_beerwiser")
@@ -139,3 +140,140 @@ def test_make_report_or_optimize(case_beerwiser, setup_methods, expected_error):
         case_beerwiser.optimize("ScenA")
 
     assert str(case_error.value) == expected_error
+
+
+def test_analyse_dominance(case_beerwiser):
+    """
+    Test to check whether the dominance analysis requires an appreciated case and returns a row per DMO
+    """
+    case_beerwiser.build()
+    case_beerwiser.evaluate()
+    with pytest.raises(CaseError) as case_error:
+        case_beerwiser.analyse_dominance("Base case")
+    assert str(case_error.value) == "Case Error: first appreciate a case with .appreciate()"
+
+    case_beerwiser.appreciate()
+    result = case_beerwiser.analyse_dominance("Base case", level="theme")
+    assert list(result.index) == list(case_beerwiser.input_dict["decision_makers_options"])
+
+
+def test_aggregate(case_beerwiser):
+    """
+    Test to check whether the aggregation across scenarios requires an appreciated case and returns a row per DMO
+    """
+    case_beerwiser.build()
+    case_beerwiser.evaluate()
+    with pytest.raises(CaseError) as case_error:
+        case_beerwiser.aggregate()
+    assert str(case_error.value) == "Case Error: first appreciate a case with .appreciate()"
+
+    case_beerwiser.appreciate()
+    result = case_beerwiser.aggregate(optimism=0.2)
+    assert list(result.index) == list(case_beerwiser.input_dict["decision_makers_options"])
+    assert "maximum_regret" in result.columns
+
+
+@suppress_print
+def test_optimize_all_scenarios(case_beerwiser):
+    """
+    Test to check whether optimizing over all scenarios adds an optimized DMO to the case
+    """
+    case_beerwiser.build()
+    case_beerwiser.evaluate()
+    case_beerwiser.appreciate()
+    number_of_dmos = len(case_beerwiser.input_dict["decision_makers_options"])
+
+    case_beerwiser.optimize(None, objective="worst_case", method="refine", new_dmo_name="Robust")
+    assert len(case_beerwiser.input_dict["decision_makers_options"]) == number_of_dmos + 1
+    assert case_beerwiser.input_dict["decision_makers_options"][-1] == "Robust"
+
+
+@suppress_print
+def test_optimize_errors(case_beerwiser):
+    """
+    Test to check whether only a missing optimized DMO name is reported as such, and errors of the search are not
+    """
+    case_beerwiser.build()
+    case_beerwiser.evaluate()
+    case_beerwiser.appreciate()
+
+    def callback(_event):
+        raise ValueError("my callback broke")
+
+    with pytest.raises(ValueError, match="my callback broke"):
+        case_beerwiser.optimize("Base case", method="refine", callback=callback)
+
+    case_beerwiser.input_dict["configurations"] = case_beerwiser.input_dict["configurations"][:0]
+    with pytest.raises(CaseError) as case_error:
+        case_beerwiser.optimize("Base case")
+    assert str(case_error.value) == "Case Error: cannot find optimized DMO name"
+
+
+@suppress_print
+def test_optimize_statistics(case_beerwiser):
+    """
+    Test to check whether the number of evaluations and the rounds of the refine method are kept on the case
+    """
+    case_beerwiser.build()
+    case_beerwiser.evaluate()
+    case_beerwiser.appreciate()
+    assert case_beerwiser.optimizer is None
+
+    case_beerwiser.optimize("Base case", method="refine", initial_combinations=100)
+    rounds = case_beerwiser.optimizer.rounds
+    assert rounds and all(refinement_round["seconds"] >= 0 for refinement_round in rounds)
+    assert case_beerwiser.optimizer.evaluations == sum(refinement_round["evaluations"] for refinement_round in rounds)
+    assert rounds[0]["evaluations"] <= 100
+
+
+@suppress_print
+def test_visualizer_state_version(case_beerwiser):
+    """
+    Test to check whether the visualizer is reused until the state of the case changes
+    """
+    case_beerwiser.build()
+    case_beerwiser.evaluate()
+    case_beerwiser.appreciate()
+    assert case_beerwiser.state_version == 3
+
+    case_beerwiser.visualize("table", "weighted_appreciations", scenario="Base case")
+    visualizer = case_beerwiser.visualizer
+    case_beerwiser.visualize("table", "key_outputs", scenario="Optimistic")
+    assert case_beerwiser.visualizer is visualizer
+
+    case_beerwiser.modify("scenario_weight", "Base case", 5)
+    assert case_beerwiser.state_version == 4
+    case_beerwiser.visualize("table", "weighted_appreciations", scenario="Base case")
+    assert case_beerwiser.visualizer is not visualizer
+    assert case_beerwiser.visualizer_version == 4
+
+
+def test_dependency_graph_state_version(case_beerwiser, tmp_path):
+    """
+    Test to check whether the dependency graph is built once for all key outputs until the state of the case changes
+    """
+    case_beerwiser.build()
+    for key_output in case_beerwiser.input_dict["key_outputs"]:
+        case_beerwiser.visualize("dependency_graph", key_output, save=True, sc_dir=tmp_path)
+    dependency_graph = case_beerwiser.dependency_graph
+    assert len(list(tmp_path.glob("keyoutput_*.png"))) == len(case_beerwiser.input_dict["key_outputs"])
+    assert set(dependency_graph.generations) == set(case_beerwiser.input_dict["key_outputs"])
+
+    case_beerwiser.modify("scenario_weight", "Base case", 5)
+    case_beerwiser.visualize(
+        "dependency_graph", case_beerwiser.input_dict["key_outputs"][0], save=True, sc_dir=tmp_path
+    )
+    assert case_beerwiser.dependency_graph is not dependency_graph
+
+
+def test_dependency_graph_requests(case_beerwiser, tmp_path):
+    """
+    Test to check whether the views of the dependency graph can be requested from the case
+    """
+    case_beerwiser.build()
+    key_output = case_beerwiser.input_dict["key_outputs"][0]
+    image = case_beerwiser.visualize("dependency_graph_image", key_output, sc_dir=tmp_path, image_format="svg")
+    assert image == f"{tmp_path}/keyoutput_{key_output}.svg"
+    html = case_beerwiser.visualize("dependency_graph_lod", key_output, return_html=True)
+    assert "var clusterTree" in html
+    assert case_beerwiser.visualize("dependency_graph", key_output, return_html=True) != html
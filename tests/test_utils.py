@@ -3,6 +3,7 @@
 This module contains all tests for the utils.py file
 """
 import pytest
+import numpy as np
 from vlinder.utils import (
     round_all_dict_values,
     get_values_from_target,
@@ -10,6 +11,7 @@ from vlinder.utils import (
     check_numeric,
     check_list_content,
     suppress_print,
+    hash_case,
 )
 
 
@@ -140,3 +142,15 @@ def test_suppress_print_output(capsys):
     captured = capsys.readouterr()
     assert captured.out == ""  # There should be no output
     assert captured.err == ""  # There should be no mistakes in stderr
+
+
+def test_hash_case():
+    """
+    This test ensures that hash_case gives the same hash for equal objects, regardless of the order of the keys and the
+    type of the arrays, and a different hash if a value changes.
+    """
+    case = {"weights": np.array([1.0, 2.0]), "names": np.array(["A", "B"]), "budget": np.int64(300)}
+    same_case = {"budget": 300, "names": ["A", "B"], "weights": [1.0, 2.0]}
+    assert hash_case(case, "Base case") == hash_case(same_case, "Base case")
+    assert hash_case(case, "Base case") != hash_case(case, "Worst case")
+    assert hash_case(case) != hash_case({**same_case, "weights": [1.0, 2.5]})
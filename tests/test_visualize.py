@@ -4,13 +4,14 @@ This module contains all tests for the Visualize() and the DependencyGraph() cla
 NOT case dependent. Therefore, an arbitrary outcome dictionary is used in these unit tests.
 
 The following functions are skipped: _table_styler, _graph_styler, _create_table (returns styler class),
-The following functions are partly tested: _create_barchart (only errors), create_visuals (only errors)
+The following functions are partly tested: _create_barchart (only errors), create_visuals (only errors),
+render_barcharts (only the images of the key outputs)
 """
 import pytest
 import numpy as np
 import pandas as pd
 from vlinder.visualize import Visualize, VisualizationError, DependencyGraph
-from .params import OUTPUT_DICT_GENERIC, INPUT_DICT_BEERWISER
+from .params import OUTPUT_DICT_GENERIC, INPUT_DICT_BEERWISER, OUTPUT_DICT_BEERWISER
 
 
 @pytest.fixture(name="test_outcomes")
@@ -148,6 +149,29 @@ def test_format_data_for_visual(test_outcomes, key_data, expected_result):
     assert result.to_dict() == expected_result.to_dict()
 
 
+def test_get_results_table(test_outcomes):
+    """
+    This function tests get_results_table to create the long-format table of all outcomes once.
+    :param test_outcomes: a Visualize class
+    """
+    results_table = test_outcomes.get_results_table()
+    assert test_outcomes.get_results_table() is results_table
+    assert list(results_table.columns) == ["scenario", "decision_makers_option", "key_output", "value"]
+    assert results_table.index.value_counts().to_dict() == {"val1": 18, "val2": 18, "val3": 6}
+    assert results_table.loc["val3"]["key_output"].isna().all()
+    assert results_table.loc["val2"].iloc[-1].tolist() == ["SCEN B", "DMO 3", "KO3", 0.4]
+
+
+def test_format_data_for_visual_unknown_key(test_outcomes):
+    """
+    This function tests _format_data_for_visual to return an empty dataframe for a key without outcomes.
+    :param test_outcomes: a Visualize class
+    """
+    result = test_outcomes._format_data_for_visual("val4")
+    assert result.empty
+    assert list(result.columns) == ["scenario", "decision_makers_option", "value"]
+
+
 @pytest.mark.parametrize(
     "drop_used, expected_result",
     [
@@ -216,6 +240,41 @@ def test_create_visual_errors(test_outcomes, visual_request, key, expected_error
     assert str(visualization_error.value) == f"Visualization Error: {expected_error}"
 
 
+def test_render_barcharts():
+    """
+    This function tests render_barcharts to return the same PNG images with and without worker processes, and to
+    reuse a single figure for all barcharts of the same size
+    """
+    visualizer = Visualize(INPUT_DICT_BEERWISER, OUTPUT_DICT_BEERWISER, 3 * 3 * 3)
+    requests = [("key_outputs", {"scenario": scenario}) for scenario in INPUT_DICT_BEERWISER["scenarios"]]
+    serial = [image.getvalue() for image in visualizer.render_barcharts(requests)]
+    parallel = [image.getvalue() for image in visualizer.render_barcharts(requests, workers=2)]
+    assert serial == parallel
+    assert all(image.startswith(b"\x89PNG") for image in serial)
+    assert len(visualizer.figure_pool.figures) == 1
+
+    with pytest.raises(VisualizationError) as visualization_error:
+        visualizer.render_barcharts([("key_outputs", {"colour": "red"})])
+    assert str(visualization_error.value) == "Visualization Error: Invalid argument 'colour'"
+
+
+def test_save_table_pages(test_outcomes, tmp_path, monkeypatch):
+    """
+    This function tests that a table with rows_per_page is written as an image for every page, drawn by one renderer.
+    :param test_outcomes: a Visualize class
+    """
+    monkeypatch.chdir(tmp_path)
+    (tmp_path / "images").mkdir()
+    test_outcomes.create_visual("table", "fixed_inputs", save=True, rows_per_page=10)
+    number_of_pages = -(-len(INPUT_DICT_BEERWISER["fixed_inputs"]) // 10)
+    images = sorted(path.name for path in (tmp_path / "images").iterdir())
+    assert images == sorted(f"tablefixed_inputs{number}.png" for number in range(number_of_pages))
+    renderer = test_outcomes.table_renderer
+    test_outcomes.create_visual("table", "fixed_inputs", save=True)
+    assert (tmp_path / "images" / "tablefixed_inputs.png").exists()
+    assert test_outcomes.table_renderer is renderer
+
+
 def test_find_all_predecessors():
     """
     This function tests find_all_predecessors to return the predecessors of a node
@@ -237,6 +296,30 @@ def test_find_all_predecessors():
     assert result == expected_result
 
 
+def test_get_generations():
+    """
+    This function tests get_generations to find the generation of every predecessor of a deep chain of dependencies
+    at once, and find_all_predecessors to select the predecessors of a number of generations from it
+    """
+    depth = 5000
+    input_dict = {}
+    input_dict["dependencies_order"] = list(range(depth))
+    input_dict["destination"] = [f"node_{i + 1}" for i in range(depth)]
+    input_dict["argument_1"] = [f"node_{i}" for i in range(depth)]
+    input_dict["argument_2"] = ["fixed"] * depth
+
+    dep = DependencyGraph(input_dict)
+    dep.create_inc_mat()
+    dep.create_network()
+
+    generations = dep.get_generations(f"node_{depth}")
+    assert generations["node_0"] == depth
+    assert generations["fixed"] == 1
+    assert dep.get_generations(f"node_{depth}") is generations
+    assert dep.find_all_predecessors(f"node_{depth}", 2) == ({"fixed", f"node_{depth - 1}", f"node_{depth - 2}"}, 2)
+    assert dep.find_all_predecessors(f"node_{depth}", None)[1] == depth
+
+
 def test_is_even():
     """
     This function tests is_even to return true for an input value of 4
@@ -274,6 +357,32 @@ def test_create_inc_mat():
     assert result.equals(expected_result) is True
 
 
+def test_create_network():
+    """
+    This function tests create_network to create the edges of the dependencies without the incidence matrix, in the
+    order of the columns and rows of the incidence matrix
+    """
+    input_dict = {}
+    input_dict["dependencies_order"] = [2, 0, 1]
+    input_dict["destination"] = ["goedenavond", "goedemorgen", "goedemiddag"]
+    input_dict["argument_1"] = ["goedemiddag", "hey", "doei"]
+    input_dict["argument_2"] = ["hey", "doei", np.nan]
+
+    dep = DependencyGraph(input_dict)
+    dep.create_inc_mat()
+    dep.create_network()
+    assert dep._inc_mat is None
+    assert list(dep.network.edges) == [
+        ("hey", "goedemorgen"),
+        ("hey", "goedenavond"),
+        ("doei", "goedemorgen"),
+        ("doei", "goedemiddag"),
+        ("goedemiddag", "goedenavond"),
+    ]
+    assert list(dep.network.predecessors("goedenavond")) == ["hey", "goedemiddag"]
+    assert dep.inc_mat.loc["goedemiddag"].tolist() == [0.0, 0.0, 1.0]
+
+
 def test_ko_filter():
     """
     This function tests ko_filter if the correct amount of generations is returned for a network
@@ -296,6 +405,33 @@ def test_ko_filter():
     assert result == 1
 
 
+def test_ko_filter_views():
+    """
+    This function tests ko_filter to select the graph of every key output from the same graph of all dependencies
+    """
+    input_dict = {}
+    input_dict["dependencies_order"] = [0, 1, 2]
+    input_dict["destination"] = ["goedemorgen", "goedemiddag", "goedenavond"]
+    input_dict["argument_1"] = ["hey", "goedemorgen", "goedemiddag"]
+    input_dict["argument_2"] = ["doei", "dag", "later"]
+
+    dep = DependencyGraph(input_dict)
+    dep.create_inc_mat()
+    dep.create_network()
+    graph = dep.graph
+
+    assert dep.ko_filter("goedenavond", max_gen=1) == 1
+    assert set(dep.network.nodes) == {"goedenavond", "goedemiddag", "later"}
+    assert dep.ko_filter("goedemiddag", max_gen=None) == 2
+    assert set(dep.network.nodes) == {"goedemiddag", "goedemorgen", "dag", "hey", "doei"}
+    assert dep.inc_mat.columns.tolist() == ["goedemorgen", "goedemiddag"]
+    assert dep.ko_filter("goedenavond", max_gen=1, max_nodes=4) == 2
+    assert set(dep.network.nodes) == {"goedenavond", "goedemiddag", "later", "goedemorgen"}
+    assert dep.ko_filter("goedenavond", max_gen=3, max_nodes=10) == 3
+    assert dep.network.number_of_nodes() == 7
+    assert dep.graph is graph
+
+
 def test_x_coords():
     """
     This function tests x_coords if the correct dictionary with coordinates is created for a certain network
@@ -388,3 +524,80 @@ def test_draw_graph(selected_ko, max_gen, save, expected_outcome):
     with pytest.raises(VisualizationError) as visualization_error:
         dep.draw_graph(selected_ko, max_gen, save)
     assert str(visualization_error.value) == f"Visualization Error: {expected_outcome}"
+
+
+@pytest.mark.parametrize("image_format, signature", [("png", b"\x89PNG"), ("svg", b"<?xml")])
+def test_draw_graph_static(tmp_path, image_format, signature):
+    """
+    This function tests save_static_image to save a static image of the graph without a browser
+    :param image_format: format of the image
+    :param signature: the first bytes of an image in this format
+    """
+    input_dict = {}
+    input_dict["dependencies_order"] = [0, 1, 2]
+    input_dict["destination"] = np.array(["goedemorgen", "goedemiddag", "goedenavond"])
+    input_dict["hierarchy"] = [1, 2, 3]
+    input_dict["key_outputs"] = ["goedemorgen", "goedemiddag", "goedenavond"]
+    input_dict["argument_1"] = ["hey", "goedemorgen", "goedemiddag"]
+    input_dict["argument_2"] = ["doei", "dag", "later"]
+
+    dep = DependencyGraph(input_dict)
+    location = dep.save_static_image("goedenavond", sc_dir=tmp_path, image_format=image_format)
+    assert location == f"{tmp_path}/keyoutput_goedenavond.{image_format}"
+    assert (tmp_path / f"keyoutput_goedenavond.{image_format}").read_bytes().startswith(signature)
+    assert dep.draw_graph("goedenavond", save=True, sc_dir=tmp_path, graph_dir=tmp_path).endswith(".png")
+    assert not list(tmp_path.glob("*.html"))
+
+    with pytest.raises(VisualizationError) as visualization_error:
+        dep.save_static_image("goedenavond", sc_dir=tmp_path, image_format="jpg")
+    assert str(visualization_error.value) == "Visualization Error: 'jpg' is not a valid option"
+
+
+def test_draw_graph_max_nodes(tmp_path):
+    """
+    This function tests draw_graph without max_gen to show the predecessors of the most generations with at most 30
+    nodes, filled up to 30 nodes with predecessors of the next generation
+    """
+    depth = 20
+    input_dict = {}
+    input_dict["dependencies_order"] = list(range(depth))
+    input_dict["destination"] = np.array([f"node_{i + 1}" for i in range(depth)])
+    input_dict["hierarchy"] = list(range(1, depth + 1))
+    input_dict["key_outputs"] = [f"node_{depth}"]
+    input_dict["argument_1"] = [f"node_{i}" for i in range(depth)]
+    input_dict["argument_2"] = [f"fixed_{i}" for i in range(depth)]
+
+    dep = DependencyGraph(input_dict)
+    dep.draw_graph(f"node_{depth}", return_html=True, graph_dir=tmp_path)
+    # 14 generations of 2 nodes and the key output are 29 nodes, the 30th node is of generation 15
+    generations = dep.get_generations(f"node_{depth}")
+    assert dep.network.number_of_nodes() == 30
+    assert sorted(generations[node] for node in dep.network).count(15) == 1
+
+
+def test_draw_level_of_detail(tmp_path):
+    """
+    This function tests draw_level_of_detail to show all predecessors of a deep chain of dependencies in a small page,
+    with the generations after the first 30 nodes collapsed into clusters
+    """
+    depth = 100
+    input_dict = {}
+    input_dict["dependencies_order"] = list(range(depth))
+    input_dict["destination"] = np.array([f"node_{i + 1}" for i in range(depth)])
+    input_dict["hierarchy"] = list(range(1, depth + 1))
+    input_dict["key_outputs"] = [f"node_{depth}"]
+    input_dict["argument_1"] = [f"node_{i}" for i in range(depth)]
+    input_dict["argument_2"] = [f"fixed_{i}" for i in range(depth)]
+
+    dep = DependencyGraph(input_dict)
+    html = dep.draw_level_of_detail(f"node_{depth}", return_html=True, graph_dir=tmp_path)
+    assert dep.network.number_of_nodes() == 2 * depth + 1
+    assert "var clusterTree" in html and "cdnjs" in html
+    assert "2 variables (generation 100)" in html
+    # 14 generations of 2 nodes and the key output are 29 nodes, generation 15 is the first cluster
+    assert "2 variables (generation 14)" not in html and "2 variables (generation 15)" in html
+    assert "2 variables (generation 5)" in dep.draw_level_of_detail(f"node_{depth}", return_html=True, max_nodes=9)
+
+    with pytest.raises(VisualizationError) as visualization_error:
+        dep.draw_level_of_detail(f"node_{depth}", max_nodes=0)
+    assert str(visualization_error.value) == "Visualization Error: '0' is not a valid option"